@@ -0,0 +1,143 @@
+"""
+This script is the single entry point of the activities: it runs the
+statistics, number conversion, word count, sales and booking commands,
+importing the module of a command only when it is invoked, so short
+jobs start with the minimum of imports (check it with
+`python -X importtime activities_cli.py ...`). Each activity script
+keeps its own file reading, timing and results file, since it is also
+run on its own from its folder, where no shared module can be imported.
+
+Usage: activities {stats,convert,wordcount,sales} ARGS ...
+       activities booking {import,archive,audit,analytics,migrate,shard,
+                           load} ARGS ...
+       activities {daemon,job} ARGS ...
+
+It utilizes the following modules:
+- `importlib` for importing the commands on demand.
+- `os` for locating the scripts of the activities.
+- `sys` for the command line arguments and the exit status.
+"""
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS = {
+    "compute_statistics": os.path.join(
+        ROOT, "work_4_2", "computeStatistics", "compute_statistics.py"),
+    "convert_numbers": os.path.join(
+        ROOT, "work_4_2", "convertNumbers", "convert_numbers.py"),
+    "word_count": os.path.join(ROOT, "work_4_2", "wordCount",
+                               "word_count.py"),
+    "compute_sales": os.path.join(ROOT, "work_5_2", "compute_sales.py")
+}
+SCRIPT_PACKAGES = {
+    "compute_statistics": "activities_statistics",
+    "convert_numbers": "activities_conversion",
+    "word_count": "activities_wordcount",
+    "compute_sales": "activities_sales"
+}
+BOOKING_FOLDER = os.path.join(ROOT, "work_6_2")
+BOOKING_COMMANDS = {
+    "import": "booking.importer",
+    "archive": "booking.reservations.archiving",
+    "audit": "booking.reservations.integrity",
+    "analytics": "booking.reservations.analytics",
+    "migrate": "booking.storage.migrate",
+    "shard": "booking.storage.sharding",
+    "load": "booking.service_load"
+}
+
+_modules = {}
+
+
+def script_folder(name):
+    """
+    script_folder: Returns the folder of an activity script: its folder
+    in the checkout, or the folder it was installed to by `pip install`.
+    """
+    folder = os.path.dirname(SCRIPTS[name])
+    if not os.path.isdir(folder):
+        package = importlib.import_module(SCRIPT_PACKAGES[name])
+        folder = list(package.__path__)[0]
+    return folder
+
+
+def load_script(name):
+    """
+    load_script: Returns the module of an activity script, importing it
+    from its folder the first time it is used in this process. Plain
+    imports are used instead of `importlib.util`, whose import alone
+    costs as much as the rest of the startup.
+    """
+    module = _modules.get(name)
+    if module is None:
+        folder = script_folder(name)
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        module = _modules[name] = importlib.import_module(name)
+    return module
+
+
+def run_script(name, args):
+    """
+    run_script: Runs the `main` function of an activity script with its
+    arguments, as if it were run directly.
+    """
+    try:
+        module = load_script(name)
+    except ModuleNotFoundError as e:
+        print(f"Error loading the {name} script: {e}. Run the command "
+              "from a checkout or reinstall it with `pip install .`")
+        return 1
+    sys.argv = [SCRIPTS[name], *args]
+    return module.main()
+
+
+def run_booking(args):
+    """
+    run_booking: Runs a booking command, importing the booking package
+    from the checkout if it is not installed.
+    """
+    if not args or args[0] not in BOOKING_COMMANDS:
+        print("Usage: activities booking "
+              f"{{{','.join(BOOKING_COMMANDS)}}} ARGS ...")
+        return 2
+    if BOOKING_FOLDER not in sys.path:
+        sys.path.append(BOOKING_FOLDER)
+    module = importlib.import_module(BOOKING_COMMANDS[args[0]])
+    return 1 if module.main(args[1:]) else 0
+
+
+def run_module(name, args):
+    """
+    run_module: Runs the `main(argv)` function of a module of the root
+    folder.
+    """
+    return importlib.import_module(name).main(args)
+
+
+COMMANDS = {
+    "stats": lambda args: run_script("compute_statistics", args),
+    "convert": lambda args: run_script("convert_numbers", args),
+    "wordcount": lambda args: run_script("word_count", args),
+    "sales": lambda args: run_script("compute_sales", args),
+    "booking": run_booking,
+    "daemon": lambda args: run_module("job_daemon", args),
+    "job": lambda args: run_module("job_client", args)
+}
+
+
+def main(argv=None):
+    """
+    main: Runs a command from the command line and returns its status.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(f"Usage: activities {{{','.join(COMMANDS)}}} ARGS ...")
+        return 0 if argv and argv[0] in ("-h", "--help") else 2
+    return COMMANDS[argv[0]](argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
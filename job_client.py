@@ -0,0 +1,89 @@
+"""
+This script sends a job to the daemon of `job_daemon.py` and prints its
+output, exiting with the status of the job, like running the script
+directly.
+
+Usage: python job_client.py [--socket PATH] SCRIPT [ARGS ...]
+       python job_client.py [--socket PATH] --shutdown
+
+It utilizes the following modules:
+- `json` for encoding and decoding the messages.
+- `os` for the working directory of the job.
+- `socket` for connecting to the daemon.
+- `sys` for the command line arguments and the exit status.
+
+It parses its arguments by hand and does not import the daemon, so it
+starts as fast as possible.
+"""
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = os.path.join(os.environ.get("TMPDIR") or "/tmp",
+                              f"activities-jobs-{os.getuid()}.sock")
+
+
+def send(request, socket_path=DEFAULT_SOCKET):
+    """
+    send: Sends a request to the daemon and returns its response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        with connection.makefile('rwb') as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def run(script, args, socket_path=DEFAULT_SOCKET, cwd=None):
+    """
+    run: Runs a script in the daemon from a directory (by default, the
+    current one) and returns its exit status and output.
+    """
+    response = send({"script": script, "args": list(args),
+                     "cwd": os.path.abspath(cwd or os.getcwd())},
+                    socket_path)
+    return response["status"], response["output"]
+
+
+def parse_arguments(argv):
+    """
+    parse_arguments: Returns the socket path, the script (None to stop
+    the daemon) and its arguments, or None if the arguments are invalid.
+    """
+    socket_path = DEFAULT_SOCKET
+    if len(argv) >= 2 and argv[0] == "--socket":
+        socket_path, argv = argv[1], argv[2:]
+    if argv == ["--shutdown"]:
+        return socket_path, None, []
+    if not argv or argv[0].startswith("-"):
+        return None
+    return socket_path, argv[0], argv[1:]
+
+
+def main(argv=None):
+    """
+    main: Runs a job from the command line and returns its status.
+    """
+    arguments = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if arguments is None:
+        print("Usage: python job_client.py [--socket PATH] SCRIPT [ARGS ...]"
+              "\n       python job_client.py [--socket PATH] --shutdown")
+        return 2
+    socket_path, script, args = arguments
+    try:
+        if script is None:
+            response = send({"command": "shutdown"}, socket_path)
+            status, output = response["status"], response["output"]
+        else:
+            status, output = run(script, args, socket_path)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        print(f"Error connecting to the daemon: {e}")
+        return 2
+    print(output, end="")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+This script runs a local daemon that executes the command line scripts
+of the activities (compute_statistics, convert_numbers, word_count and
+compute_sales) in a pool of warm worker processes, so each job skips
+the interpreter startup and the imports of a fresh process.
+
+Jobs are sent through a Unix socket as one JSON line with the `script`
+name, its `args` and the `cwd` to run it from, and are answered with
+one JSON line with the exit `status` and the printed `output`. Each job
+runs the `main` function of the script from the given directory, so it
+writes the same results and report files as running it directly.
+
+Schedulers written in Python can call `job_client.run` without starting
+a process at all; others can use `job_client.py` or write the JSON line
+to the socket themselves, e.g.:
+
+    echo '{"script": "word_count", "args": ["TC1.txt"], "cwd": "'$PWD'"}' \
+        | socat - UNIX-CONNECT:/tmp/activities-jobs-$(id -u).sock
+
+Usage: python job_daemon.py [--socket PATH] [--workers N]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `contextlib` for capturing the output of the scripts.
+- `io` for the captured output.
+- `json` for encoding and decoding the messages.
+- `multiprocessing` for the pool of worker processes.
+- `os` for handling paths and the working directory.
+- `socketserver` for serving the Unix socket.
+- `sys` for the arguments of the scripts.
+- `threading` for stopping the daemon from a request.
+- `traceback` for reporting the errors of the scripts.
+- `SCRIPTS` and `load_script` from `activities_cli` for loading the
+   scripts as modules.
+- `DEFAULT_SOCKET` from `job_client` for the default socket path.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import socketserver
+import sys
+import threading
+import traceback
+
+from activities_cli import SCRIPTS, load_script
+from job_client import DEFAULT_SOCKET
+
+
+def script_name(name):
+    """
+    script_name: Returns the name of a script given with or without its
+    directory and `.py` extension.
+    """
+    name = os.path.basename(name)
+    return name[:-3] if name.endswith(".py") else name
+
+
+def warm_up():
+    """
+    warm_up: Imports every script when a worker process starts.
+    """
+    for name in SCRIPTS:
+        load_script(name)
+
+
+def run_job(name, args, cwd):
+    """
+    run_job: Runs the `main` function of a script with its arguments from
+    a directory, and returns its exit status and printed output.
+    """
+    output = io.StringIO()
+    status = 0
+    with contextlib.redirect_stdout(output):
+        try:
+            module = load_script(name)
+            os.chdir(cwd)
+            sys.argv = [SCRIPTS[name], *args]
+            module.main()
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                status = e.code
+            elif e.code is not None:
+                print(e.code)
+                status = 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            print(traceback.format_exc(), end="")
+            status = 1
+    return {"status": status, "output": output.getvalue()}
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    """
+    Class to answer the jobs of a connection, one JSON line each.
+    """
+
+    def handle(self):
+        """
+        handle: Runs the jobs of the connection in the worker pool.
+        """
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self.server.dispatch(request)
+            except (ValueError, TypeError, KeyError) as e:
+                response = {"status": 2, "output": f"Invalid job: {e}\n"}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class JobServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Class to serve the jobs sent to a Unix socket with a pool of worker
+    processes. Each connection is served by a thread, so jobs of several
+    clients run in parallel.
+
+    Attributes:
+        pool (multiprocessing.pool.Pool): The warm worker processes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, pool):
+        """
+        __init__: Binds the socket, replacing a stale one.
+        """
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.pool = pool
+        super().__init__(socket_path, JobHandler)
+
+    def dispatch(self, request):
+        """
+        dispatch: Runs a job in the pool and returns its response, or
+        stops the daemon for a `shutdown` request.
+        """
+        if request.get("command") == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return {"status": 0, "output": "Daemon stopped\n"}
+        name = script_name(request["script"])
+        if name not in SCRIPTS:
+            return {"status": 2, "output": f"Unknown script: {name}\n"}
+        args = [str(arg) for arg in request.get("args", [])]
+        return self.pool.apply(run_job, (name, args, request["cwd"]))
+
+
+def serve(socket_path=DEFAULT_SOCKET, workers=None):
+    """
+    serve: Runs the daemon until a shutdown request is received.
+    """
+    context = multiprocessing.get_context(
+        "fork" if hasattr(os, "fork") else None)
+    with context.Pool(workers, initializer=warm_up) as pool:
+        with JobServer(socket_path, pool) as server:
+            print(f"Serving jobs on {socket_path}")
+            try:
+                server.serve_forever()
+            finally:
+                if os.path.exists(socket_path):
+                    os.remove(socket_path)
+
+
+def main(argv=None):
+    """
+    main: Starts the daemon from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the activity scripts in a warm worker pool.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help="the Unix socket to listen on")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes (default: one per CPU)")
+    arguments = parser.parse_args(argv)
+    try:
+        serve(arguments.socket, arguments.workers)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
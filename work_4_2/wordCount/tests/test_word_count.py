@@ -0,0 +1,101 @@
+"""
+This script contains the unit tests for the n-gram and co-occurrence
+modes of the word_count script.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `io` for reading text as a file.
+- `os` for handling file paths.
+- `sys` for importing the script from its folder.
+- `word_count` for testing the script.
+"""
+import unittest
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+import word_count  # pylint: disable=wrong-import-position
+
+
+def names(counts, ids):
+    """
+    names: Returns the counts keyed by the tokens of each key instead of
+    their ids.
+    """
+    tokens = list(ids)
+    return {tuple(tokens[i] for i in key): count
+            for key, count in counts.items()}
+
+
+class TestWordCount(unittest.TestCase):
+    """
+    Class to test the counting modes of word_count.
+    """
+
+    def tokens(self, text):
+        """
+        tokens: Returns the token stream of a text.
+        """
+        return word_count.read_tokens(io.StringIO(text))
+
+    def test_ngrams_cross_line_breaks(self):
+        """
+        test_ngrams_cross_line_breaks: Tests that n-grams run across line
+        breaks and empty lines.
+        """
+        ids = {}
+        counts = word_count.count_ngrams(self.tokens("a b\n\nc a\nb\n"),
+                                         2, ids)
+        self.assertEqual(names(counts, ids), {("a", "b"): 2, ("b", "c"): 1,
+                                              ("c", "a"): 1})
+        ids = {}
+        counts = word_count.count_ngrams(self.tokens("a b\nc\n"), 3, ids)
+        self.assertEqual(names(counts, ids), {("a", "b", "c"): 1})
+        self.assertEqual(word_count.count_ngrams(self.tokens("a b"), 3, {}),
+                         {})
+
+    def test_cooccurrence_pair_keys(self):
+        """
+        test_cooccurrence_pair_keys: Tests that a pair is counted under
+        one key whichever token comes first, within the window only.
+        """
+        ids = {}
+        counts = word_count.count_cooccurrences(
+            self.tokens("x y\ny x z\n"), 2, ids)
+        self.assertEqual(names(counts, ids), {
+            ("x", "y"): 4, ("y", "y"): 1, ("x", "z"): 1, ("y", "z"): 1})
+        self.assertTrue(all(first <= second for first, second in counts))
+
+    def test_top_counts(self):
+        """
+        test_top_counts: Tests that the most frequent keys come first,
+        the first seen first on ties.
+        """
+        counts = {"a": 1, "b": 3, "c": 3, "d": 2}
+        self.assertEqual(word_count.top_counts(counts),
+                         [("b", 3), ("c", 3), ("d", 2), ("a", 1)])
+        self.assertEqual(word_count.top_counts(counts, 2),
+                         [("b", 3), ("c", 3)])
+
+    def test_parse_arguments(self):
+        """
+        test_parse_arguments: Tests the accepted and rejected options.
+        """
+        self.assertEqual(word_count.parse_arguments(["f.txt"]),
+                         ("f.txt", "words", 1, None))
+        self.assertEqual(word_count.parse_arguments(
+            ["f.txt", "--ngram", "3", "--top", "5"]),
+            ("f.txt", "ngram", 3, 5))
+        self.assertEqual(word_count.parse_arguments(
+            ["f.txt", "--cooccurrence", "4"]),
+            ("f.txt", "cooccurrence", 4, None))
+        for argv in ([], ["f.txt", "--ngram"], ["f.txt", "--ngram", "0"],
+                     ["f.txt", "--ngram", "x"], ["f.txt", "--other", "1"],
+                     ["f.txt", "--ngram", "2", "--cooccurrence", "2"]):
+            self.assertIsNone(word_count.parse_arguments(argv), argv)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+This script contains the unit tests for the persistent word index.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for counting the reads of the files.
+- `os` for handling file paths and modification times.
+- `sys` for importing the script from its folder.
+- `tempfile` for creating temporary folders.
+- `word_index` for testing the index.
+"""
+import unittest
+import unittest.mock
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+import word_index  # pylint: disable=wrong-import-position
+
+
+class TestWordIndex(unittest.TestCase):
+    """
+    Class to test the incremental updates and queries of the index.
+    """
+
+    def setUp(self):
+        """
+        setUp: Writes two text files to a temporary folder.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.index_path = os.path.join(self.temp_dir.name, "index.sqlite3")
+        self.first = self.write("first.txt", "a b a\nc\n")
+        self.second = self.write("second.txt", "b\n")
+
+    def write(self, name, text):
+        """
+        write: Writes a text file and returns its path.
+        """
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return path
+
+    def update(self, with_lines=False):
+        """
+        update: Updates the index with both files, returning its counts
+        and the number of files hashed and scanned.
+        """
+        with unittest.mock.patch.object(
+                word_index, "file_digest",
+                wraps=word_index.file_digest) as digests, \
+                unittest.mock.patch.object(
+                    word_index, "scan_file",
+                    wraps=word_index.scan_file) as scans:
+            counts = word_index.update_index(
+                self.index_path, [self.first, self.second], with_lines)
+        return counts, digests.call_count, scans.call_count
+
+    def query(self, word):
+        """
+        query: Returns the (file name, count, lines) of a word.
+        """
+        rows = word_index.query_index(self.index_path, [word])[word]
+        return [(os.path.basename(path), count, lines)
+                for path, count, lines in rows]
+
+    def test_unchanged_files_are_not_read(self):
+        """
+        test_unchanged_files_are_not_read: Tests that files with the same
+        size and modification time are neither hashed nor scanned.
+        """
+        self.assertEqual(self.update(), ((2, 0, 0), 2, 2))
+        self.assertEqual(self.update(), ((0, 2, 0), 0, 0))
+        self.assertEqual(self.query("b"), [("first.txt", 1, None),
+                                           ("second.txt", 1, None)])
+
+    def test_touched_file_is_only_hashed(self):
+        """
+        test_touched_file_is_only_hashed: Tests that a file with a new
+        modification time but the same content is not counted again.
+        """
+        self.update()
+        stat = os.stat(self.first)
+        os.utime(self.first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.update(), ((0, 2, 0), 1, 0))
+        self.assertEqual(self.update(), ((0, 2, 0), 0, 0))
+
+    def test_changed_file_is_counted_again(self):
+        """
+        test_changed_file_is_counted_again: Tests that the counts of a
+        changed file replace the old ones.
+        """
+        self.update()
+        self.write("second.txt", "d d\n")
+        stat = os.stat(self.second)
+        os.utime(self.second, ns=(stat.st_atime_ns,
+                                  stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.update(), ((1, 1, 0), 1, 1))
+        self.assertEqual(self.query("b"), [("first.txt", 1, None)])
+        self.assertEqual(self.query("d"), [("second.txt", 2, None)])
+
+    def test_deleted_file_is_removed(self):
+        """
+        test_deleted_file_is_removed: Tests that indexed files that no
+        longer exist are dropped from the index.
+        """
+        word_index.update_index(self.index_path, [self.first, self.second])
+        os.remove(self.second)
+        self.assertEqual(word_index.update_index(self.index_path,
+                                                 [self.first]), (0, 1, 1))
+        self.assertEqual(self.query("b"), [("first.txt", 1, None)])
+
+    def test_deleted_file_still_listed(self):
+        """
+        test_deleted_file_still_listed: Tests that queries skip a deleted
+        file before the next update, which drops it even if it is still
+        listed among the files to index. A missing file that was never
+        indexed is still an error.
+        """
+        self.update()
+        os.remove(self.second)
+        self.assertEqual(self.query("b"), [("first.txt", 1, None)])
+        self.assertEqual(self.update(), ((0, 1, 1), 0, 0))
+        self.assertEqual(self.query("b"), [("first.txt", 1, None)])
+        with self.assertRaises(FileNotFoundError):
+            self.update()
+
+    def test_upgrade_to_lines(self):
+        """
+        test_upgrade_to_lines: Tests that files indexed without line
+        numbers are scanned again when they are requested, and kept
+        after that.
+        """
+        self.update()
+        self.assertEqual(self.update(with_lines=True), ((2, 0, 0), 2, 2))
+        self.assertEqual(self.query("a"), [("first.txt", 2, [1])])
+        self.assertEqual(self.query("c"), [("first.txt", 1, [2])])
+        self.assertEqual(self.update(), ((0, 2, 0), 0, 0))
+        self.assertEqual(self.query("c"), [("first.txt", 1, [2])])
+
+    def test_missing_index(self):
+        """
+        test_missing_index: Tests that querying a missing index fails
+        without creating it.
+        """
+        with self.assertRaises(FileNotFoundError):
+            word_index.query_index(self.index_path, ["a"])
+        self.assertFalse(os.path.exists(self.index_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,55 +1,176 @@
 """
-This script utilizes the `datetime`, `sys`, and `time` modules 
-to perform operations related to date and time, handle system-related 
-functionality, and measure execution time, respectively. 
+This script utilizes the `datetime`, `sys`, and `time` modules
+to perform operations related to date and time, handle system-related
+functionality, and measure execution time, respectively. It also uses
+`collections` for the sliding window of tokens, `heapq` for selecting
+the most frequent n-grams and `os` for naming the results file. The
+`--index` and `--query` commands of `word_index` are imported only when
+used.
 """
+from collections import deque
 from datetime import datetime
+import heapq
 import sys
 import time
 import os
 
+USAGE = ("Usage: python word_count.py fileWithData.txt "
+         "[--ngram N | --cooccurrence WINDOW] [--top K]\n"
+         "       python word_count.py --index INDEX FILE [FILE ...] "
+         "[--lines]\n"
+         "       python word_count.py --query INDEX WORD [WORD ...] "
+         "[--lines]")
+
+
+def read_tokens(file):
+    """
+    func: Yields the tokens of a file one by one, line by line, without
+    keeping the tokens of the whole file in memory.
+    """
+    for line in file:
+        yield from line.split()
+
+
+def count_words(tokens):
+    """
+    func: Counts the occurrences of each token.
+    """
+    occurrences = {}
+    for word in tokens:
+        occurrences[word] = occurrences.get(word, 0) + 1
+    return occurrences
+
+
+def count_ngrams(tokens, n, ids):
+    """
+    func: Counts the n-grams of a stream of tokens, which run across line
+    breaks, keeping only the last n tokens in a window. Tokens are
+    interned to integer ids in `ids`, so each n-gram is a tuple of small
+    integers instead of strings.
+    """
+    counts = {}
+    window = deque(maxlen=n)
+    for token in tokens:
+        window.append(ids.setdefault(token, len(ids)))
+        if len(window) == n:
+            key = tuple(window)
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def count_cooccurrences(tokens, window_size, ids):
+    """
+    func: Counts the pairs of tokens appearing within `window_size` tokens
+    of each other, in either order, keeping only the last tokens in a
+    window. Tokens are interned to integer ids in `ids`; each pair is
+    keyed by the id of the token seen first.
+    """
+    counts = {}
+    window = deque(maxlen=window_size)
+    for token in tokens:
+        token_id = ids.setdefault(token, len(ids))
+        for other in window:
+            key = (other, token_id) if other <= token_id else (token_id, other)
+            counts[key] = counts.get(key, 0) + 1
+        window.append(token_id)
+    return counts
+
+
+def top_counts(counts, top=None):
+    """
+    func: Returns the (key, count) pairs sorted by count, the first seen
+    first on ties, keeping only the `top` most frequent if given.
+    """
+    if top is None:
+        return sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    return heapq.nlargest(top, counts.items(), key=lambda x: x[1])
+
+
+def parse_arguments(argv):
+    """
+    func: Returns the file, the mode ("words", "ngram" or
+    "cooccurrence"), its size and the number of rows to report, or None
+    if the arguments are invalid.
+    """
+    if not argv:
+        return None
+    options = {}
+    rest = argv[1:]
+    while rest:
+        if len(rest) < 2 or rest[0] not in ("--ngram", "--cooccurrence",
+                                            "--top"):
+            return None
+        try:
+            options[rest[0]] = int(rest[1])
+        except ValueError:
+            return None
+        if options[rest[0]] < 1:
+            return None
+        rest = rest[2:]
+    if "--ngram" in options and "--cooccurrence" in options:
+        return None
+    mode, size = "words", 1
+    if "--ngram" in options:
+        mode, size = "ngram", options["--ngram"]
+    elif "--cooccurrence" in options:
+        mode, size = "cooccurrence", options["--cooccurrence"]
+    return argv[0], mode, size, options.get("--top")
+
+
 def main():
     """
-    Main function for computing statistics on data from a file.
+    Main function for counting the words, n-grams or co-occurrences of
+    the words of a file.
     """
     start_time = time.time()
-    if len(sys.argv) != 2:
-        print("Usage: python word_count.py fileWithData.txt")
+    if sys.argv[1:2] in (["--index"], ["--query"]):
+        import word_index  # pylint: disable=import-outside-toplevel
+        sys.exit(word_index.main(sys.argv[1:]))
+    arguments = parse_arguments(sys.argv[1:])
+    if arguments is None:
+        print(USAGE)
         sys.exit(1)
+    file_path, mode, size, top = arguments
 
-    occurrences = {}
+    ids = {}
     try:
-        with open(sys.argv[1], 'r', encoding='utf-8') as file:
-            for line in file:
-                words = line.split()
-                for word in words:
-                    occurrences[word] = occurrences.get(word, 0) + 1
-        sorted_occurrences = sorted(occurrences.items(), key=lambda x: x[1], reverse=True)
+        with open(file_path, 'r', encoding='utf-8') as file:
+            tokens = read_tokens(file)
+            if mode == "ngram":
+                occurrences = count_ngrams(tokens, size, ids)
+            elif mode == "cooccurrence":
+                occurrences = count_cooccurrences(tokens, size, ids)
+            else:
+                occurrences = count_words(tokens)
     except (FileNotFoundError, ValueError) as e:
         print(f"Error reading file: {e}")
-
-    if sorted_occurrences is None:
         sys.exit(1)
+    sorted_occurrences = top_counts(occurrences, top)
+    if ids:
+        names = list(ids)
+        sorted_occurrences = [(" ".join(names[i] for i in key), frequency)
+                              for key, frequency in sorted_occurrences]
 
     current_datetime = datetime.now()
     formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
 
     end_time = time.time()
-    file_name, _ = os.path.splitext(sys.argv[1])
+    file_name, _ = os.path.splitext(file_path)
+    suffix = {"words": "wordCount", "ngram": f"{size}gramCount",
+              "cooccurrence": f"cooccurrence{size}"}[mode]
 
     result_text = "---------------------------------------------------\n"
     result_text += (f"Execution: {formatted_datetime}\n")
-    result_text += (f"{sys.argv[1]}\n")
-    result_text += (f"Count: {len(sorted_occurrences)}\n")
+    result_text += (f"{file_path}\n")
+    result_text += (f"Count: {len(occurrences)}\n")
     result_text += ("Row labels\tCount\n")
     for word, frequency in sorted_occurrences:
         result_text += (f"{word}\t{frequency}\n")
     result_text += (f"Elapsed Time: {end_time - start_time} seconds\n")
 
-    with open(f"{file_name}_wordCountResults.txt", 'a', encoding='utf-8') as results_file:
+    with open(f"{file_name}_{suffix}Results.txt", 'a', encoding='utf-8') as results_file:
         results_file.write(result_text)
     print(result_text)
 
 if __name__ == "__main__":
     main()
- 
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""
+This script keeps an on-disk inverted index of the words of text files,
+so the counts of a few words across many files are looked up without
+reading the files again. Words are split like in `word_count.py`.
+
+The index is a SQLite database holding, for each file, its size,
+modification time and SHA-256 digest, and for each word and file, its
+count and optionally the numbers of the lines holding it. Building the
+index again only reads the files whose size or modification time
+changed, only recounts those whose content changed, and drops the
+files that were deleted; queries skip the deleted files until then.
+
+Usage: python word_count.py --index INDEX FILE [FILE ...] [--lines]
+       python word_count.py --query INDEX WORD [WORD ...] [--lines]
+
+It utilizes the `array` module for storing the line numbers compactly,
+`datetime` and `time` for the execution date and elapsed time, `hashlib`
+for the digests of the files, `os` for their metadata, `sqlite3` for
+the index and `sys` for the command line arguments.
+"""
+from array import array
+from datetime import datetime
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, "
+    "path TEXT UNIQUE NOT NULL, size INTEGER, mtime_ns INTEGER, "
+    "digest TEXT, has_lines INTEGER)",
+    "CREATE TABLE IF NOT EXISTS words (id INTEGER PRIMARY KEY, "
+    "word TEXT UNIQUE NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS counts (word_id INTEGER NOT NULL, "
+    "file_id INTEGER NOT NULL, count INTEGER NOT NULL, lines BLOB, "
+    "PRIMARY KEY (word_id, file_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS counts_by_file ON counts (file_id)"
+)
+USAGE = ("Usage: python word_count.py --index INDEX FILE [FILE ...] "
+         "[--lines]\n"
+         "       python word_count.py --query INDEX WORD [WORD ...] "
+         "[--lines]")
+
+
+def connect(index_path):
+    """
+    func: Opens the index, creating its tables if needed.
+    """
+    connection = sqlite3.connect(index_path)
+    for statement in SCHEMA:
+        connection.execute(statement)
+    return connection
+
+
+def file_digest(file_path):
+    """
+    func: Returns the SHA-256 digest of the content of a file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_file(file_path, with_lines=False):
+    """
+    func: Returns, for each word of a file, its count and, if requested,
+    the numbers of the lines holding it.
+    """
+    words = {}
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for number, line in enumerate(file, start=1):
+            for word in line.split():
+                entry = words.get(word)
+                if entry is None:
+                    entry = words[word] = [0, array("I") if with_lines
+                                           else None]
+                entry[0] += 1
+                if with_lines and (not entry[1] or entry[1][-1] != number):
+                    entry[1].append(number)
+    return words
+
+
+def _store_file(connection, vocabulary, file_id, words):
+    """
+    func: Replaces the counts of a file in the index.
+    """
+    connection.execute("DELETE FROM counts WHERE file_id = ?", (file_id,))
+    rows = []
+    for word, (count, lines) in words.items():
+        word_id = vocabulary.get(word)
+        if word_id is None:
+            word_id = vocabulary[word] = connection.execute(
+                "INSERT INTO words (word) VALUES (?)", (word,)).lastrowid
+        rows.append((word_id, file_id, count,
+                     None if lines is None else lines.tobytes()))
+    connection.executemany("INSERT INTO counts VALUES (?, ?, ?, ?)", rows)
+
+
+def update_index(index_path, file_paths, with_lines=False):
+    """
+    func: Adds files to the index or updates them if they changed, and
+    removes the indexed files that no longer exist, even if they are
+    still listed. Returns the number of files counted, unchanged and
+    removed.
+    """
+    counted = unchanged = 0
+    connection = connect(index_path)
+    try:
+        with connection:
+            indexed = {row[1]: row for row in connection.execute(
+                "SELECT id, path, size, mtime_ns, digest, has_lines "
+                "FROM files")}
+            vocabulary = {word: word_id for word_id, word
+                          in connection.execute("SELECT id, word FROM words")}
+            deleted = set()
+            for path, row in indexed.items():
+                if not os.path.exists(path):
+                    connection.execute("DELETE FROM counts WHERE file_id = ?",
+                                       (row[0],))
+                    connection.execute("DELETE FROM files WHERE id = ?",
+                                       (row[0],))
+                    deleted.add(path)
+            removed = len(deleted)
+            for file_path in dict.fromkeys(map(os.path.abspath, file_paths)):
+                if file_path in deleted:
+                    continue
+                stat = os.stat(file_path)
+                row = indexed.get(file_path)
+                lines_ok = row is not None and (row[5] or not with_lines)
+                if lines_ok and (row[2], row[3]) == (stat.st_size,
+                                                     stat.st_mtime_ns):
+                    unchanged += 1
+                    continue
+                digest = file_digest(file_path)
+                if lines_ok and row[4] == digest:
+                    connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? "
+                        "WHERE id = ?",
+                        (stat.st_size, stat.st_mtime_ns, row[0]))
+                    unchanged += 1
+                    continue
+                words = scan_file(file_path, with_lines)
+                if row is None:
+                    file_id = connection.execute(
+                        "INSERT INTO files (path) VALUES (?)",
+                        (file_path,)).lastrowid
+                else:
+                    file_id = row[0]
+                connection.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ?, digest = ?, "
+                    "has_lines = ? WHERE id = ?",
+                    (stat.st_size, stat.st_mtime_ns, digest,
+                     int(with_lines), file_id))
+                _store_file(connection, vocabulary, file_id, words)
+                counted += 1
+    finally:
+        connection.close()
+    return counted, unchanged, removed
+
+
+def query_index(index_path, words):
+    """
+    func: Returns, for each word, the (path, count, lines) of the indexed
+    files holding it, in path order; lines is None if the file was
+    indexed without line numbers. Files deleted since the index was
+    updated are skipped.
+    """
+    if not os.path.exists(index_path):
+        raise FileNotFoundError(f"No index found at {index_path}")
+    connection = sqlite3.connect(index_path)
+    try:
+        results = {}
+        exists = {}
+        for word in words:
+            rows = connection.execute(
+                "SELECT files.path, counts.count, counts.lines "
+                "FROM words JOIN counts ON counts.word_id = words.id "
+                "JOIN files ON files.id = counts.file_id "
+                "WHERE words.word = ? ORDER BY files.path", (word,))
+            results[word] = []
+            for path, count, lines in rows:
+                if path not in exists:
+                    exists[path] = os.path.exists(path)
+                if exists[path]:
+                    results[word].append(
+                        (path, count, None if lines is None
+                         else array("I", lines).tolist()))
+        return results
+    finally:
+        connection.close()
+
+
+def parse_arguments(argv):
+    """
+    func: Returns the command ("--index" or "--query"), the index path,
+    the files or words and whether line numbers were requested, or None
+    if the arguments are invalid.
+    """
+    with_lines = "--lines" in argv
+    argv = [arg for arg in argv if arg != "--lines"]
+    if len(argv) < 3 or argv[0] not in ("--index", "--query"):
+        return None
+    return argv[0], argv[1], argv[2:], with_lines
+
+
+def main(argv=None):
+    """
+    Main function for building or querying the index of the words of a
+    set of files. Returns the exit status.
+    """
+    start_time = time.time()
+    arguments = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if arguments is None:
+        print(USAGE)
+        return 1
+    command, index_path, values, with_lines = arguments
+
+    formatted_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    result_text = "---------------------------------------------------\n"
+    result_text += (f"Execution: {formatted_datetime}\n")
+    result_text += (f"{index_path}\n")
+    try:
+        if command == "--index":
+            counted, unchanged, removed = update_index(index_path, values,
+                                                       with_lines)
+            result_text += (f"Indexed: {counted}\n")
+            result_text += (f"Unchanged: {unchanged}\n")
+            result_text += (f"Removed: {removed}\n")
+        else:
+            results = query_index(index_path, values)
+            result_text += (f"Count: {len(results)}\n")
+            result_text += ("Row labels\tFile\tCount"
+                            + ("\tLines" if with_lines else "") + "\n")
+            for word, rows in results.items():
+                for path, count, lines in rows:
+                    result_text += f"{word}\t{path}\t{count}"
+                    if with_lines:
+                        result_text += "\t" + ("" if lines is None else
+                                               ",".join(map(str, lines)))
+                    result_text += "\n"
+                total = sum(count for _, count, _ in rows)
+                result_text += f"{word}\tTotal\t{total}\n"
+    except (OSError, UnicodeDecodeError, sqlite3.Error) as e:
+        print(f"Error using the index: {e}")
+        return 1
+    result_text += (f"Elapsed Time: {time.time() - start_time} seconds\n")
+    print(result_text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
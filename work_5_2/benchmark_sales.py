@@ -0,0 +1,330 @@
+"""
+This script utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `json` for encoding and decoding JSON data.
+- `os` for handling paths of the generated files.
+- `random` for generating synthetic catalogues and sales.
+- `sys` for handling system-related functionality.
+- `tempfile` for the default location of the generated files.
+- `time` for measuring execution time.
+- `tracemalloc` for measuring peak memory usage.
+- `compute_sales` for the sales totaling pipeline being measured.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import compute_sales
+
+DEFAULT_SCALES = [1_000, 10_000, 100_000]
+PRODUCT_TYPES = ["dairy", "fruit", "vegetable", "bakery", "meat", "drinks"]
+
+
+def generate_catalogue(file_path, titles, rng):
+    """
+    Writes a synthetic price catalogue with the same fields as the
+    catalogues under TC1-TC3.
+
+    Args:
+    file_path (str): The path of the catalogue file to be written.
+    titles (list): The titles of the products in the catalogue.
+    rng (random.Random): The random number generator.
+    """
+    products = [{
+        "title": title,
+        "type": rng.choice(PRODUCT_TYPES),
+        "description": f"Synthetic description of {title.lower()}",
+        "filename": f"{index}.jpg",
+        "height": rng.choice((450, 600)),
+        "width": rng.choice((299, 400)),
+        "price": round(rng.uniform(1, 100), 2),
+        "rating": rng.randint(1, 5)
+    } for index, title in enumerate(titles)]
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(products, file, indent=2)
+
+
+def generate_sales(file_path, records, titles, invalid_ratio, rng):
+    """
+    Writes a synthetic sales file. Half of the invalid rows miss a
+    required field and the other half reference an unknown product.
+
+    Args:
+    file_path (str): The path of the sales file to be written.
+    records (int): The number of sale records.
+    titles (list): The product titles available in the catalogue.
+    invalid_ratio (float): The fraction of invalid rows, from 0 to 1.
+    rng (random.Random): The random number generator.
+    """
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write("[\n")
+        for index in range(records):
+            sale = {
+                "SALE_ID": index // 5 + 1,
+                "SALE_Date": f"{rng.randint(1, 28):02d}/12/23",
+                "Product": rng.choice(titles),
+                "Quantity": rng.randint(1, 10)
+            }
+            if rng.random() < invalid_ratio:
+                if rng.random() < 0.5:
+                    del sale["Quantity"]
+                else:
+                    sale["Product"] = f"Unknown product {index}"
+            separator = ",\n" if index < records - 1 else "\n"
+            file.write(json.dumps(sale) + separator)
+        file.write("]\n")
+
+
+def prepare_files(workdir, records, catalogue_size, invalid_ratio, seed):
+    """
+    Generates the catalogue and sales files for one scenario, reusing
+    them if they were generated by a previous run.
+
+    Returns:
+    tuple: The paths of the catalogue and sales files.
+    """
+    catalogue_file = os.path.join(workdir,
+                                  f"catalogue_{catalogue_size}_{seed}.json")
+    sales_file = os.path.join(
+        workdir,
+        f"sales_{records}_{catalogue_size}_{invalid_ratio}_{seed}.json")
+    titles = [f"Product {index}" for index in range(catalogue_size)]
+    if not os.path.exists(catalogue_file):
+        generate_catalogue(catalogue_file, titles, random.Random(seed))
+    if not os.path.exists(sales_file):
+        rng = random.Random(f"{seed}-{records}-{invalid_ratio}")
+        generate_sales(sales_file, records, titles, invalid_ratio, rng)
+    return catalogue_file, sales_file
+
+
+def run_pipeline(catalogue_file, sales_file):
+    """
+    Runs the totaling pipeline of compute_sales once, timing each phase.
+
+    Returns:
+    tuple: The phase timings in seconds and the error report.
+    """
+    timings = {}
+    snapshot_file = catalogue_file + compute_sales.CACHE_SUFFIX
+    if os.path.exists(snapshot_file):
+        os.remove(snapshot_file)
+
+    start = time.perf_counter()
+    compute_sales.load_price_catalogue(catalogue_file)
+    timings["catalogue_cold"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    price_index = compute_sales.load_price_catalogue(catalogue_file)
+    timings["catalogue_warm"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sales_records = compute_sales.read_file(sales_file)
+    timings["sales_parse"] = time.perf_counter() - start
+
+    report = compute_sales.ErrorReport()
+    start = time.perf_counter()
+    compute_sales.compute_total(price_index, sales_records, report)
+    timings["totaling"] = time.perf_counter() - start
+    return timings, report
+
+
+def measure_peak_memory(catalogue_file, sales_file):
+    """
+    Runs the warm pipeline under tracemalloc. This is a separate run
+    because tracing allocations distorts the phase timings.
+
+    Returns:
+    int: The peak traced memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        price_index = compute_sales.load_price_catalogue(catalogue_file)
+        sales_records = compute_sales.read_file(sales_file)
+        compute_sales.compute_total(price_index, sales_records,
+                                    compute_sales.ErrorReport())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(workdir, records, catalogue_size, invalid_ratio, options):
+    """
+    Generates and measures one scenario, keeping the fastest of the
+    repeated runs for each phase.
+
+    Returns:
+    dict: The measurements of the scenario.
+    """
+    catalogue_file, sales_file = prepare_files(
+        workdir, records, catalogue_size, invalid_ratio, options.seed)
+    best = {}
+    report = None
+    for _ in range(options.repeat):
+        timings, report = run_pipeline(catalogue_file, sales_file)
+        for phase, seconds in timings.items():
+            best[phase] = min(seconds, best.get(phase, seconds))
+    pipeline_time = (best["catalogue_warm"] + best["sales_parse"]
+                     + best["totaling"])
+    result = {
+        "records": records,
+        "catalogue_size": catalogue_size,
+        "invalid_ratio": invalid_ratio,
+        "rejected": report.total(),
+        "phases": best,
+        "records_per_second": records / pipeline_time,
+        "totaling_records_per_second": records / best["totaling"],
+        "peak_memory_bytes": None
+    }
+    if not options.no_memory:
+        result["peak_memory_bytes"] = measure_peak_memory(catalogue_file,
+                                                          sales_file)
+    return result
+
+
+def format_result(result):
+    """
+    Formats the measurements of one scenario as a report line.
+    """
+    phases = result["phases"]
+    memory = result["peak_memory_bytes"]
+    memory_text = "n/a" if memory is None else f"{memory / 2**20:.1f} MiB"
+    return (f"{result['records']}\t{result['catalogue_size']}\t"
+            f"{result['invalid_ratio']}\t"
+            f"{result['records_per_second']:.0f}\t"
+            f"{phases['catalogue_cold']:.4f}\t"
+            f"{phases['catalogue_warm']:.4f}\t"
+            f"{phases['sales_parse']:.4f}\t"
+            f"{phases['totaling']:.4f}\t{memory_text}\n")
+
+
+def scenario_key(result):
+    """
+    Returns the key identifying a scenario across benchmark runs.
+    """
+    return (result["records"], result["catalogue_size"],
+            result["invalid_ratio"])
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compares the throughput of each scenario against a baseline run.
+
+    Returns:
+    list: A description of each scenario whose throughput dropped by
+    more than the tolerance.
+    """
+    previous = {scenario_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(scenario_key(result))
+        if old is None:
+            continue
+        ratio = result["records_per_second"] / old["records_per_second"]
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{scenario_key(result)}: {ratio:.0%} of baseline "
+                f"throughput ({result['records_per_second']:.0f} vs "
+                f"{old['records_per_second']:.0f} records/s)")
+    return regressions
+
+
+def positive_int(text):
+    """
+    Converts a command line argument to an integer greater than zero.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer: {text!r}")
+    return value
+
+
+def fraction(text):
+    """
+    Converts a command line argument to a number from 0 to 1.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        value = -1
+    if not 0 <= value <= 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a number from 0 to 1: {text!r}")
+    return value
+
+
+def parse_arguments(argv):
+    """
+    Parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the compute_sales totaling pipeline "
+                    "on synthetic data.")
+    parser.add_argument("--records", type=positive_int, nargs="+",
+                        default=DEFAULT_SCALES,
+                        help="sale record counts to benchmark "
+                             "(e.g. 1000 1000000 10000000)")
+    parser.add_argument("--catalogue-size", type=positive_int, nargs="+",
+                        default=[100], help="product counts")
+    parser.add_argument("--invalid-ratio", type=fraction, nargs="+",
+                        default=[0.0, 0.1], help="fractions of bad rows")
+    parser.add_argument("--repeat", type=positive_int, default=3,
+                        help="runs per scenario; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=os.path.join(
+        tempfile.gettempdir(), "sales_benchmark"),
+                        help="directory for the generated files")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the peak memory measurement")
+    parser.add_argument("--save", help="write the results as JSON")
+    parser.add_argument("--compare", help="baseline JSON results to "
+                                          "check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed throughput drop against the "
+                             "baseline (default 0.2)")
+    return parser.parse_args(argv)
+
+
+def main():
+    """
+    Runs every requested scenario and prints/writes the results.
+    """
+    options = parse_arguments(sys.argv[1:])
+    os.makedirs(options.workdir, exist_ok=True)
+
+    results = []
+    print("RECORDS\tCATALOGUE\tINVALID\tRECORDS/S\tCAT_COLD\tCAT_WARM\t"
+          "PARSE\tTOTALING\tPEAK_MEMORY")
+    for catalogue_size in options.catalogue_size:
+        for invalid_ratio in options.invalid_ratio:
+            for records in options.records:
+                result = run_scenario(options.workdir, records,
+                                      catalogue_size, invalid_ratio,
+                                      options)
+                results.append(result)
+                print(format_result(result), end="", flush=True)
+
+    if options.save:
+        with open(options.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=4)
+
+    if options.compare:
+        with open(options.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, options.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
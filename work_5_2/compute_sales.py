@@ -3,12 +3,96 @@ This script utilizes the following modules:
 - `datetime` for operations related to date and time.
 - `sys` for handling system-related functionality.
 - `time` for measuring execution time.
-- `json` for encoding and decoding JSON data.
+- `json` for encoding and decoding JSON data, including the compiled
+  price catalogue snapshot.
+- `hashlib` for fingerprinting the price catalogue file.
+- `os` for inspecting file metadata.
 """
 from datetime import datetime
 import sys
 import time
 import json
+import hashlib
+import os
+
+CACHE_SUFFIX = ".pricecache"
+CACHE_VERSION = 2
+SAMPLE_LIMIT = 5
+INVALID_RECORD = "invalid_record"
+UNKNOWN_PRODUCT = "unknown_product"
+
+
+class ErrorReport:
+    """
+    Collects the sale records rejected while computing the total, so that
+    they can be reported once at the end instead of one print per record.
+
+    Attributes:
+        sample_limit (int): The maximum number of rejected records kept
+        as a sample for each error category.
+        counts (dict): The number of rejected records per category.
+        samples (dict): A capped sample of rejected records per category.
+        rejects (list or None): Every rejected record paired with its
+        category, kept only when a rejects file is requested.
+    """
+
+    def __init__(self, sample_limit=SAMPLE_LIMIT, keep_rejects=False):
+        """
+        __init__: Initializes an empty error report.
+        """
+        self.sample_limit = sample_limit
+        self.counts = {}
+        self.samples = {}
+        self.rejects = [] if keep_rejects else None
+
+    def add(self, category, record):
+        """
+        add: Records a rejected sale record under an error category.
+        """
+        count = self.counts.get(category, 0)
+        self.counts[category] = count + 1
+        if count < self.sample_limit:
+            self.samples.setdefault(category, []).append(record)
+        if self.rejects is not None:
+            self.rejects.append((category, record))
+
+    def total(self):
+        """
+        total: Returns the number of rejected records.
+        """
+        return sum(self.counts.values())
+
+    def summary(self):
+        """
+        summary: Returns the rejected record counts per category.
+        """
+        text = f"Rejected records: {self.total()}\n"
+        for category, count in sorted(self.counts.items()):
+            text += f"  {category}: {count}\n"
+        return text
+
+    def sample_text(self):
+        """
+        sample_text: Returns the sample of rejected records per category.
+        """
+        text = ""
+        for category, records in sorted(self.samples.items()):
+            shown = len(records)
+            text += (f"Sample of {category} records "
+                     f"({shown} of {self.counts[category]}):\n")
+            for record in records:
+                text += f"  {record}\n"
+        return text
+
+    def write_rejects(self, file_path):
+        """
+        write_rejects: Writes every rejected record to a JSON Lines file
+        in a single write.
+        """
+        lines = [json.dumps({"error": category, "record": record})
+                 for category, record in self.rejects or ()]
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write("".join(line + "\n" for line in lines))
 
 
 def read_file(file_path):
@@ -36,34 +120,148 @@ def read_file(file_path):
         return None
 
 
-def main():
+def file_digest(file_path):
     """
-    Calculates the total cost of sales from JSON files, handles invalid data,
-    and prints/writes results.
+    Computes the SHA-256 digest of a file, reading it in chunks.
 
     Args:
-        None
+    file_path (str): The path to the file to be hashed.
 
     Returns:
-        None
+    str: The hexadecimal digest of the file contents.
     """
-    start_time = time.time()
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    if len(sys.argv) != 3:
-        print("Usage: python compute_sales.py "
-              "priceCatalogue.json salesRecord.json")
-        sys.exit(1)
 
-    current_datetime = datetime.now()
-    formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
+def build_price_index(price_catalogue):
+    """
+    Builds a lookup table from the products of a price catalogue.
 
-    price_catalogue = read_file(sys.argv[1])
-    sales_records = read_file(sys.argv[2])
+    Args:
+    price_catalogue (list): The products read from the catalogue file.
 
-    if not price_catalogue or not sales_records:
-        sys.exit(1)
+    Returns:
+    dict: A mapping of lowercase product title to price. When a title
+    appears more than once, the first price listed is kept.
+    """
+    prices = {}
+    for product in price_catalogue:
+        prices.setdefault(product["title"].lower(), product["price"])
+    return prices
+
+
+def read_snapshot(cache_path):
+    """
+    Reads a compiled price catalogue snapshot. The snapshot is plain
+    JSON, so a tampered file can only hold wrong prices and never runs
+    code.
+
+    Args:
+    cache_path (str): The path to the snapshot file.
+
+    Returns:
+    dict or None: The snapshot, or None if it is missing, unreadable
+    or was written by an incompatible version of this script.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or \
+            snapshot.get("version") != CACHE_VERSION or \
+            not isinstance(snapshot.get("prices"), dict):
+        return None
+    return snapshot
+
+
+def write_snapshot(cache_path, snapshot):
+    """
+    Writes a compiled price catalogue snapshot. Failing to write the
+    snapshot is not an error; the catalogue is simply parsed again on
+    the next run.
+
+    Args:
+    cache_path (str): The path to the snapshot file.
+    snapshot (dict): The snapshot to be written.
+    """
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(snapshot, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_price_catalogue(file_path):
+    """
+    Loads the price catalogue as a mapping of lowercase title to price.
+
+    The first load compiles the catalogue into a snapshot stored next to
+    it (`<file_path>.pricecache`) that keeps only titles and prices. The
+    snapshot is reused while the catalogue keeps the same modification
+    time and size; otherwise it is reused only if the SHA-256 digest of
+    the catalogue still matches, and rebuilt if not.
+
+    Args:
+    file_path (str): The path to the price catalogue JSON file.
 
+    Returns:
+    dict or None: The price lookup table, or None if the catalogue
+    cannot be read.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        print(f"Error reading files: {e}")
+        return None
+
+    cache_path = file_path + CACHE_SUFFIX
+    snapshot = read_snapshot(cache_path)
+    if snapshot and snapshot.get("mtime_ns") == stat.st_mtime_ns \
+            and snapshot.get("size") == stat.st_size:
+        return snapshot["prices"]
+
+    digest = file_digest(file_path)
+    if snapshot and snapshot.get("sha256") == digest:
+        prices = snapshot["prices"]
+    else:
+        price_catalogue = read_file(file_path)
+        if not price_catalogue:
+            return None
+        prices = build_price_index(price_catalogue)
+
+    write_snapshot(cache_path, {
+        "version": CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "prices": prices
+    })
+    return prices
+
+
+def compute_total(price_index, sales_records, report):
+    """
+    Computes the total cost of the valid sale records.
+
+    Args:
+    price_index (dict): The lookup table built by `build_price_index`.
+    sales_records (list): The sale records read from the sales file.
+    report (ErrorReport): The report collecting rejected records.
+
+    Returns:
+    float: The total cost of the sales.
+    """
     total_cost = 0
+    add_error = report.add
+    get_price = price_index.get
 
     for sale in sales_records:
         sale_id = sale.get("SALE_ID")
@@ -71,32 +269,88 @@ def main():
         product_name = sale.get("Product")
         quantity = sale.get("Quantity")
 
-        if not all((sale_id, sale_date, product_name, quantity)):
-            print(f"Invalid sale record: {sale}")
+        if not all((sale_id, sale_date, product_name, quantity)) or \
+                not isinstance(product_name, str):
+            add_error(INVALID_RECORD, sale)
             continue
 
-        product_price = 0
-        for product in price_catalogue:
-            if product["title"].lower() == product_name.lower():
-                product_price = product["price"]
-                break
+        product_price = get_price(product_name.lower(), 0)
 
         if not product_price:
-            print(f"Product '{product_name}' not found in price catalogue")
+            add_error(UNKNOWN_PRODUCT, sale)
             continue
 
         total_cost += product_price * quantity
 
+    return total_cost
+
+
+def parse_arguments(argv):
+    """
+    Parses the command line arguments.
+
+    Args:
+    argv (list): The command line arguments, without the script name.
+
+    Returns:
+    tuple or None: The catalogue path, sales path and rejects path
+    (None when not requested), or None if the arguments are invalid.
+    """
+    if len(argv) == 2:
+        return argv[0], argv[1], None
+    if len(argv) == 4 and argv[2] == "--rejects":
+        return argv[0], argv[1], argv[3]
+    return None
+
+
+def main():
+    """
+    Calculates the total cost of sales from JSON files, handles invalid data,
+    and prints/writes results.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    start_time = time.time()
+
+    arguments = parse_arguments(sys.argv[1:])
+    if arguments is None:
+        print("Usage: python compute_sales.py "
+              "priceCatalogue.json salesRecord.json "
+              "[--rejects rejects.jsonl]")
+        sys.exit(1)
+    catalogue_file, sales_file, rejects_file = arguments
+
+    current_datetime = datetime.now()
+    formatted_datetime = current_datetime.strftime("%Y-%m-%d %H:%M:%S")
+
+    price_index = load_price_catalogue(catalogue_file)
+    sales_records = read_file(sales_file)
+
+    if not price_index or not sales_records:
+        sys.exit(1)
+
+    report = ErrorReport(keep_rejects=rejects_file is not None)
+    total_cost = compute_total(price_index, sales_records, report)
+
+    if rejects_file:
+        report.write_rejects(rejects_file)
+
     result_text = "--------------------------------------------\n"
     result_text += (f"Execution: {formatted_datetime}\n")
-    result_text += (f"Product list file: {sys.argv[1]}\n"
-                    f"Sales file: {sys.argv[2]}\n")
+    result_text += (f"Product list file: {catalogue_file}\n"
+                    f"Sales file: {sales_file}\n")
     result_text += (f"Total: {total_cost:.2f}\n")
+    if report.counts:
+        result_text += report.summary()
     result_text += (f"Elapsed Time: {time.time() - start_time} seconds\n")
 
     with open("SalesResults.txt", 'a', encoding='utf-8') as results_file:
         results_file.write(result_text)
-    print(result_text)
+    print(report.sample_text() + result_text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+"""
+This script contains the unit tests for the benchmark_sales script.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard error.
+- `io` for handling input/output operations.
+- `os` for handling file paths.
+- `sys` for importing the script from its folder.
+- `benchmark_sales` for testing the script.
+"""
+import unittest
+import unittest.mock
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+import benchmark_sales  # pylint: disable=wrong-import-position
+
+
+class TestParseArguments(unittest.TestCase):
+    """
+    Class to test the command line arguments of the benchmark.
+    """
+
+    def test_valid_arguments(self):
+        """
+        test_valid_arguments: Tests that valid counts and ratios are
+        parsed.
+        """
+        options = benchmark_sales.parse_arguments(
+            ["--records", "1", "10", "--catalogue-size", "5",
+             "--repeat", "1", "--invalid-ratio", "0", "1"])
+        self.assertEqual(options.records, [1, 10])
+        self.assertEqual(options.catalogue_size, [5])
+        self.assertEqual(options.repeat, 1)
+        self.assertEqual(options.invalid_ratio, [0.0, 1.0])
+
+    def test_invalid_arguments(self):
+        """
+        test_invalid_arguments: Tests that counts below one, non-numbers
+        and ratios outside 0 to 1 are usage errors instead of crashes.
+        """
+        for argv in (["--catalogue-size", "0"], ["--repeat", "0"],
+                     ["--records", "0"], ["--records", "-5"],
+                     ["--repeat", "two"], ["--invalid-ratio", "1.5"]):
+            with self.subTest(argv=argv), \
+                    unittest.mock.patch('sys.stderr', new=io.StringIO()) \
+                    as error, self.assertRaises(SystemExit) as context:
+                benchmark_sales.parse_arguments(argv)
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn("must be", error.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
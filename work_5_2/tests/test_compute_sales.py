@@ -0,0 +1,176 @@
+"""
+This script contains the unit tests for the compute_sales script.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for counting the reads of the catalogue.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `sys` for importing the script from its folder.
+- `tempfile` for creating temporary data folders.
+- `compute_sales` for testing the script.
+"""
+import unittest
+import unittest.mock
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+import compute_sales  # pylint: disable=wrong-import-position
+
+CATALOGUE = [{"title": "Apple", "price": 2.5},
+             {"title": "Pear", "price": 1},
+             {"title": "apple", "price": 9}]
+
+
+class TestPriceSnapshot(unittest.TestCase):
+    """
+    Class to test the compiled price catalogue snapshot.
+    """
+
+    def setUp(self):
+        """
+        setUp: Writes a price catalogue to a temporary folder.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.catalogue_file = os.path.join(self.temp_dir.name,
+                                           "catalogue.json")
+        with open(self.catalogue_file, 'w', encoding='utf-8') as file:
+            json.dump(CATALOGUE, file)
+        self.cache_path = self.catalogue_file + compute_sales.CACHE_SUFFIX
+
+    def load(self):
+        """
+        load: Loads the catalogue, returning its prices and whether the
+        catalogue file was parsed again.
+        """
+        with unittest.mock.patch.object(
+                compute_sales, "read_file",
+                wraps=compute_sales.read_file) as read_file:
+            prices = compute_sales.load_price_catalogue(self.catalogue_file)
+        return prices, read_file.called
+
+    def test_snapshot_is_reused(self):
+        """
+        test_snapshot_is_reused: Tests that the second load uses the
+        snapshot, which is plain JSON, and keeps the first price of a
+        repeated title.
+        """
+        self.assertEqual(self.load(), ({"apple": 2.5, "pear": 1}, True))
+        with open(self.cache_path, 'r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file)["prices"],
+                             {"apple": 2.5, "pear": 1})
+        self.assertEqual(self.load(), ({"apple": 2.5, "pear": 1}, False))
+
+    def test_touched_catalogue_reuses_digest(self):
+        """
+        test_touched_catalogue_reuses_digest: Tests that a catalogue with
+        a new modification time but the same content is not parsed again.
+        """
+        self.load()
+        stat = os.stat(self.catalogue_file)
+        os.utime(self.catalogue_file,
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.load(), ({"apple": 2.5, "pear": 1}, False))
+
+    def test_changed_catalogue_is_parsed(self):
+        """
+        test_changed_catalogue_is_parsed: Tests that a changed catalogue
+        rebuilds the snapshot.
+        """
+        self.load()
+        with open(self.catalogue_file, 'w', encoding='utf-8') as file:
+            json.dump([{"title": "Plum", "price": 3}], file)
+        self.assertEqual(self.load(), ({"plum": 3}, True))
+
+    def test_invalid_snapshot_is_ignored(self):
+        """
+        test_invalid_snapshot_is_ignored: Tests that an unreadable or
+        foreign snapshot, such as an old pickled one, is rebuilt instead
+        of being loaded.
+        """
+        for content in (b"\x80\x04\x95garbage", b"[1, 2]",
+                        b'{"version": 2, "prices": []}'):
+            with open(self.cache_path, 'wb') as file:
+                file.write(content)
+            self.assertEqual(self.load(), ({"apple": 2.5, "pear": 1}, True))
+
+
+class TestErrorReport(unittest.TestCase):
+    """
+    Class to test the report of the rejected sale records.
+    """
+
+    def test_samples_are_capped(self):
+        """
+        test_samples_are_capped: Tests that every rejected record is
+        counted but only the first ones of each category are sampled.
+        """
+        report = compute_sales.ErrorReport(sample_limit=2)
+        for number in range(5):
+            report.add(compute_sales.UNKNOWN_PRODUCT, {"SALE_ID": number})
+        report.add(compute_sales.INVALID_RECORD, {})
+        self.assertEqual(report.total(), 6)
+        self.assertEqual(report.samples[compute_sales.UNKNOWN_PRODUCT],
+                         [{"SALE_ID": 0}, {"SALE_ID": 1}])
+        self.assertIsNone(report.rejects)
+        self.assertEqual(report.summary(), "Rejected records: 6\n"
+                                           "  invalid_record: 1\n"
+                                           "  unknown_product: 5\n")
+        self.assertIn("Sample of unknown_product records (2 of 5):",
+                      report.sample_text())
+
+    def test_compute_total(self):
+        """
+        test_compute_total: Tests that invalid records and unknown
+        products are reported instead of added to the total.
+        """
+        report = compute_sales.ErrorReport()
+        sales = [{"SALE_ID": 1, "SALE_Date": "d", "Product": "APPLE",
+                  "Quantity": 2},
+                 {"SALE_ID": 2, "SALE_Date": "d", "Product": "Plum",
+                  "Quantity": 1},
+                 {"SALE_ID": 3, "SALE_Date": "d", "Product": 7,
+                  "Quantity": 1},
+                 {"SALE_ID": 4, "Product": "Pear", "Quantity": 1}]
+        total = compute_sales.compute_total({"apple": 2.5, "pear": 1},
+                                            sales, report)
+        self.assertEqual(total, 5)
+        self.assertEqual(report.counts, {compute_sales.UNKNOWN_PRODUCT: 1,
+                                         compute_sales.INVALID_RECORD: 2})
+
+    def test_rejects_file(self):
+        """
+        test_rejects_file: Tests that every rejected record is written to
+        the rejects file as JSON Lines, beyond the sample limit.
+        """
+        report = compute_sales.ErrorReport(sample_limit=1, keep_rejects=True)
+        report.add(compute_sales.INVALID_RECORD, {"SALE_ID": 1})
+        report.add(compute_sales.INVALID_RECORD, {"SALE_ID": 2})
+        with tempfile.TemporaryDirectory() as folder:
+            rejects_file = os.path.join(folder, "rejects.jsonl")
+            report.write_rejects(rejects_file)
+            with open(rejects_file, 'r', encoding='utf-8') as file:
+                lines = [json.loads(line) for line in file]
+        self.assertEqual(lines, [
+            {"error": "invalid_record", "record": {"SALE_ID": 1}},
+            {"error": "invalid_record", "record": {"SALE_ID": 2}}])
+
+    def test_parse_arguments(self):
+        """
+        test_parse_arguments: Tests the optional rejects file argument.
+        """
+        self.assertEqual(compute_sales.parse_arguments(["a", "b"]),
+                         ("a", "b", None))
+        self.assertEqual(compute_sales.parse_arguments(
+            ["a", "b", "--rejects", "r"]), ("a", "b", "r"))
+        self.assertIsNone(compute_sales.parse_arguments(
+            ["a", "b", "--other", "r"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,392 @@
+"""
+This script measures the booking package as its data grows: it seeds
+customers, hotels and reservations, replays a mix of calls to the
+`Customer`, `Hotel` and `Reservation` classmethods and reports the
+throughput, latency percentiles and peak memory of each storage engine.
+
+Usage: python benchmark_booking.py [--sizes N ...] [--engines NAME ...]
+                                   [--operations N] [--mix MIX]
+                                   [--processes N ...] [--save FILE]
+                                   [--compare FILE]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `contextlib` for silencing the output of the replayed calls.
+- `io` for the discarded output.
+- `json` for saving and loading the results.
+- `multiprocessing` for replaying the calls from several processes.
+- `os` for interacting with the operating system.
+- `random` for generating the data and the calls.
+- `shutil` for removing the data folders.
+- `tempfile` for the default location of the data folders.
+- `time` for measuring the elapsed time.
+- `tracemalloc` for measuring the peak memory.
+- `Customer`, `Hotel` and `Reservation` for the calls being measured.
+- `settings` and `repository` for selecting the data folder and the
+   storage engine.
+- `clear_memory` for emptying the in-memory engine between runs.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from booking import settings
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from booking.storage import repository
+from booking.storage.memory_storage import clear_memory
+
+DEFAULT_SIZES = [1_000]
+DEFAULT_MIX = "create=20,display=40,update=20,cancel=10,delete=10"
+OPERATIONS = ("create", "display", "update", "cancel", "delete")
+CUSTOMERS_PER_HOTEL = 100
+
+
+def parse_mix(text):
+    """
+    parse_mix: Returns the weight of each operation of a mix written as
+    "create=20,display=40,...". Operations left out have no weight.
+    """
+    mix = dict.fromkeys(OPERATIONS, 0)
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in mix:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name] = int(weight)
+    if sum(mix.values()) <= 0:
+        raise ValueError("The mix needs some operation with weight")
+    return mix
+
+
+def seed_data(size, rng):
+    """
+    seed_data: Stores `size` customers and reservations and one hotel
+    for every CUSTOMERS_PER_HOTEL customers, written directly through the
+    repositories with one write per collection. Returns the customer ids,
+    hotel names and reservation codes.
+    """
+    customer_ids = [f"customer-{number}" for number in range(size)]
+    hotel_names = [f"hotel-{number}"
+                   for number in range(max(size // CUSTOMERS_PER_HOTEL, 1))]
+    Customer.repository().insert_many(
+        [{"customer_id": customer_id, "name": f"Name {number}",
+          "phone_number": f"555-{number:07d}"}
+         for number, customer_id in enumerate(customer_ids)])
+    Hotel.repository().insert_many(
+        [{"name": name, "num_rooms": size, "ubication": "Benchmark"}
+         for name in hotel_names])
+    reservations = [Reservation(rng.choice(customer_ids),
+                                rng.choice(hotel_names), f"room-{number}")
+                    for number in range(size)]
+    Reservation.repository().insert_many(
+        [reservation.to_dict() for reservation in reservations])
+    return (customer_ids, hotel_names,
+            [reservation.reservation_code for reservation in reservations])
+
+
+class Workload:
+    """
+    Class to generate the calls replayed against the booking classes.
+
+    Attributes:
+        rng (random.Random): The random number generator.
+        prefix (str): The prefix of the ids created by this workload, so
+        several processes do not create the same ones.
+        customer_ids (list): The ids of the existing customers.
+        hotel_names (list): The names of the existing hotels.
+        reservation_codes (list): The codes of the existing reservations.
+    """
+
+    def __init__(self, data, rng, prefix="w0"):
+        """
+        __init__: Initializes a workload over the seeded data.
+        """
+        self.rng = rng
+        self.prefix = prefix
+        self.customer_ids = list(data[0])
+        self.hotel_names = list(data[1])
+        self.reservation_codes = list(data[2])
+        self._created = 0
+
+    def _new_id(self, kind):
+        """
+        _new_id: Returns an id not used before by this workload.
+        """
+        self._created += 1
+        return f"{self.prefix}-{kind}-{self._created}"
+
+    def _pop(self, keys):
+        """
+        _pop: Removes and returns a random key, or None if there is none.
+        """
+        if not keys:
+            return None
+        position = self.rng.randrange(len(keys))
+        keys[position], keys[-1] = keys[-1], keys[position]
+        return keys.pop()
+
+    def call(self, operation):
+        """
+        call: Returns a call of an operation, with no arguments, for one
+        of the classes picked at random.
+        """
+        rng = self.rng
+        customer_id = rng.choice(self.customer_ids)
+        hotel_name = rng.choice(self.hotel_names)
+        if operation == "create":
+            kind = rng.randrange(3)
+            if kind == 0:
+                return lambda: Customer.create_customer(
+                    self._new_id("customer"), "Name", "555")
+            if kind == 1:
+                name = self._new_id("hotel")
+                self.hotel_names.append(name)
+                return lambda: Hotel.create_hotel(name, 100, "Benchmark")
+            return lambda: self._create_reservation(customer_id, hotel_name)
+        if operation == "display":
+            kind = rng.randrange(3)
+            if kind == 0:
+                return lambda: Customer.display_customer(customer_id)
+            if kind == 1:
+                return lambda: Hotel.display_hotel(hotel_name)
+            code = rng.choice(self.reservation_codes or [""])
+            return lambda: Reservation.find_reservation(code)
+        if operation == "update":
+            if rng.randrange(2):
+                return lambda: Customer.update_customer(customer_id,
+                                                        new_name="Updated")
+            return lambda: Hotel.update_hotel(hotel_name,
+                                              new_ubication="Updated")
+        if operation == "cancel":
+            code = rng.choice(self.reservation_codes or [""])
+            return lambda: Reservation.cancel_reservation(code)
+        code = self._pop(self.reservation_codes)
+        return lambda: Reservation.delete_reservation(code)
+
+    def _create_reservation(self, customer_id, hotel_name):
+        """
+        _create_reservation: Creates a reservation of a new room and
+        remembers its code.
+        """
+        reservation = Reservation.create_reservation(
+            customer_id, hotel_name, self._new_id("room"))
+        if reservation is not None:
+            self.reservation_codes.append(reservation.reservation_code)
+
+    def operations(self, mix, count):
+        """
+        operations: Returns `count` operation names drawn from the mix.
+        """
+        names = [name for name in OPERATIONS if mix[name]]
+        return self.rng.choices(names, [mix[name] for name in names],
+                                k=count)
+
+
+def replay(workload, operations, measure_memory):
+    """
+    replay: Runs the calls of the operations one by one, silencing their
+    output. Returns the latency of each call in seconds and the peak
+    memory traced in bytes (0 if not measured).
+    """
+    latencies = []
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for operation in operations:
+                call = workload.call(operation)
+                start = time.perf_counter()
+                call()
+                latencies.append(time.perf_counter() - start)
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else 0
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+    return latencies, peak
+
+
+def run_worker(arguments):
+    """
+    run_worker: Replays a share of the operations in a worker process.
+    """
+    data, mix, count, seed, index, measure_memory = arguments
+    rng = random.Random(seed * 1000 + index)
+    workload = Workload(data, rng, prefix=f"w{index}")
+    return replay(workload, workload.operations(mix, count), measure_memory)
+
+
+def percentile(values, percent):
+    """
+    percentile: Returns the nearest-rank percentile of sorted values.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1,
+                      round(percent / 100 * (len(values) - 1)))]
+
+
+def run_scenario(engine, size, processes, options):
+    """
+    run_scenario: Seeds a new data folder with an engine and replays the
+    operations from one or more processes. Returns the measurements.
+    """
+    folder = tempfile.mkdtemp(prefix=f"{engine}-{size}-",
+                              dir=options.workdir)
+    settings.set_data_folder(folder)
+    repository.configure(engine)
+    clear_memory()
+    try:
+        rng = random.Random(options.seed)
+        start = time.perf_counter()
+        data = seed_data(size, rng)
+        seed_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        if processes <= 1:
+            workload = Workload(data, rng)
+            latencies, peak = replay(
+                workload, workload.operations(options.mix,
+                                              options.operations),
+                not options.no_memory)
+        else:
+            shares = [options.operations // processes
+                      + (index < options.operations % processes)
+                      for index in range(processes)]
+            context = multiprocessing.get_context(
+                "fork" if hasattr(os, "fork") else None)
+            with context.Pool(processes) as pool:
+                outcomes = pool.map(run_worker, [
+                    (data, options.mix, share, options.seed, index,
+                     not options.no_memory)
+                    for index, share in enumerate(shares)])
+            latencies = [latency for outcome in outcomes
+                         for latency in outcome[0]]
+            peak = max(outcome[1] for outcome in outcomes)
+        elapsed = time.perf_counter() - start
+    finally:
+        settings.set_data_folder(None)
+        repository.configure()
+        clear_memory()
+        if not options.keep:
+            shutil.rmtree(folder, ignore_errors=True)
+    latencies.sort()
+    return {
+        "engine": engine,
+        "size": size,
+        "processes": max(processes, 1),
+        "operations": len(latencies),
+        "seed_seconds": round(seed_seconds, 4),
+        "seconds": round(elapsed, 4),
+        "ops_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "peak_memory_mb": (None if options.no_memory
+                           else round(peak / 2 ** 20, 2))
+    }
+
+
+def format_result(result):
+    """
+    format_result: Returns a line describing a result.
+    """
+    memory = ("" if result["peak_memory_mb"] is None
+              else f", peak {result['peak_memory_mb']:.2f} MB")
+    return (f"{result['engine']:>6} size={result['size']:<8} "
+            f"processes={result['processes']}: "
+            f"{result['ops_per_second']:>9.1f} ops/s, "
+            f"p50 {result['p50_ms']:.3f} ms, p99 {result['p99_ms']:.3f} ms"
+            f"{memory} (seeded in {result['seed_seconds']:.2f} s)")
+
+
+def scenario_key(result):
+    """
+    scenario_key: Returns the engine, size and processes of a result.
+    """
+    return (result["engine"], result["size"], result["processes"])
+
+
+def compare(results, baseline):
+    """
+    compare: Returns a line per scenario also found in the baseline,
+    with the change of its throughput.
+    """
+    previous = {scenario_key(result): result
+                for result in baseline["results"]}
+    lines = []
+    for result in results:
+        before = previous.get(scenario_key(result))
+        if before is None or not before["ops_per_second"]:
+            continue
+        change = result["ops_per_second"] / before["ops_per_second"] - 1
+        lines.append(f"{result['engine']} size={result['size']} "
+                     f"processes={result['processes']}: {change:+.1%} "
+                     "ops/s")
+    return lines
+
+
+def parse_arguments(argv=None):
+    """
+    parse_arguments: Parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the booking classes with a call mix.")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=DEFAULT_SIZES,
+                        help="customers and reservations seeded (e.g. "
+                             "1000 10000 100000 1000000)")
+    parser.add_argument("--engines", nargs="+", default=["json"],
+                        choices=sorted(repository.STORAGE_ENGINES))
+    parser.add_argument("--operations", type=int, default=1000,
+                        help="calls replayed per scenario")
+    parser.add_argument("--mix", type=parse_mix,
+                        default=parse_mix(DEFAULT_MIX),
+                        help=f"operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1],
+                        help="processes replaying the calls")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=tempfile.gettempdir(),
+                        help="folder for the seeded data folders")
+    parser.add_argument("--keep", action="store_true",
+                        help="keep the seeded data folders")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the peak memory measurement, which "
+                             "slows the calls down")
+    parser.add_argument("--save", help="write the results as JSON")
+    parser.add_argument("--compare", help="JSON results to compare with")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    main: Runs every scenario and reports the results.
+    """
+    options = parse_arguments(argv)
+    results = []
+    for engine in options.engines:
+        for size in options.sizes:
+            for processes in options.processes:
+                result = run_scenario(engine, size, processes, options)
+                print(format_result(result))
+                results.append(result)
+    if options.compare:
+        with open(options.compare, 'r', encoding='utf-8') as file:
+            for line in compare(results, json.load(file)):
+                print(line)
+    if options.save:
+        report = {"operations": options.operations, "mix": options.mix,
+                  "seed": options.seed, "results": results}
+        with open(options.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 """
 This script utilizes the following modules:
-- `json` for encoding and decoding JSON data.
-- `os` for interacting with the operating system.
+- `get_repository` for the shared in-memory index of the customers.
+- `DataPath` for locating the customers file in the data folder.
 """
-import json
-import os
+from booking.settings import DataPath
+from booking.storage.repository import get_repository
 
 
 class Customer:
@@ -12,14 +12,14 @@ class Customer:
     Class to represent a customer.
 
     Attributes:
-        data_folder (str): The path of the data folder.
+        data_folder (str): The path of the configured data folder.
         customers_file (str): The path of the JSON file
         that stores the customers.
     """
 
-    data_folder = os.path.abspath(os.path.join
-                                  (os.path.dirname(__file__), "../data"))
-    customers_file = os.path.join(data_folder, "customers.json")
+    data_folder = DataPath()
+    customers_file = DataPath("customers.json")
+    __slots__ = ("customer_id", "name", "phone_number")
 
     def __init__(self, customer_id, name, phone_number):
         """
@@ -39,26 +39,45 @@ class Customer:
             "phone_number": self.phone_number
         }
 
+    @classmethod
+    def from_dict(cls, record):
+        """
+        from_dict: Creates a customer object from a dictionary.
+        """
+        return cls(record.get("customer_id"), record.get("name"),
+                   record.get("phone_number"))
+
+    @classmethod
+    def repository(cls):
+        """
+        repository: Returns the shared repository of the customers file.
+        """
+        return get_repository(cls.customers_file, "customer_id")
+
     @classmethod
     def load_customers(cls):
         """
         load_customers: Loads the customers from the JSON file.
         """
-        if not os.path.exists(cls.customers_file):
-            return []
-        with open(cls.customers_file, 'r', encoding="utf-8") as file:
-            return json.load(file)
+        return cls.repository().records()
 
     def save_to_json(self):
         """
         save_to_json: Saves the customer to the JSON file.
         """
-        if not os.path.exists(self.data_folder):
-            os.makedirs(self.data_folder)
-        customers = self.load_customers()
-        customers.append(self.to_dict())
-        with open(self.customers_file, 'w', encoding="utf-8") as file:
-            json.dump(customers, file, indent=4)
+        self.repository().insert(self.to_dict())
+
+    @staticmethod
+    def validate(customer_id, name, phone_number):
+        """
+        validate: Raises a ValueError if the customer fields are invalid.
+        """
+        if not isinstance(customer_id, str):
+            raise ValueError("customer_id must be a string")
+        if not isinstance(name, str):
+            raise ValueError("name must be a string")
+        if not isinstance(phone_number, str):
+            raise ValueError("phone_number must be a string")
 
     @classmethod
     def create_customer(cls, customer_id, name, phone_number):
@@ -66,12 +85,7 @@ class Customer:
         create_customer: Creates a new customer and saves it to the JSON file.
         """
         try:
-            if not isinstance(customer_id, str):
-                raise ValueError("customer_id must be a string")
-            if not isinstance(name, str):
-                raise ValueError("name must be a string")
-            if not isinstance(phone_number, str):
-                raise ValueError("phone_number must be a string")
+            cls.validate(customer_id, name, phone_number)
             customer = Customer(customer_id, name, phone_number)
             customer.save_to_json()
             return customer
@@ -79,37 +93,49 @@ class Customer:
             print(f"Error create customer: {e}")
             return None
 
+    @classmethod
+    def create_many(cls, rows):
+        """
+        create_many: Creates several customers from dicts with the
+        customer_id, name and phone_number fields and saves them with a
+        single write. Nothing is saved if any of the rows is invalid.
+        """
+        customers = []
+        errors = []
+        for number, row in enumerate(rows, start=1):
+            try:
+                values = (row.get("customer_id"), row.get("name"),
+                          row.get("phone_number"))
+                cls.validate(*values)
+                customers.append(Customer(*values))
+            except (ValueError, AttributeError) as e:
+                errors.append(f"row {number}: {e}")
+        if errors:
+            for error in errors:
+                print(f"Error create customer: {error}")
+            return None
+        cls.repository().insert_many(
+            [customer.to_dict() for customer in customers])
+        return customers
+
     @classmethod
     def delete_customer(cls, customer_id):
         """
         delete_customer: Deletes a customer from the JSON file.
         """
-        confirmed = False
-        customers = cls.load_customers()
-        for customer in customers:
-            if customer["customer_id"] == customer_id:
-                customers.remove(customer)
-                confirmed = True
-                break
-        with open(cls.customers_file, 'w', encoding="utf-8") as file:
-            json.dump(customers, file, indent=4)
-        return confirmed
+        return cls.repository().delete(customer_id)
 
     @classmethod
     def display_customer(cls, customer_id):
         """
         display_customer: Displays the information of a customer.
         """
-        founded = False
-        customers = cls.load_customers()
-        for customer in customers:
-            if customer["customer_id"] == customer_id:
-                founded = True
-                print(customer)
-                break
-        if not founded:
+        customer = cls.repository().cached_get(customer_id)
+        if customer is None:
             print("Customer not found")
-        return founded
+            return False
+        print(customer)
+        return True
 
     @classmethod
     def update_customer(
@@ -121,18 +147,12 @@ class Customer:
         """
         update_customer: Updates the information of a customer.
         """
-        founded = False
-        customers = cls.load_customers()
-        for customer in customers:
-            if customer["customer_id"] == customer_id:
-                founded = True
-                if new_name:
-                    customer["name"] = new_name
-                if new_phone_number:
-                    customer["phone_number"] = new_phone_number
-                break
-        with open(cls.customers_file, 'w', encoding="utf-8") as file:
-            json.dump(customers, file, indent=4)
+        changes = {}
+        if new_name:
+            changes["name"] = new_name
+        if new_phone_number:
+            changes["phone_number"] = new_phone_number
+        founded = cls.repository().update(customer_id, changes)
         if not founded:
             print("Customer not found")
         return founded
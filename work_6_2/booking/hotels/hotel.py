@@ -1,10 +1,10 @@
 """
 This script utilizes the following modules:
-- `json` for encoding and decoding JSON data.
-- `os` for interacting with the operating system.
+- `get_repository` for the shared in-memory index of the hotels.
+- `DataPath` for locating the hotels file in the data folder.
 """
-import json
-import os
+from booking.settings import DataPath
+from booking.storage.repository import get_repository
 
 
 class Hotel:
@@ -12,12 +12,12 @@ class Hotel:
     Class to represent a hotel.
 
     Attributes:
-        data_folder (str): The path of the data folder.
+        data_folder (str): The path of the configured data folder.
         hotels_file (str): The path of the JSON file that stores the hotels.
     """
-    data_folder = os.path.abspath(os.path.join(os.path.dirname(__file__),
-                                               "../data"))
-    hotels_file = os.path.join(data_folder, "hotels.json")
+    data_folder = DataPath()
+    hotels_file = DataPath("hotels.json")
+    __slots__ = ("name", "num_rooms", "ubication")
 
     def __init__(self, name, num_rooms, ubication):
         """
@@ -37,27 +37,45 @@ class Hotel:
             "ubication": self.ubication
         }
 
+    @classmethod
+    def from_dict(cls, record):
+        """
+        from_dict: Creates a hotel object from a dictionary.
+        """
+        return cls(record.get("name"), record.get("num_rooms"),
+                   record.get("ubication"))
+
+    @classmethod
+    def repository(cls):
+        """
+        repository: Returns the shared repository of the hotels file.
+        """
+        return get_repository(cls.hotels_file, "name")
+
     @classmethod
     def load_hotels(cls):
         """
         load_hotels: Loads the hotels from the JSON file.
         """
-        if not os.path.exists(cls.hotels_file):
-            return []
-        with open(cls.hotels_file, 'r', encoding="utf-8") as file:
-            return json.load(file)
+        return cls.repository().records()
 
     def save_to_json(self):
         """
         save_to_json: Saves the hotel to the JSON file.
         """
-        if not os.path.exists(self.data_folder):
-            os.makedirs(self.data_folder)
+        self.repository().insert(self.to_dict())
 
-        hotels = self.load_hotels()
-        hotels.append(self.to_dict())
-        with open(self.hotels_file, 'w', encoding="utf-8") as file:
-            json.dump(hotels, file, indent=4)
+    @staticmethod
+    def validate(name, num_rooms, ubication):
+        """
+        validate: Raises a ValueError if the hotel fields are invalid.
+        """
+        if not isinstance(name, str):
+            raise ValueError("name must be a string")
+        if not isinstance(num_rooms, int):
+            raise ValueError("num_rooms must be a string")
+        if not isinstance(ubication, str):
+            raise ValueError("ubication must be a string")
 
     @classmethod
     def create_hotel(cls, name, num_rooms, ubication):
@@ -65,12 +83,7 @@ class Hotel:
         create_hotel: Creates a new hotel and saves it to the JSON file.
         """
         try:
-            if not isinstance(name, str):
-                raise ValueError("name must be a string")
-            if not isinstance(num_rooms, int):
-                raise ValueError("num_rooms must be a string")
-            if not isinstance(ubication, str):
-                raise ValueError("ubication must be a string")
+            cls.validate(name, num_rooms, ubication)
             hotel = Hotel(name, num_rooms, ubication)
             hotel.save_to_json()
             return hotel
@@ -78,55 +91,61 @@ class Hotel:
             print(f"Error create hotel: {e}")
             return None
 
+    @classmethod
+    def create_many(cls, rows):
+        """
+        create_many: Creates several hotels from dicts with the name,
+        num_rooms and ubication fields and saves them with a single
+        write. Nothing is saved if any of the rows is invalid.
+        """
+        hotels = []
+        errors = []
+        for number, row in enumerate(rows, start=1):
+            try:
+                values = (row.get("name"), row.get("num_rooms"),
+                          row.get("ubication"))
+                cls.validate(*values)
+                hotels.append(Hotel(*values))
+            except (ValueError, AttributeError) as e:
+                errors.append(f"row {number}: {e}")
+        if errors:
+            for error in errors:
+                print(f"Error create hotel: {error}")
+            return None
+        cls.repository().insert_many(
+            [hotel.to_dict() for hotel in hotels])
+        return hotels
+
     @classmethod
     def delete_hotel(cls, name):
         """
         delete_hotel: Deletes a hotel from the JSON file.
         """
-        confirmed = False
-        hotels = cls.load_hotels()
-        for hotel in hotels:
-            if hotel["name"] == name:
-                hotels.remove(hotel)
-                confirmed = True
-                break
-        with open(cls.hotels_file, 'w', encoding="utf-8") as file:
-            json.dump(hotels, file, indent=4)
-        return confirmed
+        return cls.repository().delete(name)
 
     @classmethod
     def display_hotel(cls, name):
         """
         display_hotel: Displays the information of a hotel.
         """
-        founded = False
-        hotels = cls.load_hotels()
-        for hotel in hotels:
-            if hotel["name"] == name:
-                founded = True
-                print(hotel)
-                break
-        if not founded:
+        hotel = cls.repository().cached_get(name)
+        if hotel is None:
             print("Hotel not found")
-        return founded
+            return False
+        print(hotel)
+        return True
 
     @classmethod
     def update_hotel(cls, name, new_num_rooms=None, new_ubication=None):
         """
         update_hotel: Updates the information of a hotel.
         """
-        updated = False
-        hotels = cls.load_hotels()
-        for hotel in hotels:
-            if hotel["name"] == name:
-                updated = True
-                if new_num_rooms:
-                    hotel["num_rooms"] = new_num_rooms
-                if new_ubication:
-                    hotel["ubication"] = new_ubication
-                break
-        with open(cls.hotels_file, 'w', encoding="utf-8") as file:
-            json.dump(hotels, file, indent=4)
+        changes = {}
+        if new_num_rooms:
+            changes["num_rooms"] = new_num_rooms
+        if new_ubication:
+            changes["ubication"] = new_ubication
+        updated = cls.repository().update(name, changes)
         if not updated:
             print("Hotel not found")
         return updated
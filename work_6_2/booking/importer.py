@@ -0,0 +1,108 @@
+"""
+This script imports customers, hotels or reservations in bulk from a
+CSV file (with a header row) or a JSON Lines file.
+
+Usage: python -m booking.importer {customers,hotels,reservations} FILE
+                                  [--format {csv,jsonl}]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `csv` for reading CSV files.
+- `json` for decoding JSON Lines files.
+- `os` for detecting the file format from its extension.
+- `sys` for the exit status.
+- `Customer`, `Hotel` and `Reservation` for the bulk creation APIs.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+
+COLLECTIONS = {
+    "customers": Customer,
+    "hotels": Hotel,
+    "reservations": Reservation
+}
+
+# CSV values are strings; these fields are converted before validation.
+CSV_CONVERTERS = {
+    "hotels": {"num_rooms": int}
+}
+
+
+def read_csv(file_path, collection):
+    """
+    read_csv: Reads the rows of a CSV file as dicts, converting the
+    numeric fields of the collection.
+    """
+    converters = CSV_CONVERTERS.get(collection, {})
+    with open(file_path, 'r', encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    for row in rows:
+        for field, converter in converters.items():
+            try:
+                row[field] = converter(row[field])
+            except (KeyError, TypeError, ValueError):
+                pass
+    return rows
+
+
+def read_jsonl(file_path):
+    """
+    read_jsonl: Reads the objects of a JSON Lines file, skipping blank
+    lines.
+    """
+    with open(file_path, 'r', encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def detect_format(file_path):
+    """
+    detect_format: Returns the format of a file from its extension.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    return "csv" if extension == ".csv" else "jsonl"
+
+
+def import_file(collection, file_path, file_format=None):
+    """
+    import_file: Creates every row of the file in the collection with a
+    single write. Returns the created objects, or None if the file could
+    not be read or any row is invalid.
+    """
+    file_format = file_format or detect_format(file_path)
+    try:
+        if file_format == "csv":
+            rows = read_csv(file_path, collection)
+        else:
+            rows = read_jsonl(file_path)
+    except (OSError, json.JSONDecodeError, csv.Error) as e:
+        print(f"Error reading file: {e}")
+        return None
+    return COLLECTIONS[collection].create_many(rows)
+
+
+def main(argv=None):
+    """
+    main: Runs the importer from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Import booking records from CSV or JSON Lines.")
+    parser.add_argument("collection", choices=sorted(COLLECTIONS))
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=("csv", "jsonl"),
+                        help="file format (default: from the extension)")
+    arguments = parser.parse_args(argv)
+    created = import_file(arguments.collection, arguments.file,
+                          arguments.format)
+    if created is None:
+        sys.exit(1)
+    print(f"Imported {len(created)} {arguments.collection}")
+
+
+if __name__ == "__main__":
+    main()
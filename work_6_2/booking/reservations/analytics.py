@@ -0,0 +1,243 @@
+"""
+This script keeps the booking aggregates up to date with the
+reservations, so the occupancy of the hotels and the reservations of the
+customers are served without scanning them, and rebuilds them from
+scratch to verify them.
+
+Usage: python -m booking.reservations.analytics [--file FILE] [--verify]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `collections` for counting the reservations.
+- `sys` for the exit status of the command.
+- `Hotel` for the number of rooms of each hotel.
+- `Reservation` from `booking.reservations.reservation` for the
+   reservations being aggregated.
+"""
+import argparse
+import collections
+import sys
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+
+
+class ReservationStats:
+    """
+    Class to keep the aggregates of the reservations of a collection,
+    updated by the repository on every change.
+
+    Attributes:
+        active (Counter): For each hotel name, its active reservations.
+        held (dict): For each hotel name, a Counter of room to the
+        active reservations holding it.
+        reservations (Counter): For each customer id, its reservations.
+        active_by_customer (Counter): For each customer id, its active
+        reservations.
+    """
+
+    def __init__(self):
+        """
+        __init__: Initializes empty aggregates.
+        """
+        self.clear()
+
+    def clear(self):
+        """
+        clear: Resets every aggregate.
+        """
+        self.active = collections.Counter()
+        self.held = {}
+        self.reservations = collections.Counter()
+        self.active_by_customer = collections.Counter()
+
+    def add(self, record):
+        """
+        add: Counts a reservation.
+        """
+        self._count(record, 1)
+
+    def remove(self, record):
+        """
+        remove: Discounts a reservation.
+        """
+        self._count(record, -1)
+
+    def _count(self, record, step):
+        """
+        _count: Adds `step` to the aggregates of a reservation, dropping
+        the entries that reach zero.
+        """
+        customer_id = record.get("customer_id")
+        self._step(self.reservations, customer_id, step)
+        if not record.get("active"):
+            return
+        hotel_name = record.get("hotel_name")
+        self._step(self.active, hotel_name, step)
+        self._step(self.active_by_customer, customer_id, step)
+        rooms = self.held.setdefault(hotel_name, collections.Counter())
+        self._step(rooms, record.get("room"), step)
+        if not rooms:
+            del self.held[hotel_name]
+
+    @staticmethod
+    def _step(counter, key, step):
+        """
+        _step: Adds `step` to a count, removing it when it reaches zero.
+        """
+        counter[key] += step
+        if counter[key] <= 0:
+            del counter[key]
+
+    def hotels(self):
+        """
+        hotels: Returns, for each hotel with active reservations, its
+        active reservations and the rooms they hold.
+        """
+        return {hotel_name: {"active": count,
+                             "occupied_rooms": len(self.held[hotel_name])}
+                for hotel_name, count in self.active.items()}
+
+    def customers(self):
+        """
+        customers: Returns, for each customer with reservations, its
+        reservations and active reservations.
+        """
+        return {customer_id: {"reservations": count,
+                              "active": self.active_by_customer[customer_id]}
+                for customer_id, count in self.reservations.items()}
+
+
+def reservation_stats(repository):
+    """
+    reservation_stats: Returns the aggregates of the reservations of a
+    repository, kept up to date with them.
+    """
+    return repository.get_index("stats", ReservationStats)
+
+
+def _merge(parts):
+    """
+    _merge: Adds up the per-key counts of several repositories.
+    """
+    merged = {}
+    for part in parts:
+        for key, counts in part.items():
+            total = merged.setdefault(key, dict.fromkeys(counts, 0))
+            for name, count in counts.items():
+                total[name] += count
+    return merged
+
+
+def hotel_occupancy(hotel_name=None, stats=None):
+    """
+    hotel_occupancy: Returns, for each hotel (or only one), its active
+    reservations, the rooms they hold, its number of rooms and its
+    occupancy, the share of its rooms held by active reservations (None
+    if the hotel does not exist or has no valid number of rooms).
+    """
+    if stats is None:
+        repositories = (Reservation.repositories() if hotel_name is None
+                        else [Reservation.hotel_repository(hotel_name)])
+        stats = [reservation_stats(repository)
+                 for repository in repositories]
+    hotels = _merge(part.hotels() for part in stats)
+    names = ([hotel_name] if hotel_name is not None else
+             sorted(set(hotels) | {record.get("name") for record
+                                   in Hotel.load_hotels()}, key=str))
+    occupancy = {}
+    for name in names:
+        counts = hotels.get(name, {"active": 0, "occupied_rooms": 0})
+        hotel = Hotel.repository().cached_get(name)
+        num_rooms = None if hotel is None else hotel.get("num_rooms")
+        if not isinstance(num_rooms, int) or num_rooms <= 0:
+            num_rooms = None
+        occupancy[name] = dict(
+            counts, num_rooms=num_rooms,
+            occupancy=(None if num_rooms is None
+                       else counts["occupied_rooms"] / num_rooms))
+    return occupancy
+
+
+def customer_reservations(customer_id=None, stats=None):
+    """
+    customer_reservations: Returns, for each customer with reservations
+    (or only one), its reservations and active reservations.
+    """
+    if stats is None:
+        stats = [reservation_stats(repository)
+                 for repository in Reservation.repositories()]
+    customers = _merge(part.customers() for part in stats)
+    if customer_id is None:
+        return customers
+    return {customer_id: customers.get(customer_id,
+                                       {"reservations": 0, "active": 0})}
+
+
+def rebuild_stats():
+    """
+    rebuild_stats: Returns aggregates computed from scratch with a full
+    scan of every reservation.
+    """
+    stats = []
+    for repository in Reservation.repositories():
+        part = ReservationStats()
+        for record in repository.records():
+            part.add(record)
+        stats.append(part)
+    return stats
+
+
+def verify_stats():
+    """
+    verify_stats: Returns the hotels and customers whose incrementally
+    kept aggregates differ from those rebuilt from scratch.
+    """
+    rebuilt = rebuild_stats()
+    kept = [reservation_stats(repository)
+            for repository in Reservation.repositories()]
+    differences = []
+    for name, aggregate in (("hotel", hotel_occupancy),
+                            ("customer", customer_reservations)):
+        expected = aggregate(stats=rebuilt)
+        actual = aggregate(stats=kept)
+        for key in sorted(set(expected) | set(actual), key=str):
+            if expected.get(key) != actual.get(key):
+                differences.append((name, key))
+    return differences
+
+
+def main(argv=None):
+    """
+    main: Prints the aggregates from the command line, or rebuilds them
+    and returns the number of differences with `--verify`.
+    """
+    parser = argparse.ArgumentParser(
+        description="Show the occupancy of the hotels and the reservations "
+                    "of the customers.")
+    parser.add_argument("--file", help="the reservations JSON file")
+    parser.add_argument("--verify", action="store_true",
+                        help="rebuild the aggregates with a full scan and "
+                             "compare them")
+    arguments = parser.parse_args(argv)
+    if arguments.file:
+        Reservation.reservations_file = arguments.file
+    if arguments.verify:
+        differences = verify_stats()
+        for name, key in differences:
+            print(f"Aggregates of {name} {key} differ from a rebuild")
+        print(f"Found {len(differences)} differences")
+        return len(differences)
+    for name, counts in hotel_occupancy().items():
+        occupancy = ("unknown" if counts["occupancy"] is None
+                     else f"{counts['occupancy']:.1%}")
+        print(f"Hotel {name}: {counts['active']} active reservations, "
+              f"{counts['occupied_rooms']} rooms held, occupancy "
+              f"{occupancy}")
+    for customer_id, counts in customer_reservations().items():
+        print(f"Customer {customer_id}: {counts['reservations']} "
+              f"reservations, {counts['active']} active")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -0,0 +1,69 @@
+"""
+This script moves the cancelled reservations to their archive, once or
+periodically, so the reservations file only keeps the live ones.
+
+Usage: python -m booking.reservations.archiving [--gzip] [--file FILE]
+                                                [--every SECONDS]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `logging` for reporting the failed runs of the background archiving.
+- `threading` for archiving in the background.
+- `Reservation` from `booking.reservations.reservation` for the
+   archiving of the reservations.
+"""
+import argparse
+import logging
+import threading
+from booking.reservations.reservation import Reservation
+
+logger = logging.getLogger(__name__)
+
+
+def start_archiving(interval, compress=False):
+    """
+    start_archiving: Archives the cancelled reservations in a background
+    thread, right away and then every `interval` seconds. A failed run is
+    logged and the next one is tried on schedule. Returns the event that
+    stops it.
+    """
+    stop = threading.Event()
+
+    def run():
+        while True:
+            try:
+                Reservation.archive_cancelled(compress)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Archiving the cancelled reservations "
+                                 "failed")
+            if stop.wait(interval):
+                return
+
+    threading.Thread(target=run, name="reservation-archiving",
+                     daemon=True).start()
+    return stop
+
+
+def main(argv=None):
+    """
+    main: Runs the archiving from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Move cancelled reservations to dated archive files.")
+    parser.add_argument("--gzip", action="store_true",
+                        help="write gzip-compressed archive files")
+    parser.add_argument("--file", help="the reservations JSON file")
+    parser.add_argument("--every", type=float,
+                        help="keep archiving every SECONDS")
+    arguments = parser.parse_args(argv)
+    if arguments.file:
+        Reservation.reservations_file = arguments.file
+    if arguments.every:
+        start_archiving(arguments.every, arguments.gzip).wait()
+        return
+    moved = Reservation.archive_cancelled(arguments.gzip)
+    print(f"Archived {moved} cancelled reservations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+This script defines the availability index of the hotel rooms, kept up
+to date by the reservations repository.
+
+It utilizes the following modules:
+- `bisect` for searching the sorted stays of a room.
+"""
+import bisect
+
+
+def overlaps(check_in, check_out, other_check_in, other_check_out):
+    """
+    overlaps: Returns whether two date ranges overlap. The ranges include
+    the check-in and exclude the check-out date; a range without dates
+    covers every date.
+    """
+    return ((check_in is None or other_check_out is None
+             or check_in < other_check_out)
+            and (other_check_in is None or check_out is None
+                 or other_check_in < check_out))
+
+
+class AvailabilityIndex:
+    """
+    Class to keep, for each hotel, the rooms held by active reservations,
+    so availability checks do not scan the reservations.
+
+    A reservation without dates holds its room indefinitely. The stays
+    of a room, the reservations with check-in and check-out dates, are
+    kept sorted by check-in date. Overlapping stays are rejected on
+    creation, so they are usually disjoint and the stays overlapping a
+    date range are found with a binary search in O(log n + k); rooms
+    whose stored stays overlap each other, e.g. written to the file by
+    hand, are noted on insertion and scanned instead. The rooms held at any
+    date are counted as reservations are added and removed, so checks
+    without dates take O(1).
+
+    Attributes:
+        rooms (dict): For each hotel name, a dict of room to the codes
+        of the active reservations without dates holding it, in creation
+        order.
+        stays (dict): For each hotel name, a dict of room to the sorted
+        list of (check_in, check_out, reservation_code) of its active
+        stays.
+        held (dict): For each hotel name, a dict of room to the number
+        of active reservations holding it at some date.
+        overlapped (set): The (hotel_name, room) pairs whose stays
+        overlap each other.
+    """
+
+    def __init__(self):
+        """
+        __init__: Initializes an empty index.
+        """
+        self.rooms = {}
+        self.stays = {}
+        self.held = {}
+        self.overlapped = set()
+
+    def clear(self):
+        """
+        clear: Removes every reservation from the index.
+        """
+        self.rooms = {}
+        self.stays = {}
+        self.held = {}
+        self.overlapped = set()
+
+    def add(self, record):
+        """
+        add: Adds a reservation to the index if it is active.
+        """
+        if not record.get("active"):
+            return
+        hotel_name = record.get("hotel_name")
+        room = record.get("room")
+        hotel_held = self.held.setdefault(hotel_name, {})
+        hotel_held[room] = hotel_held.get(room, 0) + 1
+        stay = self._stay(record)
+        if stay is None:
+            hotel_rooms = self.rooms.setdefault(hotel_name, {})
+            hotel_rooms.setdefault(room, []).append(
+                record.get("reservation_code"))
+        else:
+            entries = self.stays.setdefault(hotel_name, {}).setdefault(
+                room, [])
+            position = bisect.bisect_left(entries, stay)
+            entries.insert(position, stay)
+            if not self._disjoint(entries[max(position - 1, 0):
+                                          position + 2]):
+                self.overlapped.add((hotel_name, room))
+
+    def remove(self, record):
+        """
+        remove: Removes a reservation from the index.
+        """
+        if not record.get("active"):
+            return
+        hotel_name = record.get("hotel_name")
+        room = record.get("room")
+        hotel_held = self.held[hotel_name]
+        hotel_held[room] -= 1
+        if not hotel_held[room]:
+            del hotel_held[room]
+            if not hotel_held:
+                del self.held[hotel_name]
+        stay = self._stay(record)
+        if stay is None:
+            index, entries = self.rooms, self.rooms[hotel_name][room]
+            entries.remove(record.get("reservation_code"))
+        else:
+            index, entries = self.stays, self.stays[hotel_name][room]
+            del entries[bisect.bisect_left(entries, stay)]
+            if ((hotel_name, room) in self.overlapped
+                    and self._disjoint(entries)):
+                self.overlapped.discard((hotel_name, room))
+        if not entries:
+            del index[hotel_name][room]
+            if not index[hotel_name]:
+                del index[hotel_name]
+
+    @staticmethod
+    def _stay(record):
+        """
+        _stay: Returns the (check_in, check_out, reservation_code) entry
+        of a reservation, or None if it has no dates.
+        """
+        check_in = record.get("check_in")
+        check_out = record.get("check_out")
+        if check_in is None or check_out is None:
+            return None
+        return (check_in, check_out, record.get("reservation_code"))
+
+    @staticmethod
+    def _disjoint(stays):
+        """
+        _disjoint: Returns whether sorted stays do not overlap each other,
+        that is, whether each one ends before the next one starts.
+        """
+        return all(stay[1] <= following[0]
+                   for stay, following in zip(stays, stays[1:]))
+
+    def overlapping(self, hotel_name, room, check_in=None, check_out=None):
+        """
+        overlapping: Returns the codes of the active reservations holding
+        a room at some date of a range, or at any date if the range has
+        no dates.
+        """
+        codes = list(self.rooms.get(hotel_name, {}).get(room, ()))
+        stays = self.stays.get(hotel_name, {}).get(room, ())
+        if check_in is None or check_out is None:
+            return codes + [code for _, _, code in stays]
+        # The stays starting before the check-out; of those, the ones
+        # ending after the check-in are the last ones.
+        position = bisect.bisect_left(stays, (check_out,))
+        if (hotel_name, room) in self.overlapped:
+            return codes + [code for _, stay_check_out, code
+                            in stays[:position] if stay_check_out > check_in]
+        found = []
+        while position > 0 and stays[position - 1][1] > check_in:
+            position -= 1
+            found.append(stays[position][2])
+        return codes + found[::-1]
+
+    def occupant(self, hotel_name, room, check_in=None, check_out=None):
+        """
+        occupant: Returns the code of an active reservation holding a
+        room during a date range, or None if the room is free.
+        """
+        codes = self.overlapping(hotel_name, room, check_in, check_out)
+        return codes[0] if codes else None
+
+    def booked_rooms(self, hotel_name, check_in=None, check_out=None):
+        """
+        booked_rooms: Returns the set of rooms of a hotel held by active
+        reservations at some date of a range.
+        """
+        if check_in is None or check_out is None:
+            return set(self.held.get(hotel_name, ()))
+        booked = set(self.rooms.get(hotel_name, ()))
+        for room in self.stays.get(hotel_name, ()):
+            if room not in booked and self.occupant(
+                    hotel_name, room, check_in, check_out) is not None:
+                booked.add(room)
+        return booked
+
+    def occupied_rooms(self, hotel_name, check_in=None, check_out=None,
+                       extra_rooms=()):
+        """
+        occupied_rooms: Returns the number of rooms of a hotel held by
+        active reservations at some date of a range, or in `extra_rooms`.
+        Without dates, it is counted without walking the rooms.
+        """
+        if check_in is None or check_out is None:
+            held = self.held.get(hotel_name, {})
+            return len(held) + sum(1 for room in set(extra_rooms)
+                                   if room not in held)
+        return len(self.booked_rooms(hotel_name, check_in, check_out)
+                   | set(extra_rooms))
@@ -0,0 +1,137 @@
+"""
+This script defines the time-ordered reservation codes and the index of
+the reservations by creation time, kept up to date by the reservations
+repository.
+
+The codes are version 7 UUIDs: their first 48 bits are the creation
+time in milliseconds, followed by a counter that keeps the codes of the
+same millisecond in order and by random bits. Their strings sort like
+their creation times.
+
+It utilizes the following modules:
+- `bisect` for searching the sorted codes.
+- `datetime` for the creation times.
+- `os` for the random bits of the codes.
+- `threading` for numbering the codes of the same millisecond.
+- `time` for the current time.
+- `uuid` for formatting the codes.
+"""
+import bisect
+import datetime
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_clock = {"millisecond": 0, "counter": 0}
+
+
+def new_code():
+    """
+    new_code: Returns a new reservation code, greater than the codes
+    created before it by this process.
+    """
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        millisecond = time.time_ns() // 1_000_000
+        if millisecond > _clock["millisecond"]:
+            _clock["millisecond"] = millisecond
+            _clock["counter"] = random_bits >> 70
+        elif _clock["counter"] < 0xFFF:
+            _clock["counter"] += 1
+        else:
+            _clock["millisecond"] += 1
+            _clock["counter"] = 0
+        value = (_clock["millisecond"] << 80 | 0x7 << 76
+                 | _clock["counter"] << 64
+                 | 0b10 << 62 | random_bits & (1 << 62) - 1)
+    return str(uuid.UUID(int=value))
+
+
+def is_time_ordered(code):
+    """
+    is_time_ordered: Returns whether a code is a time-ordered code, as
+    opposed to the random codes of older reservations.
+    """
+    try:
+        return uuid.UUID(code).version == 7 and code == code.lower()
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def code_time(code):
+    """
+    code_time: Returns the creation time of a time-ordered code, in UTC,
+    or None for other codes.
+    """
+    if not is_time_ordered(code):
+        return None
+    millisecond = uuid.UUID(code).int >> 80
+    return datetime.datetime.fromtimestamp(millisecond / 1000,
+                                           datetime.timezone.utc)
+
+
+def lowest_code(moment):
+    """
+    lowest_code: Returns a code lower than every code created in or after
+    the millisecond of a datetime (naive datetimes are in local time) and
+    higher than every code created before it.
+    """
+    millisecond = max(int(moment.timestamp() * 1000), 0)
+    return str(uuid.UUID(int=millisecond << 80))
+
+
+class CreationIndex:
+    """
+    Class to keep the time-ordered codes of the reservations sorted, so
+    the reservations created in a time range are found with a binary
+    search in O(log n + k). Reservations with random codes, created
+    before the codes were time-ordered, are not indexed.
+
+    Attributes:
+        codes (list): The sorted time-ordered codes.
+    """
+
+    def __init__(self):
+        """
+        __init__: Initializes an empty index.
+        """
+        self.codes = []
+
+    def clear(self):
+        """
+        clear: Removes every reservation from the index.
+        """
+        self.codes = []
+
+    def add(self, record):
+        """
+        add: Adds a reservation to the index. New codes are the greatest,
+        so they are appended at the end.
+        """
+        code = record.get("reservation_code")
+        if is_time_ordered(code):
+            bisect.insort(self.codes, code)
+
+    def remove(self, record):
+        """
+        remove: Removes a reservation from the index.
+        """
+        code = record.get("reservation_code")
+        if not is_time_ordered(code):
+            return
+        position = bisect.bisect_left(self.codes, code)
+        if position < len(self.codes) and self.codes[position] == code:
+            del self.codes[position]
+
+    def between(self, start=None, end=None):
+        """
+        between: Returns the codes created from the `start` datetime up
+        to, but not including, the `end` datetime, oldest first.
+        """
+        low = (0 if start is None
+               else bisect.bisect_left(self.codes, lowest_code(start)))
+        high = (len(self.codes) if end is None
+                else bisect.bisect_left(self.codes, lowest_code(end)))
+        return self.codes[low:high]
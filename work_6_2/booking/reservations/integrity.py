@@ -0,0 +1,63 @@
+"""
+This script checks that every reservation refers to an existing customer
+and hotel, reading each collection once.
+
+Usage: python -m booking.reservations.integrity [--file FILE]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `sys` for the exit status of the command.
+- `Customer` and `Hotel` for the keys of the customers and hotels.
+- `Reservation` from `booking.reservations.reservation` for the
+   reservations being checked.
+"""
+import argparse
+import sys
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+
+
+def audit_reservations():
+    """
+    audit_reservations: Returns a (reservation_code, field, value) tuple
+    for every reference of a reservation to a customer or a hotel that
+    does not exist. The keys of the customers and hotels are read once
+    into sets, so the check takes one pass over the reservations.
+    """
+    keys = {}
+    for cls, field in ((Customer, "customer_id"), (Hotel, "hotel_name")):
+        repository = cls.repository()
+        keys[field] = {record.get(repository.key_field)
+                       for record in repository.records()}
+    problems = []
+    for repository in Reservation.repositories():
+        for record in repository.records():
+            for field, existing in keys.items():
+                if record.get(field) not in existing:
+                    problems.append((record.get("reservation_code"), field,
+                                     record.get(field)))
+    return problems
+
+
+def main(argv=None):
+    """
+    main: Runs the audit from the command line and returns the number of
+    problems found.
+    """
+    parser = argparse.ArgumentParser(
+        description="Check that reservations refer to existing customers "
+                    "and hotels.")
+    parser.add_argument("--file", help="the reservations JSON file")
+    arguments = parser.parse_args(argv)
+    if arguments.file:
+        Reservation.reservations_file = arguments.file
+    problems = audit_reservations()
+    for code, field, value in problems:
+        print(f"Reservation {code}: {field} {value} does not exist")
+    print(f"Found {len(problems)} broken references")
+    return len(problems)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
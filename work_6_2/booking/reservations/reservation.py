@@ -1,12 +1,29 @@
 """
 This script utilizes the following modules:
-- `json` for encoding and decoding JSON data.
-- `os` for interacting with the operating system.
-- `uuid` for generating UUIDs.
+- `datetime` for validating the check-in and check-out dates.
+- `DataPath` for locating the reservations file in the data folder.
+- `get_repository` for the shared in-memory index of the reservations.
+- `get_sharded_repository` for storing the reservations of each hotel
+   in a shard of its own.
+- `FieldIndex` for finding the reservations of a customer or a hotel.
+- `archive_records` and `get_archive` for moving cancelled reservations out
+   of the collection.
+- `AvailabilityIndex` and `overlaps` for the rooms held by active
+   reservations.
+- `CreationIndex` and `new_code` for the time-ordered reservation codes.
+- `Customer` for checking that the customer of a reservation exists.
+- `Hotel` for the number of rooms of each hotel.
 """
-import json
-import os
-import uuid
+import datetime
+from booking.settings import DataPath
+from booking.storage.archive import archive_records, get_archive
+from booking.storage.field_index import FieldIndex
+from booking.storage.repository import get_repository
+from booking.storage.sharding import get_sharded_repository
+from booking.reservations.availability import AvailabilityIndex, overlaps
+from booking.reservations.codes import CreationIndex, new_code
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
 
 
 class Reservation:
@@ -14,107 +31,438 @@ class Reservation:
     Class to represent a reservation.
 
     Attributes:
-        data_folder (str): The path of the data folder.
+        data_folder (str): The path of the configured data folder.
         reservations_file (str): The path of the JSON file
         that stores the reservations.
+        sharded (bool): Whether the reservations of each hotel are stored
+        in a shard of their own instead of the JSON file.
+        check_references (bool): Whether new reservations must refer to
+        an existing customer and hotel.
     """
-    data_folder = "../data"
-    reservations_file = os.path.join(data_folder, "reservations.json")
+    data_folder = DataPath()
+    reservations_file = DataPath("reservations.json")
+    sharded = False
+    check_references = True
+    __slots__ = ("reservation_code", "customer_id", "hotel_name", "room",
+                 "active", "check_in", "check_out")
 
-    def __init__(self, customer_id, hotel_name, room):
+    def __init__(self, customer_id, hotel_name, room, check_in=None,
+                 check_out=None):
         """
-        __init__: Initializes a new reservation object.
+        __init__: Initializes a new reservation object. The check-in and
+        check-out dates are ISO dates (YYYY-MM-DD); a reservation without
+        dates holds its room indefinitely. The code is time-ordered, so
+        codes sort by creation time.
         """
-        self.reservation_code = str(uuid.uuid4())
+        self.reservation_code = new_code()
         self.customer_id = customer_id
         self.hotel_name = hotel_name
         self.room = room
         self.active = True
+        self.check_in = check_in
+        self.check_out = check_out
 
     def to_dict(self):
         """
         to_dict: Converts the reservation object into a dictionary.
         """
-        return {
+        reservation = {
             "reservation_code": self.reservation_code,
             "customer_id": self.customer_id,
             "hotel_name": self.hotel_name,
             "room": self.room,
             "active": self.active
         }
+        if self.check_in is not None:
+            reservation["check_in"] = self.check_in
+            reservation["check_out"] = self.check_out
+        return reservation
+
+    @classmethod
+    def from_dict(cls, record):
+        """
+        from_dict: Creates a reservation object from a dictionary, keeping
+        its code and status.
+        """
+        reservation = cls.__new__(cls)
+        for field in cls.__slots__:
+            setattr(reservation, field, record.get(field))
+        return reservation
+
+    @classmethod
+    def repository(cls):
+        """
+        repository: Returns the shared repository of the reservations file.
+        """
+        if cls.sharded:
+            return get_sharded_repository(cls.reservations_file,
+                                          "reservation_code", "hotel_name")
+        return get_repository(cls.reservations_file, "reservation_code")
+
+    @classmethod
+    def hotel_repository(cls, hotel_name):
+        """
+        hotel_repository: Returns the repository holding the reservations
+        of a hotel: its shard, or the whole collection if not sharded.
+        """
+        repository = cls.repository()
+        return repository.shard(hotel_name) if cls.sharded else repository
+
+    @classmethod
+    def repositories(cls):
+        """
+        repositories: Returns the repositories of every shard, or the
+        repository of the whole collection if not sharded.
+        """
+        repository = cls.repository()
+        return repository.shards() if cls.sharded else [repository]
+
+    @classmethod
+    def batch(cls, hotel_names):
+        """
+        batch: Returns an exclusive batch over the reservations of the
+        hotels, so their checks and writes are not interleaved with other
+        workers.
+        """
+        if cls.sharded:
+            return cls.repository().batch(exclusive=True, values=hotel_names)
+        return cls.repository().batch(exclusive=True)
 
     @classmethod
     def load_reservations(cls):
         """
         load_reservations: Loads the reservations from the JSON file.
         """
-        if not os.path.exists(cls.reservations_file):
-            return []
-        with open(cls.reservations_file, 'r', encoding="utf-8") as file:
-            return json.load(file)
+        return cls.repository().records()
 
     def save_to_json(self):
         """
         save_to_json: Saves the reservation to the JSON file.
         """
-        if not os.path.exists(self.data_folder):
-            os.makedirs(self.data_folder)
+        self.repository().insert(self.to_dict())
 
-        reservations = self.load_reservations()
-        reservations.append(self.to_dict())
-        with open(self.reservations_file, 'w', encoding="utf-8") as file:
-            json.dump(reservations, file, indent=4)
+    @staticmethod
+    def validate(customer_id, hotel_name, room, check_in=None,
+                 check_out=None):
+        """
+        validate: Raises a ValueError if the reservation fields are invalid.
+        """
+        if not isinstance(customer_id, str):
+            raise ValueError("customer_id must be a string")
+        if not isinstance(hotel_name, str):
+            raise ValueError("hotel_name must be a string")
+        if not isinstance(room, str):
+            raise ValueError("room must be a string")
+        if check_in is None and check_out is None:
+            return
+        dates = []
+        for field, value in (("check_in", check_in),
+                             ("check_out", check_out)):
+            try:
+                date = datetime.date.fromisoformat(value)
+            except (TypeError, ValueError):
+                date = None
+            if date is None or date.isoformat() != value:
+                raise ValueError(f"{field} must be a date as YYYY-MM-DD")
+            dates.append(date)
+        if dates[0] >= dates[1]:
+            raise ValueError("check_out must be after check_in")
+
+    @classmethod
+    def validate_references(cls, customer_id, hotel_name):
+        """
+        validate_references: Raises a ValueError if the customer or the
+        hotel of a reservation does not exist. The lookups use the key
+        index the repositories keep in memory, so the customers and
+        hotels files are only read again when they change.
+        """
+        if not cls.check_references:
+            return
+        if not Customer.repository().contains(customer_id):
+            raise ValueError(f"customer {customer_id} does not exist")
+        if not Hotel.repository().contains(hotel_name):
+            raise ValueError(f"hotel {hotel_name} does not exist")
 
     @classmethod
-    def create_reservation(cls, customer_id, hotel_name, room):
+    def availability(cls, hotel_name):
+        """
+        availability: Returns the availability index of the rooms of a
+        hotel, kept up to date with the reservations.
+        """
+        return cls.hotel_repository(hotel_name).get_index(
+            "availability", AvailabilityIndex)
+
+    @classmethod
+    def field_index(cls, field, active_only=False, repository=None):
+        """
+        field_index: Returns the index of the reservation codes by the
+        value of a field, optionally of the active reservations only, of
+        a repository (by default, of the whole collection).
+        """
+        repository = repository or cls.repository()
+        if active_only:
+            return repository.get_index(
+                f"{field}:active",
+                lambda: FieldIndex(field, "reservation_code",
+                                   repository.position,
+                                   lambda record: record.get("active")))
+        return repository.get_index(
+            field, lambda: FieldIndex(field, "reservation_code",
+                                      repository.position))
+
+    @classmethod
+    def _field_repositories(cls, field, value):
+        """
+        _field_repositories: Returns the repositories that may hold
+        reservations with a value of a field.
+        """
+        if field == "hotel_name":
+            return [cls.hotel_repository(value)]
+        return cls.repositories()
+
+    @classmethod
+    def find_codes(cls, field, value, active_only=False):
+        """
+        find_codes: Returns the codes of the reservations with a value of
+        an indexed field.
+        """
+        return [code for repository in cls._field_repositories(field, value)
+                for code in cls.field_index(field, active_only,
+                                            repository).lookup(value)]
+
+    @classmethod
+    def find_reservations(cls, field, value, active_only=False):
+        """
+        find_reservations: Returns the reservations with a value of an
+        indexed field, in file order.
+        """
+        reservations = []
+        for repository in cls._field_repositories(field, value):
+            codes = cls.field_index(field, active_only,
+                                    repository).lookup(value)
+            reservations.extend(repository.get(code) for code in codes)
+        return [reservation for reservation in reservations
+                if reservation is not None]
+
+    @classmethod
+    def reservations_by_customer(cls, customer_id, active_only=False):
+        """
+        reservations_by_customer: Returns the reservations of a customer.
+        """
+        return cls.find_reservations("customer_id", customer_id, active_only)
+
+    @classmethod
+    def reservations_by_hotel(cls, hotel_name, active_only=False):
+        """
+        reservations_by_hotel: Returns the reservations of a hotel.
+        """
+        return cls.find_reservations("hotel_name", hotel_name, active_only)
+
+    @classmethod
+    def reservation_codes_by_customer(cls, customer_id, active_only=False):
+        """
+        reservation_codes_by_customer: Returns the codes of the
+        reservations of a customer.
+        """
+        return cls.find_codes("customer_id", customer_id, active_only)
+
+    @classmethod
+    def reservation_codes_by_hotel(cls, hotel_name, active_only=False):
+        """
+        reservation_codes_by_hotel: Returns the codes of the reservations
+        of a hotel.
+        """
+        return cls.find_codes("hotel_name", hotel_name, active_only)
+
+    @classmethod
+    def created_between(cls, start=None, end=None):
+        """
+        created_between: Returns the reservations created from the
+        `start` datetime up to, but not including, the `end` datetime,
+        oldest first. Reservations with the random codes of older
+        versions have no creation time and are never returned.
+        """
+        reservations = []
+        for repository in cls.repositories():
+            index = repository.get_index("created", CreationIndex)
+            reservations.extend(repository.get(code)
+                                for code in index.between(start, end))
+        return sorted((reservation for reservation in reservations
+                       if reservation is not None),
+                      key=lambda reservation: reservation["reservation_code"])
+
+    @classmethod
+    def is_room_available(cls, hotel_name, room, check_in=None,
+                          check_out=None):
+        """
+        is_room_available: Returns whether a room of a hotel is not held
+        by an active reservation during a date range, or at any date if
+        no dates are given.
+        """
+        index = cls.availability(hotel_name)
+        return index.occupant(hotel_name, room, check_in, check_out) is None
+
+    @classmethod
+    def overlapping_reservations(cls, hotel_name, room, check_in=None,
+                                 check_out=None):
+        """
+        overlapping_reservations: Returns the codes of the active
+        reservations holding a room during a date range.
+        """
+        index = cls.availability(hotel_name)
+        return index.overlapping(hotel_name, room, check_in, check_out)
+
+    @classmethod
+    def booked_rooms(cls, hotel_name, check_in=None, check_out=None):
+        """
+        booked_rooms: Returns the sorted rooms of a hotel held by active
+        reservations during a date range.
+        """
+        index = cls.availability(hotel_name)
+        return sorted(index.booked_rooms(hotel_name, check_in, check_out))
+
+    @classmethod
+    def free_rooms(cls, hotel_name, check_in=None, check_out=None):
+        """
+        free_rooms: Returns the number of rooms of a hotel not held by an
+        active reservation during a date range, or None if the hotel does
+        not exist.
+        """
+        hotel = Hotel.repository().get(hotel_name)
+        if hotel is None or not isinstance(hotel.get("num_rooms"), int):
+            return None
+        index = cls.availability(hotel_name)
+        occupied = index.occupied_rooms(hotel_name, check_in, check_out)
+        return max(hotel["num_rooms"] - occupied, 0)
+
+    @classmethod
+    def check_availability(cls, hotel_name, room, check_in=None,
+                           check_out=None, claimed=()):
+        """
+        check_availability: Raises a ValueError if the room is held during
+        the date range by an active reservation or by one of the `claimed`
+        (hotel_name, room, check_in, check_out) tuples, or if the hotel
+        has no free rooms left for the range.
+        """
+        claimed_rooms = {
+            claimed_room for name, claimed_room, claimed_in, claimed_out
+            in claimed if name == hotel_name
+            and overlaps(check_in, check_out, claimed_in, claimed_out)}
+        if (room in claimed_rooms or not cls.is_room_available(
+                hotel_name, room, check_in, check_out)):
+            raise ValueError(f"room {room} of {hotel_name} is already "
+                             "reserved")
+        hotel = Hotel.repository().get(hotel_name)
+        if hotel is None or not isinstance(hotel.get("num_rooms"), int):
+            return
+        occupied = cls.availability(hotel_name).occupied_rooms(
+            hotel_name, check_in, check_out, claimed_rooms)
+        if occupied >= hotel["num_rooms"]:
+            raise ValueError(f"{hotel_name} has no free rooms")
+
+    @classmethod
+    def create_reservation(cls, customer_id, hotel_name, room,
+                           check_in=None, check_out=None):
         """
         create_reservation: Creates a new reservation and saves
-        it to the JSON file.
+        it to the JSON file, if the room is available.
         """
         try:
-            if not isinstance(customer_id, str):
-                raise ValueError("customer_id must be a string")
-            if not isinstance(hotel_name, str):
-                raise ValueError("hotel_name must be a string")
-            if not isinstance(room, str):
-                raise ValueError("room must be a string")
-            reservation = Reservation(customer_id, hotel_name, room)
-            reservation.save_to_json()
+            cls.validate(customer_id, hotel_name, room, check_in, check_out)
+            cls.validate_references(customer_id, hotel_name)
+            with cls.batch([hotel_name]):
+                cls.check_availability(hotel_name, room, check_in, check_out)
+                reservation = Reservation(customer_id, hotel_name, room,
+                                          check_in, check_out)
+                reservation.save_to_json()
             return reservation
         except ValueError as e:
             print(f"Error create reservation: {e}")
             return None
 
+    @classmethod
+    def create_many(cls, rows):
+        """
+        create_many: Creates several reservations from dicts with the
+        customer_id, hotel_name and room fields, and optionally check_in
+        and check_out, and saves them with a single write. Nothing is
+        saved if any of the rows is invalid or asks for a room that is
+        not available.
+        """
+        reservations = []
+        errors = []
+        claimed = []
+        hotel_names = {row.get("hotel_name") for row in rows
+                       if isinstance(row, dict)
+                       and isinstance(row.get("hotel_name"), str)}
+        with cls.batch(sorted(hotel_names)):
+            for number, row in enumerate(rows, start=1):
+                try:
+                    values = (row.get("customer_id"), row.get("hotel_name"),
+                              row.get("room"), row.get("check_in") or None,
+                              row.get("check_out") or None)
+                    cls.validate(*values)
+                    cls.validate_references(*values[:2])
+                    cls.check_availability(*values[1:], claimed=claimed)
+                    claimed.append(values[1:])
+                    reservations.append(Reservation(*values))
+                except (ValueError, AttributeError) as e:
+                    errors.append(f"row {number}: {e}")
+            if errors:
+                for error in errors:
+                    print(f"Error create reservation: {error}")
+                return None
+            cls.repository().insert_many(
+                [reservation.to_dict() for reservation in reservations])
+        return reservations
+
     @classmethod
     def cancel_reservation(cls, reservation_code):
         """
         cancel_reservation: Cancels a reservation and updates
         its status in the JSON file.
         """
-        confirmed = False
-        reservations = cls.load_reservations()
-        for reservation in reservations:
-            if reservation["reservation_code"] == reservation_code:
-                confirmed = True
-                reservation["active"] = False
-                with open(cls.reservations_file,
-                          'w',
-                          encoding="utf-8") as file:
-                    json.dump(reservations, file, indent=4)
-        return confirmed
+        return cls.repository().update(reservation_code, {"active": False},
+                                       op="cancel")
 
     @classmethod
     def delete_reservation(cls, reservation_code):
         """
         delete_reservation: Deletes a reservation from the JSON file.
         """
-        confirmed = False
-        reservations = cls.load_reservations()
-        for reservation in reservations:
-            if reservation["reservation_code"] == reservation_code:
-                reservations.remove(reservation)
-                confirmed = True
-                break
-        with open(cls.reservations_file, 'w', encoding="utf-8") as file:
-            json.dump(reservations, file, indent=4)
-        return confirmed
+        return cls.repository().delete(reservation_code)
+
+    @classmethod
+    def archive(cls, compress=False):
+        """
+        archive: Returns the shared archive of the reservations, writing
+        gzip-compressed files if `compress` is set.
+        """
+        return get_archive(cls.reservations_file, "reservation_code",
+                           compress)
+
+    @classmethod
+    def archive_cancelled(cls, compress=False, day=None):
+        """
+        archive_cancelled: Moves the cancelled reservations to the archive
+        file of the day (by default, today) and returns how many were
+        moved.
+        """
+        archive = cls.archive(compress)
+
+        def cancelled(record):
+            return record.get("active") is False
+
+        return sum(archive_records(repository, archive, cancelled, day)
+                   for repository in cls.repositories())
+
+    @classmethod
+    def find_reservation(cls, reservation_code, include_archive=True):
+        """
+        find_reservation: Returns a reservation by its code, looking in
+        the archive if it is not in the collection, or None.
+        """
+        reservation = cls.repository().get(reservation_code)
+        if reservation is None and include_archive:
+            reservation = cls.archive().get(reservation_code)
+        return reservation
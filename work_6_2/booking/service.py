@@ -0,0 +1,269 @@
+"""
+This script defines an asyncio service layer over the booking classes,
+for use from an event loop such as the one of a web service.
+
+It utilizes the following modules:
+- `asyncio` for the coroutines of the service.
+- `concurrent.futures` for the thread pool running the storage calls.
+- `functools` for binding the arguments of the calls.
+- `Customer`, `Hotel` and `Reservation` for the booking operations.
+"""
+import asyncio
+import concurrent.futures
+import functools
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+
+
+class BookingService:
+    """
+    Class to serve the booking operations to coroutines without blocking
+    the event loop.
+
+    Every call runs in a thread pool. The mutations of a collection
+    requested while a batch is waiting to start are grouped: they run in
+    one thread with `Repository.batch(exclusive=True)`, so they are
+    saved with a single write per collection per tick, and the checks
+    made by each mutation see the ones before it.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The pool running the calls.
+        batch_delay (float): The seconds a batch waits for more
+        mutations before it runs; 0 waits for the current tick only.
+        batching (bool): Whether mutations are grouped; if false, each
+        one is saved on its own, as a plain threaded call would.
+        batches (int): The number of batches run so far.
+    """
+
+    def __init__(self, max_workers=None, batch_delay=0, batching=True):
+        """
+        __init__: Initializes the service with a new thread pool.
+        """
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self.batch_delay = batch_delay
+        self.batching = batching
+        self.batches = 0
+        self._pending = {}
+        self._flushes = set()
+
+    async def __aenter__(self):
+        """
+        __aenter__: Returns the service.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        __aexit__: Waits for the queued batches and closes the service.
+        """
+        await self.wait_flushes()
+        self.close()
+
+    async def wait_flushes(self):
+        """
+        wait_flushes: Waits for the queued batches to be saved, raising
+        the exception of any that failed outside its calls.
+        """
+        while self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def close(self):
+        """
+        close: Waits for the running calls and stops the thread pool.
+        """
+        self.executor.shutdown(wait=True)
+
+    async def _read(self, function, *args):
+        """
+        _read: Runs a call in the thread pool and returns its result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(function, *args))
+
+    async def _mutate(self, cls, function, *args):
+        """
+        _mutate: Queues a mutation of the collection of a class for the
+        next batch and returns its result.
+        """
+        if not self.batching:
+            return await self._read(function, *args)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        calls = self._pending.get(cls)
+        if calls is None:
+            calls = self._pending[cls] = []
+            # The loop keeps only a weak reference to its tasks.
+            task = loop.create_task(self._flush(cls))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        calls.append((functools.partial(function, *args), future))
+        return await future
+
+    async def _flush(self, cls):
+        """
+        _flush: Runs the queued mutations of a collection as one batch
+        and hands each result or exception to its caller.
+        """
+        await asyncio.sleep(self.batch_delay)
+        calls = self._pending.pop(cls)
+        loop = asyncio.get_running_loop()
+        try:
+            outcomes = await loop.run_in_executor(
+                self.executor, self._run_batch, cls,
+                [call for call, _ in calls])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            outcomes = [(None, e)] * len(calls)
+        self.batches += 1
+        for (_, future), (result, error) in zip(calls, outcomes):
+            if future.cancelled():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _run_batch(entity, calls):
+        """
+        _run_batch: Runs mutations of the collection of an entity class
+        with a single write. Returns a (result, exception) pair for each
+        call; a failing call does not discard the others.
+        """
+        # pylint: disable=broad-exception-caught
+        outcomes = []
+        with entity.repository().batch(exclusive=True):
+            for call in calls:
+                try:
+                    outcomes.append((call(), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+        return outcomes
+
+    async def create_customer(self, customer_id, name, phone_number):
+        """
+        create_customer: Creates a customer.
+        """
+        return await self._mutate(Customer, Customer.create_customer,
+                                  customer_id, name, phone_number)
+
+    async def update_customer(self, customer_id, new_name=None,
+                              new_phone_number=None):
+        """
+        update_customer: Updates the information of a customer.
+        """
+        return await self._mutate(Customer, Customer.update_customer,
+                                  customer_id, new_name, new_phone_number)
+
+    async def delete_customer(self, customer_id):
+        """
+        delete_customer: Deletes a customer.
+        """
+        return await self._mutate(Customer, Customer.delete_customer,
+                                  customer_id)
+
+    async def get_customer(self, customer_id):
+        """
+        get_customer: Returns a customer, or None if it does not exist.
+        """
+        return await self._read(Customer.repository().cached_get,
+                                customer_id)
+
+    async def load_customers(self):
+        """
+        load_customers: Returns every customer.
+        """
+        return await self._read(Customer.load_customers)
+
+    async def create_hotel(self, name, num_rooms, ubication):
+        """
+        create_hotel: Creates a hotel.
+        """
+        return await self._mutate(Hotel, Hotel.create_hotel, name,
+                                  num_rooms, ubication)
+
+    async def update_hotel(self, name, new_num_rooms=None,
+                           new_ubication=None):
+        """
+        update_hotel: Updates the information of a hotel.
+        """
+        return await self._mutate(Hotel, Hotel.update_hotel, name,
+                                  new_num_rooms, new_ubication)
+
+    async def delete_hotel(self, name):
+        """
+        delete_hotel: Deletes a hotel.
+        """
+        return await self._mutate(Hotel, Hotel.delete_hotel, name)
+
+    async def get_hotel(self, name):
+        """
+        get_hotel: Returns a hotel, or None if it does not exist.
+        """
+        return await self._read(Hotel.repository().cached_get, name)
+
+    async def load_hotels(self):
+        """
+        load_hotels: Returns every hotel.
+        """
+        return await self._read(Hotel.load_hotels)
+
+    async def create_reservation(self, customer_id, hotel_name, room,
+                                 check_in=None, check_out=None):
+        """
+        create_reservation: Creates a reservation if the room is
+        available.
+        """
+        return await self._mutate(Reservation, Reservation.create_reservation,
+                                  customer_id, hotel_name, room, check_in,
+                                  check_out)
+
+    async def cancel_reservation(self, reservation_code):
+        """
+        cancel_reservation: Cancels a reservation.
+        """
+        return await self._mutate(Reservation, Reservation.cancel_reservation,
+                                  reservation_code)
+
+    async def delete_reservation(self, reservation_code):
+        """
+        delete_reservation: Deletes a reservation.
+        """
+        return await self._mutate(Reservation, Reservation.delete_reservation,
+                                  reservation_code)
+
+    async def get_reservation(self, reservation_code):
+        """
+        get_reservation: Returns a reservation, or None if it does not
+        exist.
+        """
+        return await self._read(Reservation.repository().get,
+                                reservation_code)
+
+    async def load_reservations(self):
+        """
+        load_reservations: Returns every reservation.
+        """
+        return await self._read(Reservation.load_reservations)
+
+    async def reservations_by_customer(self, customer_id, active_only=False):
+        """
+        reservations_by_customer: Returns the reservations of a customer.
+        """
+        return await self._read(Reservation.reservations_by_customer,
+                                customer_id, active_only)
+
+    async def reservations_by_hotel(self, hotel_name, active_only=False):
+        """
+        reservations_by_hotel: Returns the reservations of a hotel.
+        """
+        return await self._read(Reservation.reservations_by_hotel,
+                                hotel_name, active_only)
+
+    async def free_rooms(self, hotel_name, check_in=None, check_out=None):
+        """
+        free_rooms: Returns the number of free rooms of a hotel.
+        """
+        return await self._read(Reservation.free_rooms, hotel_name,
+                                check_in, check_out)
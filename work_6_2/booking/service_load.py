@@ -0,0 +1,81 @@
+"""
+This script generates load on the booking service from many concurrent
+clients and reports its throughput, with and without batching. The data
+is written to a temporary folder.
+
+Usage: python -m booking.service_load [--clients N] [--requests N]
+                                      [--workers N] [--batch-delay S]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `asyncio` for running the clients.
+- `tempfile` for creating the temporary data folder.
+- `time` for measuring the elapsed time.
+- `set_data_folder` for pointing the collections to the temporary
+   folder.
+- `BookingService` from `booking.service` for serving the clients.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from booking.settings import set_data_folder
+from booking.service import BookingService
+
+
+async def run_client(service, client, requests):
+    """
+    run_client: Creates a customer, reserves rooms for it and reads the
+    reservations back. Returns the number of operations made.
+    """
+    customer_id = f"client-{client}"
+    await service.create_customer(customer_id, customer_id, "555")
+    for number in range(requests):
+        reservation = await service.create_reservation(
+            customer_id, "Load", f"{client}-{number}")
+        await service.get_reservation(reservation.reservation_code)
+    return 1 + 2 * requests
+
+
+async def run_load(clients, requests, workers=None, batch_delay=0,
+                   batching=True):
+    """
+    run_load: Runs the clients concurrently against a new service and
+    returns the operations made, the elapsed seconds and the batches.
+    """
+    async with BookingService(workers, batch_delay, batching) as service:
+        await service.create_hotel("Load", clients * requests, "Local")
+        start = time.perf_counter()
+        counts = await asyncio.gather(*(run_client(service, client, requests)
+                                        for client in range(clients)))
+        elapsed = time.perf_counter() - start
+    return sum(counts), elapsed, service.batches
+
+
+def main(argv=None):
+    """
+    main: Runs the load generator from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the booking service.")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5,
+                        help="reservations made by each client")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-delay", type=float, default=0)
+    arguments = parser.parse_args(argv)
+    for batching in (False, True):
+        with tempfile.TemporaryDirectory() as data_folder:
+            set_data_folder(data_folder)
+            operations, elapsed, batches = asyncio.run(run_load(
+                arguments.clients, arguments.requests, arguments.workers,
+                arguments.batch_delay, batching))
+        set_data_folder(None)
+        mode = "batched" if batching else "unbatched"
+        print(f"{mode}: {operations} operations from {arguments.clients} "
+              f"clients in {elapsed:.3f} s ({operations / elapsed:.0f} "
+              f"ops/s, {batches} batches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+This script holds the data folder of the booking collections, which can
+be set with `set_data_folder` or the BOOKING_DATA_DIR environment
+variable instead of the default one: the data folder of the package in
+a checkout, or a user data folder once the package is installed.
+
+It utilizes the following modules:
+- `os` for handling file paths and reading the environment.
+"""
+import os
+
+PACKAGE_DATA_FOLDER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def default_data_folder(package_folder=PACKAGE_DATA_FOLDER):
+    """
+    default_data_folder: Returns the data folder of the package if it
+    exists, as in a checkout, or else the `booking` folder of the user
+    data directory, so an installed package never writes inside
+    site-packages.
+    """
+    if os.path.isdir(package_folder):
+        return package_folder
+    base = (os.environ.get("XDG_DATA_HOME")
+            or os.environ.get("LOCALAPPDATA")
+            or os.path.join(os.path.expanduser("~"), ".local", "share"))
+    return os.path.join(base, "booking")
+
+
+DEFAULT_DATA_FOLDER = default_data_folder()
+
+_settings = {"data_folder": None}
+
+
+def get_data_folder():
+    """
+    get_data_folder: Returns the absolute path of the data folder.
+    """
+    folder = (_settings["data_folder"]
+              or os.environ.get("BOOKING_DATA_DIR")
+              or DEFAULT_DATA_FOLDER)
+    return os.path.abspath(folder)
+
+
+def set_data_folder(folder):
+    """
+    set_data_folder: Sets the data folder of the collections used from
+    now on, or restores the default one if `folder` is None.
+    """
+    _settings["data_folder"] = folder
+
+
+class DataPath:
+    """
+    Class to resolve a class attribute to a path in the current data
+    folder each time it is read, so the folder can be changed after the
+    class is defined. Assigning the attribute on the class replaces it
+    with a fixed path.
+
+    Attributes:
+        name (str): The file name inside the data folder, or None for
+        the data folder itself.
+    """
+
+    def __init__(self, name=None):
+        """
+        __init__: Initializes the path of a file in the data folder.
+        """
+        self.name = name
+
+    def __get__(self, instance, owner):
+        """
+        __get__: Returns the path in the current data folder.
+        """
+        folder = get_data_folder()
+        return folder if self.name is None else os.path.join(folder,
+                                                             self.name)
@@ -0,0 +1,206 @@
+"""
+This script defines the archive of a collection: dated JSON Lines files,
+optionally gzip-compressed, holding the records moved out of it.
+
+It utilizes the following modules:
+- `datetime` for naming the archive files after the day.
+- `gzip` for compressing the archive files.
+- `os` for handling file paths.
+- `threading` for guarding the cached archive files.
+- `serialization` from `booking.storage` for encoding and decoding the
+   records.
+- `get_lock` from `booking.storage.locking` for serializing the writers
+   of the archive.
+"""
+import datetime
+import gzip
+import os
+import threading
+from booking.storage import serialization
+from booking.storage.locking import get_lock
+
+
+class Archive:
+    """
+    Class to keep the records moved out of a collection, so the
+    collection stays small while old records can still be found.
+
+    The archive lives in a folder next to the collection file (e.g.
+    `reservations_archive/` for reservations.json) with one JSON Lines
+    file per day, `YYYY-MM-DD.jsonl` or `YYYY-MM-DD.jsonl.gz`. Each
+    archiving appends one gzip member or one block of lines, so both
+    kinds of files can be appended to.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection.
+        key_field (str): The record field used as key.
+        folder (str): The folder of the archive files.
+        compress (bool): Whether new records are written gzip-compressed.
+    """
+
+    def __init__(self, file_path, key_field, compress=False):
+        """
+        __init__: Initializes the archive of a collection.
+        """
+        self.file_path = os.path.abspath(file_path)
+        self.key_field = key_field
+        self.folder = os.path.splitext(self.file_path)[0] + "_archive"
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def lock(self):
+        """
+        lock: Returns the inter-process lock of the archive.
+        """
+        return get_lock(self.folder + ".lock")
+
+    def path_for(self, day):
+        """
+        path_for: Returns the archive file of a day.
+        """
+        extension = ".jsonl.gz" if self.compress else ".jsonl"
+        return os.path.join(self.folder, day.isoformat() + extension)
+
+    def files(self):
+        """
+        files: Returns the archive files, newest first.
+        """
+        if not os.path.isdir(self.folder):
+            return []
+        names = [name for name in os.listdir(self.folder)
+                 if name.endswith((".jsonl", ".jsonl.gz"))]
+        return [os.path.join(self.folder, name)
+                for name in sorted(names, reverse=True)]
+
+    def append(self, records, day=None):
+        """
+        append: Appends records to the archive file of a day (by default,
+        today) with a single write, flushed to disk.
+        """
+        if not records:
+            return
+        data = b"".join(serialization.dumps(record) + b"\n"
+                        for record in records)
+        if self.compress:
+            data = gzip.compress(data)
+        path = self.path_for(day or datetime.date.today())
+        with self.lock():
+            if not os.path.exists(self.folder):
+                os.makedirs(self.folder)
+            with open(path, 'ab') as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+        for archive in _archives.values():
+            if archive.folder == self.folder:
+                archive.forget(path)
+
+    def forget(self, path):
+        """
+        forget: Drops the cached keys of an archive file, so the next
+        lookup reads it again.
+        """
+        with self._lock:
+            self._cache.pop(path, None)
+
+    @staticmethod
+    def read_file(path):
+        """
+        read_file: Returns the records of an archive file.
+        """
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rb') as file:
+            return [serialization.loads(line) for line in file
+                    if line.strip()]
+
+    def _keys(self, path):
+        """
+        _keys: Returns the first record of each key in an archive file,
+        reading the file again only if it changed.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        keys = {}
+        for record in self.read_file(path):
+            keys.setdefault(record.get(self.key_field), record)
+        with self._lock:
+            self._cache[path] = (signature, keys)
+        return keys
+
+    def records(self):
+        """
+        records: Returns every archived record, oldest file first.
+        """
+        return [record for path in reversed(self.files())
+                for record in self.read_file(path)]
+
+    def get(self, key):
+        """
+        get: Returns a copy of the archived record with the key, from the
+        newest file holding it, or None.
+        """
+        for path in self.files():
+            try:
+                record = self._keys(path).get(key)
+            except FileNotFoundError:
+                continue
+            if record is not None:
+                return dict(record)
+        return None
+
+
+_archives = {}
+
+
+def get_archive(file_path, key_field, compress=False):
+    """
+    get_archive: Returns the shared archive of a JSON file, so the keys
+    it caches are reused by every lookup.
+    """
+    path = os.path.abspath(file_path)
+    archive = _archives.get((path, compress))
+    if archive is None:
+        archive = Archive(path, key_field, compress)
+        _archives[(path, compress)] = archive
+    return archive
+
+
+def archive_records(repository, archive, predicate, day=None):
+    """
+    archive_records: Moves the records of a repository for which the
+    predicate returns true to the archive, and returns how many were
+    moved. The records are appended to the archive before they are
+    removed, so a crash in between can only leave them in both places.
+    Keys with some record not matching the predicate are kept, since
+    deletes act on the first record of a key.
+    """
+    with repository.batch(exclusive=True):
+        groups = {}
+        for record in repository.records():
+            groups.setdefault(record.get(repository.key_field),
+                              []).append(record)
+        moved = [(key, records) for key, records in groups.items()
+                 if all(predicate(record) for record in records)]
+        archive.append([record for _, records in moved
+                        for record in records], day)
+        for key, records in moved:
+            for _ in records:
+                repository.delete(key)
+    return sum(len(records) for _, records in moved)
+
+
+def _reset_after_fork():
+    """
+    _reset_after_fork: Drops the archives inherited by a forked child,
+    whose locks may be held by threads of the parent.
+    """
+    _archives.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,76 @@
+"""
+This script defines the interface implemented by the storage backends
+of the booking repositories.
+
+It utilizes the following modules:
+- `get_lock` from `booking.storage.locking` for the lock of a collection.
+"""
+from booking.storage.locking import get_lock
+
+
+class StorageBackend:
+    """
+    Class to describe how a repository persists one collection.
+
+    A repository loads the records of its backend once, keeps them in
+    memory and hands every mutation to the backend as an operation: a
+    dict with the `op` name ("create", "update", "delete" or "cancel"),
+    the `key` of the record it refers to and the new `record` (None for
+    deletes). Operations on a key act on the first record with that key.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection,
+        used by backends to locate their own files.
+        key_field (str): The record field used as key.
+    """
+
+    def __init__(self, file_path, key_field=None):
+        """
+        __init__: Initializes the backend of a collection.
+        """
+        self.file_path = file_path
+        self.key_field = key_field
+
+    def lock(self):
+        """
+        lock: Returns the inter-process lock of the collection, held by
+        repositories while they load or write it.
+        """
+        return get_lock(self.file_path + ".lock")
+
+    def signature(self):
+        """
+        signature: Returns a value that changes whenever the stored
+        collection is changed by someone else.
+        """
+        raise NotImplementedError
+
+    def load(self):
+        """
+        load: Returns the stored records and the operations still to be
+        applied on top of them.
+        """
+        raise NotImplementedError
+
+    def read_new_operations(self):
+        """
+        read_new_operations: Returns the operations stored by others
+        since the last load, or None if a full load is needed.
+        """
+        return None
+
+    def apply(self, operation, snapshot):
+        """
+        apply: Persists an operation already applied in memory. The
+        snapshot argument returns every record of the collection, for
+        backends that rewrite it as a whole.
+        """
+        raise NotImplementedError
+
+    def apply_many(self, operations, snapshot):
+        """
+        apply_many: Persists several operations already applied in
+        memory. Backends override it to store them in a single write.
+        """
+        for operation in operations:
+            self.apply(operation, snapshot)
@@ -0,0 +1,98 @@
+"""
+This script defines a bounded cache of the records of a collection by
+key, kept up to date by the repository.
+
+It utilizes the following modules:
+- `collections` for the least recently used order of the entries.
+- `threading` for guarding the entries and the statistics.
+"""
+import collections
+import threading
+
+CACHE_SIZE = 1024
+
+
+class RecordCache:
+    """
+    Class to keep the most recently looked up records of a collection,
+    so repeated lookups of the same keys are served without searching
+    the collection or copying it.
+
+    The cache is a secondary index of the repository: every record added
+    or removed by a mutation, or by a change read from disk, invalidates
+    the entry of its key, and a full reload clears it. Lookups of keys
+    without a record are cached too, until a record with the key is
+    added.
+
+    Attributes:
+        key_field (str): The field holding the key of the records.
+        maxsize (int): The number of keys kept, evicting the least
+        recently used first.
+        hits (int): The lookups served from the cache.
+        misses (int): The lookups that had to read the collection.
+        evictions (int): The entries dropped to make room.
+    """
+
+    def __init__(self, key_field, maxsize=CACHE_SIZE):
+        """
+        __init__: Initializes an empty cache.
+        """
+        self.key_field = key_field
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """
+        clear: Drops every entry of the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def add(self, record):
+        """
+        add: Invalidates the entry of the key of an added record.
+        """
+        with self._lock:
+            self._entries.pop(record.get(self.key_field), None)
+
+    def remove(self, record):
+        """
+        remove: Invalidates the entry of the key of a removed record.
+        """
+        with self._lock:
+            self._entries.pop(record.get(self.key_field), None)
+
+    def lookup(self, key, loader):
+        """
+        lookup: Returns a copy of the cached record of a key, or None if
+        there is no such record, calling `loader(key)` on a miss. The
+        caller must keep the collection from changing during the call.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                record = self._entries[key]
+                return None if record is None else dict(record)
+            self.misses += 1
+        record = loader(key)
+        with self._lock:
+            self._entries[key] = record
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return None if record is None else dict(record)
+
+    def stats(self):
+        """
+        stats: Returns the hits, misses, evictions, size and maximum size
+        of the cache.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions,
+                    "size": len(self._entries), "maxsize": self.maxsize}
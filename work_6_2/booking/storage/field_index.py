@@ -0,0 +1,79 @@
+"""
+This script defines a secondary index of a collection by the value of
+one of its fields, kept up to date by the repository.
+
+It utilizes the `bisect` module for keeping the keys of each value in
+file order.
+"""
+import bisect
+
+
+class FieldIndex:
+    """
+    Class to keep, for each value of a field, the keys of the records
+    having it, so records can be found by that field without a scan.
+
+    Attributes:
+        field (str): The indexed field.
+        key_field (str): The field holding the key of the records.
+        predicate (callable): If given, only the records for which it
+        returns true are indexed.
+        position (callable): Returns the position of a key in the
+        collection, such as `Repository.position`.
+        keys (dict): For each value of the field, the (position, key)
+        pairs of the indexed records having it, in file order, which an
+        update does not change.
+    """
+
+    def __init__(self, field, key_field, position, predicate=None):
+        """
+        __init__: Initializes an empty index of a field.
+        """
+        self.field = field
+        self.key_field = key_field
+        self.position = position
+        self.predicate = predicate
+        self.keys = {}
+
+    def clear(self):
+        """
+        clear: Removes every record from the index.
+        """
+        self.keys = {}
+
+    def add(self, record):
+        """
+        add: Adds a record to the index.
+        """
+        if self.predicate is not None and not self.predicate(record):
+            return
+        key = record.get(self.key_field)
+        bisect.insort(self.keys.setdefault(record.get(self.field), []),
+                      (self.position(key), key))
+
+    def remove(self, record):
+        """
+        remove: Removes a record from the index, found by binary search.
+        The repository calls it before moving or deleting the record, so
+        its position is still the one it was added with.
+        """
+        if self.predicate is not None and not self.predicate(record):
+            return
+        value = record.get(self.field)
+        key = record.get(self.key_field)
+        keys = self.keys[value]
+        del keys[bisect.bisect_left(keys, (self.position(key), key))]
+        if not keys:
+            del self.keys[value]
+
+    def lookup(self, value):
+        """
+        lookup: Returns the keys of the indexed records with a value.
+        """
+        return [key for _, key in self.keys.get(value, ())]
+
+    def counts(self):
+        """
+        counts: Returns the number of indexed records for each value.
+        """
+        return {value: len(keys) for value, keys in self.keys.items()}
@@ -0,0 +1,100 @@
+"""
+This script utilizes the following modules:
+- `os` for interacting with the operating system.
+- `serialization` from `booking.storage` for encoding and decoding JSON
+   data.
+- `StorageBackend` from `booking.storage.backend` for the backend
+   interface.
+"""
+import os
+from booking.storage import serialization
+from booking.storage.backend import StorageBackend
+
+
+class JsonStorage(StorageBackend):
+    """
+    Class to persist a collection as a single JSON file that is
+    rewritten on every mutation.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection.
+        key_field (str): The record field used as key.
+        indent (int): The indentation of the written file, or None to
+        write compact JSON.
+    """
+
+    def __init__(self, file_path, key_field=None, indent=None):
+        """
+        __init__: Initializes the storage of a JSON file.
+        """
+        super().__init__(file_path, key_field)
+        self.indent = indent
+
+    @staticmethod
+    def stat_signature(path):
+        """
+        stat_signature: Returns the modification time, size and inode of
+        a file, or None if it does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def signature(self):
+        """
+        signature: Returns a value that changes whenever the stored
+        collection changes on disk.
+        """
+        return self.stat_signature(self.file_path)
+
+    def read_snapshot(self):
+        """
+        read_snapshot: Reads the records of the JSON file.
+        """
+        if not os.path.exists(self.file_path):
+            return []
+        with open(self.file_path, 'rb') as file:
+            return serialization.loads(file.read())
+
+    def write_snapshot(self, records):
+        """
+        write_snapshot: Writes the records to a temporary file, flushes
+        it to disk and then renames it over the JSON file, so neither
+        readers nor a crash can leave a partially written file.
+        """
+        folder = os.path.dirname(self.file_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        temp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(serialization.dumps(records, self.indent))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def load(self):
+        """
+        load: Returns the stored records and the operations still to be
+        applied on top of them.
+        """
+        return self.read_snapshot(), []
+
+    def apply(self, operation, snapshot):  # pylint: disable=unused-argument
+        """
+        apply: Persists an operation already applied in memory. The
+        snapshot argument returns every record of the collection.
+        """
+        self.write_snapshot(snapshot())
+
+    def apply_many(self, operations, snapshot):
+        """
+        apply_many: Persists several operations with a single write.
+        """
+        if operations:
+            self.write_snapshot(snapshot())
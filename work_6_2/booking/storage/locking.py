@@ -0,0 +1,110 @@
+"""
+This script utilizes the following modules:
+- `fcntl` for locking files across processes, when available.
+- `os` for interacting with the operating system.
+- `threading` for serializing the threads of the current process.
+"""
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class FileLock:
+    """
+    Class to hold an exclusive lock on a lock file, shared by the
+    threads of this process and by other processes.
+
+    The lock is reentrant for the thread holding it. Other processes are
+    excluded with `fcntl.flock`; on platforms without `fcntl` the lock
+    only serializes the threads of the current process.
+
+    Attributes:
+        path (str): The path of the lock file.
+    """
+
+    def __init__(self, path):
+        """
+        __init__: Initializes a lock on a lock file.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self):
+        """
+        acquire: Waits until the lock is free and takes it.
+        """
+        self._lock.acquire()
+        if self._depth == 0:
+            try:
+                if self._file is None:
+                    folder = os.path.dirname(self.path)
+                    if folder and not os.path.exists(folder):
+                        os.makedirs(folder)
+                    # pylint: disable=consider-using-with
+                    self._file = open(self.path, 'a+b')
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                self._lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """
+        release: Releases the lock once for each time it was acquired.
+        """
+        self._depth -= 1
+        if self._depth == 0 and fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._lock.release()
+
+    def __enter__(self):
+        """
+        __enter__: Acquires the lock.
+        """
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        __exit__: Releases the lock.
+        """
+        self.release()
+
+
+_locks = {}
+_locks_lock = threading.Lock()
+
+
+def get_lock(path):
+    """
+    get_lock: Returns the lock of a lock file, shared by every user of
+    the same path in this process.
+    """
+    path = os.path.abspath(path)
+    with _locks_lock:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = FileLock(path)
+            _locks[path] = lock
+        return lock
+
+
+def _reset_after_fork():
+    """
+    _reset_after_fork: Drops the locks inherited by a forked child. Their
+    files are shared with the parent, so `flock` would not exclude it.
+    """
+    global _locks_lock  # pylint: disable=global-statement
+    _locks_lock = threading.Lock()
+    _locks.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,181 @@
+"""
+This script utilizes the following modules:
+- `os` for interacting with the operating system.
+- `serialization` from `booking.storage` for encoding and decoding JSON
+   data.
+- `JsonStorage` from `booking.storage.json_storage` for the snapshot file.
+"""
+import os
+from booking.storage import serialization
+from booking.storage.json_storage import JsonStorage
+
+COMPACT_EVERY = 1000
+
+
+class LogStorage(JsonStorage):
+    """
+    Class to persist a collection as a JSON snapshot plus an append-only
+    log of the operations applied after it, so each mutation appends a
+    single line instead of rewriting the whole file.
+
+    The log is compacted into the snapshot every `compact_every`
+    operations. Compaction writes the new snapshot to `<file>.compact`,
+    moves the log aside to `<file>.log.old`, replaces the snapshot and
+    then drops the old log, so a crash at any step can be recovered
+    from without losing or replaying operations twice.
+
+    Attributes:
+        file_path (str): The path of the JSON snapshot.
+        key_field (str): The record field used as key.
+        log_path (str): The path of the operation log.
+        compact_every (int): The number of logged operations that
+        triggers a compaction.
+        fsync (bool): Whether each appended operation is flushed to disk.
+    """
+
+    def __init__(self, file_path, key_field=None,
+                 compact_every=COMPACT_EVERY, fsync=False, indent=None):
+        """
+        __init__: Initializes the storage of a snapshot and its log.
+        """
+        super().__init__(file_path, key_field, indent)
+        self.log_path = file_path + ".log"
+        self.old_log_path = self.log_path + ".old"
+        self.compact_path = file_path + ".compact"
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._snapshot_signature = None
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_entries = 0
+
+    def signature(self):
+        """
+        signature: Returns a value that changes whenever the snapshot or
+        the log change on disk.
+        """
+        return (self.stat_signature(self.file_path),
+                self.stat_signature(self.log_path))
+
+    def _recover(self):
+        """
+        _recover: Finishes or rolls back a compaction interrupted by a
+        crash.
+        """
+        if not os.path.exists(self.old_log_path):
+            if os.path.exists(self.compact_path):
+                os.remove(self.compact_path)
+            return
+        if os.path.exists(self.compact_path):
+            # The snapshot was not replaced: the old log still applies.
+            with open(self.old_log_path, 'ab') as old_log:
+                if os.path.exists(self.log_path):
+                    with open(self.log_path, 'rb') as log:
+                        old_log.write(log.read())
+            os.replace(self.old_log_path, self.log_path)
+            os.remove(self.compact_path)
+        else:
+            os.remove(self.old_log_path)
+
+    def _read_log(self, offset):
+        """
+        _read_log: Reads the operations logged from an offset, stopping
+        before a torn last line. Returns the operations and the offset
+        after the last complete one.
+        """
+        operations = []
+        if not os.path.exists(self.log_path):
+            return operations, 0
+        with open(self.log_path, 'rb') as log:
+            log.seek(offset)
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                operations.append(serialization.loads(line))
+                offset += len(line)
+        return operations, offset
+
+    def load(self):
+        """
+        load: Returns the snapshot records and the logged operations to
+        be applied on top of them.
+        """
+        self._recover()
+        records = self.read_snapshot()
+        operations, offset = self._read_log(0)
+        log_signature = self.stat_signature(self.log_path)
+        self._snapshot_signature = self.stat_signature(self.file_path)
+        self._log_inode = log_signature[2] if log_signature else None
+        self._log_offset = offset
+        self._log_entries = len(operations)
+        return records, operations
+
+    def read_new_operations(self):
+        """
+        read_new_operations: Returns the operations appended by others
+        since the last load, or None if the snapshot was compacted and
+        a full load is needed.
+        """
+        if self.stat_signature(self.file_path) != self._snapshot_signature:
+            return None
+        log_signature = self.stat_signature(self.log_path)
+        if log_signature is None:
+            return [] if self._log_inode is None else None
+        if self._log_inode not in (None, log_signature[2]) \
+                or log_signature[1] < self._log_offset:
+            return None
+        self._log_inode = log_signature[2]
+        operations, self._log_offset = self._read_log(self._log_offset)
+        self._log_entries += len(operations)
+        return operations
+
+    def apply(self, operation, snapshot):
+        """
+        apply: Appends an operation to the log, compacting the log into
+        the snapshot when it grows past `compact_every` operations.
+        """
+        self.apply_many([operation], snapshot)
+
+    def apply_many(self, operations, snapshot):
+        """
+        apply_many: Appends several operations to the log with a single
+        write.
+        """
+        if not operations:
+            return
+        folder = os.path.dirname(self.log_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        data = b"".join(serialization.dumps(operation) + b"\n"
+                        for operation in operations)
+        log_signature = self.stat_signature(self.log_path)
+        if log_signature and log_signature[1] > self._log_offset:
+            # A writer crashed in the middle of a line: drop it.
+            os.truncate(self.log_path, self._log_offset)
+        with open(self.log_path, 'ab') as log:
+            log.write(data)
+            log.flush()
+            if self.fsync:
+                os.fsync(log.fileno())
+            self._log_inode = os.fstat(log.fileno()).st_ino
+        self._log_offset += len(data)
+        self._log_entries += len(operations)
+        if self._log_entries >= self.compact_every:
+            self.compact(snapshot())
+
+    def compact(self, records):
+        """
+        compact: Writes the records as the new snapshot and empties the
+        log.
+        """
+        temp_storage = JsonStorage(self.compact_path)
+        temp_storage.write_snapshot(records)
+        if os.path.exists(self.log_path):
+            os.replace(self.log_path, self.old_log_path)
+        os.replace(self.compact_path, self.file_path)
+        if os.path.exists(self.old_log_path):
+            os.remove(self.old_log_path)
+        self._snapshot_signature = self.stat_signature(self.file_path)
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_entries = 0
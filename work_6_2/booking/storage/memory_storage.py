@@ -0,0 +1,161 @@
+"""
+This script utilizes the following modules:
+- `bisect` for keeping the rows of each key in order.
+- `itertools` for numbering the versions of the collections.
+- `os` for interacting with the operating system.
+- `threading` for serializing the writers of a collection.
+- `StorageBackend` from `booking.storage.backend` for the backend
+   interface.
+"""
+import bisect
+import itertools
+import os
+import threading
+from booking.storage.backend import StorageBackend
+
+_collections = {}
+_locks = {}
+_lock = threading.Lock()
+_versions = itertools.count(1)
+
+
+class _Collection:
+    """
+    Class to hold the stored records of a collection, with the rows of
+    each key, so operations are applied without copying the others.
+
+    Attributes:
+        key_field (str): The record field used as key.
+        version (int): The version of the last write.
+        rows (dict): The records by row number, in order.
+        keys (dict): For each key, the sorted rows holding it.
+    """
+
+    def __init__(self, key_field):
+        """
+        __init__: Initializes an empty collection.
+        """
+        self.key_field = key_field
+        self.version = None
+        self.rows = {}
+        self.keys = {}
+        self._next_row = 0
+
+    def apply(self, operation):
+        """
+        apply: Applies an operation to the first record with its key,
+        storing a copy of the new record.
+        """
+        if operation["op"] == "create":
+            record = dict(operation["record"])
+            self.rows[self._next_row] = record
+            self.keys.setdefault(record.get(self.key_field),
+                                 []).append(self._next_row)
+            self._next_row += 1
+            return
+        key = operation["key"]
+        rows = self.keys.get(key)
+        if not rows:
+            return
+        row = rows[0]
+        if operation["op"] == "delete":
+            del self.rows[row]
+        else:
+            record = self.rows[row] = dict(operation["record"])
+            new_key = record.get(self.key_field)
+            if new_key == key:
+                return
+            bisect.insort(self.keys.setdefault(new_key, []), row)
+        del rows[0]
+        if not rows:
+            del self.keys[key]
+
+
+class MemoryStorage(StorageBackend):
+    """
+    Class to keep a collection in the memory of the current process,
+    without touching the disk, e.g. for isolated tests.
+
+    Collections are shared by every repository of the same file path in
+    the process and are lost when it exits. Each write applies its
+    operations to the stored records, copying only the records it
+    stores, under a new version, which is the signature.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection,
+        used only to name it.
+        key_field (str): The record field used as key.
+    """
+
+    def lock(self):
+        """
+        lock: Returns the lock of the collection, shared by the threads
+        of this process.
+        """
+        with _lock:
+            lock = _locks.get(self.file_path)
+            if lock is None:
+                lock = _locks[self.file_path] = threading.RLock()
+            return lock
+
+    def signature(self):
+        """
+        signature: Returns the version of the collection, or None if it
+        was never written.
+        """
+        with _lock:
+            stored = _collections.get(self.file_path)
+        return None if stored is None else stored.version
+
+    def load(self):
+        """
+        load: Returns a copy of the stored records and no operations.
+        """
+        with _lock:
+            stored = _collections.get(self.file_path)
+            records = [] if stored is None else list(stored.rows.values())
+        return [dict(record) for record in records], []
+
+    def apply(self, operation, snapshot):
+        """
+        apply: Applies an operation to the stored records.
+        """
+        self.apply_many([operation], snapshot)
+
+    def apply_many(self, operations, snapshot):
+        """
+        apply_many: Applies several operations to the stored records as
+        one new version.
+        """
+        if not operations:
+            return
+        with _lock:
+            stored = _collections.get(self.file_path)
+            if stored is None:
+                stored = _collections[self.file_path] = _Collection(
+                    self.key_field)
+            for operation in operations:
+                stored.apply(operation)
+            stored.version = next(_versions)
+
+
+def clear_memory():
+    """
+    clear_memory: Drops every collection kept in memory.
+    """
+    with _lock:
+        _collections.clear()
+
+
+def _reset_after_fork():
+    """
+    _reset_after_fork: Drops the locks inherited by a forked child, which
+    may be held by threads of the parent.
+    """
+    global _lock  # pylint: disable=global-statement
+    _lock = threading.Lock()
+    _locks.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
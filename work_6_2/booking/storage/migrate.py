@@ -0,0 +1,81 @@
+"""
+This script copies the booking collections from their JSON files into
+the SQLite storage backend.
+
+Usage: python -m booking.storage.migrate [--data-folder FOLDER]
+                                         [--database FILE]
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `os` for interacting with the operating system.
+- `get_data_folder` for the default data folder.
+- `LogStorage` for reading the JSON files, including the operations
+   logged by the log storage engine that were not compacted yet.
+- `Repository` for replaying those operations.
+- `SqliteStorage` for writing the collections to the database.
+"""
+import argparse
+import os
+from booking.settings import get_data_folder
+from booking.storage.log_storage import LogStorage
+from booking.storage.repository import Repository
+from booking.storage.sqlite_storage import SqliteStorage, database_path
+
+COLLECTIONS = {
+    "customers.json": "customer_id",
+    "hotels.json": "name",
+    "reservations.json": "reservation_code"
+}
+
+
+def migrate_collection(file_path, key_field, database):
+    """
+    migrate_collection: Replaces the table of a collection with the
+    records of its JSON file. Returns the number of records copied.
+    """
+    repository = Repository(file_path, key_field,
+                            LogStorage(file_path, key_field))
+    records = repository.records()
+    SqliteStorage(file_path, key_field, database).replace_all(records)
+    return len(records)
+
+
+def migrate(data_folder=None, database=None):
+    """
+    migrate: Copies every collection found in the data folder (by
+    default, the configured one) into the database. Returns the number
+    of records copied per collection file.
+    """
+    data_folder = data_folder or get_data_folder()
+    counts = {}
+    for file_name, key_field in COLLECTIONS.items():
+        file_path = os.path.join(data_folder, file_name)
+        if not os.path.exists(file_path):
+            continue
+        counts[file_name] = migrate_collection(
+            file_path, key_field, database or database_path(file_path))
+    return counts
+
+
+def main(argv=None):
+    """
+    main: Runs the migration from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Copy the booking JSON files into SQLite.")
+    parser.add_argument("--data-folder", default=get_data_folder(),
+                        help="folder with customers.json, hotels.json "
+                             "and reservations.json")
+    parser.add_argument("--database",
+                        help="SQLite database (default: booking.sqlite3 "
+                             "in the data folder)")
+    arguments = parser.parse_args(argv)
+    counts = migrate(arguments.data_folder, arguments.database)
+    for file_name, count in counts.items():
+        print(f"{file_name}: {count} records")
+    if not counts:
+        print(f"No collections found in {arguments.data_folder}")
+
+
+if __name__ == "__main__":
+    main()
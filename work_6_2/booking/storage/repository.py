@@ -0,0 +1,513 @@
+"""
+This script utilizes the following modules:
+- `bisect` for keeping the rows of each key in file order.
+- `contextlib` for the batch context manager.
+- `os` for interacting with the operating system.
+- `threading` for coordinating the threads sharing a repository.
+- `RecordCache` for the cached lookups of records by key.
+- `JsonStorage`, `LogStorage`, `SqliteStorage` and `MemoryStorage` for
+   persisting the collections.
+"""
+import bisect
+import contextlib
+import os
+import threading
+from booking.storage.cache import RecordCache
+from booking.storage.json_storage import JsonStorage
+from booking.storage.log_storage import LogStorage
+from booking.storage.memory_storage import MemoryStorage
+from booking.storage.sqlite_storage import SqliteStorage
+
+STORAGE_ENGINES = {
+    "json": JsonStorage,
+    "log": LogStorage,
+    "sqlite": SqliteStorage,
+    "memory": MemoryStorage
+}
+
+
+class Repository:
+    """
+    Class to keep a collection of records loaded in memory and indexed
+    by key, so lookups and mutations do not re-read the JSON file.
+
+    The collection is loaded once and served from memory until it
+    changes on disk. Records sharing a key (e.g. a customer saved twice)
+    are kept in file order, and lookups, updates and deletes act on the
+    first of them, like the linear scans they replace.
+
+    Every mutation is applied in memory and then handed to the storage
+    as an operation: a dict with the `op` name ("create", "update",
+    "delete" or "cancel"), the `key` of the record and the new `record`.
+    Mutations are committed holding the inter-process lock of the
+    storage, after reloading any change made by other processes, and
+    concurrent mutations are coalesced into a single write.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection.
+        key_field (str): The record field used as key.
+        storage (StorageBackend): The storage engine of the collection.
+    """
+
+    def __init__(self, file_path, key_field, storage=None):
+        """
+        __init__: Initializes an empty repository for a JSON file.
+        """
+        self.file_path = file_path
+        self.key_field = key_field
+        self.storage = storage or JsonStorage(file_path, key_field)
+        self._rows = {}
+        self._index = {}
+        self._indexes = {}
+        self._next_row = 0
+        self._signature = None
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._commit_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._queue = []
+        self._local = threading.local()
+
+    def _add_row(self, record):
+        """
+        _add_row: Adds a record at the end of the collection.
+        """
+        row = self._next_row
+        self._next_row += 1
+        self._rows[row] = record
+        self._index.setdefault(record.get(self.key_field), []).append(row)
+        for index in self._indexes.values():
+            index.add(record)
+
+    def _first_row(self, key):
+        """
+        _first_row: Returns the row of the first record with the key,
+        or None if there is none.
+        """
+        rows = self._index.get(key)
+        return rows[0] if rows else None
+
+    def _remove_from_index(self, key, row):
+        """
+        _remove_from_index: Removes a row from the rows of a key.
+        """
+        rows = self._index[key]
+        rows.remove(row)
+        if not rows:
+            del self._index[key]
+
+    def _apply(self, operation):
+        """
+        _apply: Applies an operation to the records in memory. Returns
+        whether the record it refers to was found.
+        """
+        if operation["op"] == "create":
+            self._add_row(dict(operation["record"]))
+            return True
+        key = operation["key"]
+        row = self._first_row(key)
+        if row is None:
+            return False
+        old_record = self._rows[row]
+        for index in self._indexes.values():
+            index.remove(old_record)
+        if operation["op"] == "delete":
+            del self._rows[row]
+            self._remove_from_index(key, row)
+            return True
+        record = dict(operation["record"])
+        new_key = record.get(self.key_field)
+        if new_key != key:
+            self._remove_from_index(key, row)
+            bisect.insort(self._index.setdefault(new_key, []), row)
+        self._rows[row] = record
+        for index in self._indexes.values():
+            index.add(record)
+        return True
+
+    def _snapshot(self):
+        """
+        _snapshot: Returns every record of the collection, in order.
+        """
+        return list(self._rows.values())
+
+    def _reload(self):
+        """
+        _reload: Reads the changes of the storage into memory, or the
+        whole collection if they cannot be read incrementally.
+        """
+        operations = None
+        if self._loaded:
+            operations = self.storage.read_new_operations()
+        if operations is None:
+            records, operations = self.storage.load()
+            self._rows = {}
+            self._index = {}
+            for index in self._indexes.values():
+                index.clear()
+            for record in records:
+                self._add_row(record)
+        for operation in operations:
+            self._apply(operation)
+        self._signature = self.storage.signature()
+        self._loaded = True
+
+    def refresh(self):
+        """
+        refresh: Loads the collection if it was not loaded yet or if it
+        changed on disk since it was last read or written. Inside a
+        batch, the thread keeps reading its own uncommitted changes.
+        """
+        with self._lock:
+            if self._batch_changes() is not None:
+                return
+            if self._loaded and self.storage.signature() == self._signature:
+                return
+            with self.storage.lock():
+                self._reload()
+
+    def get_index(self, name, factory):
+        """
+        get_index: Returns a secondary index of the collection, building
+        it on first use with `factory()`. The index is an object with
+        `clear`, `add(record)` and `remove(record)` methods, which the
+        repository calls to keep it up to date on every change of the
+        records; it must not modify the records it is given.
+        """
+        self.refresh()
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is None:
+                index = factory()
+                for record in self._rows.values():
+                    index.add(record)
+                self._indexes[name] = index
+            return index
+
+    def _batch_changes(self):
+        """
+        _batch_changes: Returns the changes buffered by the batch of the
+        calling thread, or None if it is not inside a batch.
+        """
+        return getattr(self._local, "changes", None)
+
+    def in_batch(self):
+        """
+        in_batch: Returns whether the calling thread is inside a batch.
+        """
+        return self._batch_changes() is not None
+
+    def _resolve(self, change):
+        """
+        _resolve: Turns a change into an operation on the records in
+        memory, or None if the record it refers to does not exist.
+        """
+        op, key, value = change
+        if op == "create":
+            return {"op": op, "key": key, "record": dict(value)}
+        row = self._first_row(key)
+        if row is None:
+            return None
+        if op == "delete":
+            return {"op": op, "key": key, "record": None}
+        record = dict(self._rows[row])
+        record.update(value)
+        return {"op": op, "key": key, "record": record}
+
+    def _apply_changes(self, changes):
+        """
+        _apply_changes: Applies changes to the records in memory. Returns
+        the resulting operations and whether each change found its
+        record.
+        """
+        operations = []
+        results = []
+        for change in changes:
+            operation = self._resolve(change)
+            results.append(operation is not None)
+            if operation is not None:
+                self._apply(operation)
+                operations.append(operation)
+        return operations, results
+
+    def _persist(self, operations):
+        """
+        _persist: Hands operations already applied in memory to the
+        storage. If that fails, the records are reloaded on next use.
+        """
+        try:
+            self.storage.apply_many(operations, self._snapshot)
+        except BaseException:
+            self._loaded = False
+            raise
+        self._signature = self.storage.signature()
+
+    def _commit(self, changes):
+        """
+        _commit: Applies changes to the latest version of the collection
+        and persists them with a single write, holding the storage lock
+        so that no other process writes in between. Returns whether each
+        change found its record.
+        """
+        with self._lock, self.storage.lock():
+            self.refresh()
+            operations, results = self._apply_changes(changes)
+            self._persist(operations)
+        return results
+
+    def _submit(self, change):
+        """
+        _submit: Commits a change and returns whether it found its record.
+
+        Changes submitted by several threads while a write is running are
+        queued and committed together by the next thread to get the
+        commit lock, so concurrent writers share a single write. Inside a
+        batch, the change is applied in memory and buffered instead.
+        """
+        buffered = self._batch_changes()
+        if buffered is not None:
+            operations, results = self._apply_changes([change])
+            buffered.append((change, operations))
+            return results[0]
+        pending = _PendingChange(change)
+        with self._queue_lock:
+            self._queue.append(pending)
+        with self._commit_lock:
+            if not pending.done:
+                with self._queue_lock:
+                    queue, self._queue = self._queue, []
+                try:
+                    results = self._commit([item.change for item in queue])
+                except BaseException as e:
+                    for item in queue:
+                        item.finish(error=e)
+                    raise
+                for item, result in zip(queue, results):
+                    item.finish(result)
+        return pending.outcome()
+
+    @contextlib.contextmanager
+    def batch(self, exclusive=False):
+        """
+        batch: Groups the mutations made by the calling thread inside the
+        block into a single write at its end.
+
+        The collection is reserved for the thread during the block and
+        each mutation is applied in memory right away. At the end, if no
+        other process wrote the collection since the block started, the
+        resulting operations are written as they are; otherwise the
+        collection is reloaded and the mutations are applied again on top
+        of the new version (optimistic concurrency). With `exclusive`,
+        the storage lock is held for the whole block instead, so checks
+        made inside it cannot be invalidated by other processes. If the
+        block raises, its mutations are discarded.
+        """
+        if self._batch_changes() is not None:
+            yield self
+            return
+        storage_lock = (self.storage.lock() if exclusive
+                        else contextlib.nullcontext())
+        with self._lock, storage_lock:
+            self.refresh()
+            base_signature = self._signature
+            buffered = []
+            self._local.changes = buffered
+            try:
+                yield self
+            except BaseException:
+                self._loaded = False
+                raise
+            finally:
+                self._local.changes = None
+            operations = [operation for _, items in buffered
+                          for operation in items]
+            with self.storage.lock():
+                if self.storage.signature() == base_signature:
+                    self._persist(operations)
+                else:
+                    self._loaded = False
+                    self._commit([change for change, _ in buffered])
+
+    def records(self):
+        """
+        records: Returns a copy of every record, in file order.
+        """
+        self.refresh()
+        with self._lock:
+            return [dict(record) for record in self._rows.values()]
+
+    def get(self, key):
+        """
+        get: Returns a copy of the first record with the key, or None.
+        """
+        self.refresh()
+        with self._lock:
+            row = self._first_row(key)
+            return None if row is None else dict(self._rows[row])
+
+    def cached_get(self, key):
+        """
+        cached_get: Returns a copy of the first record with the key, or
+        None, through the cache of the repository. The cache follows
+        every change of the collection, including those made on disk by
+        other processes, which are detected before each lookup.
+        """
+        cache = self.get_index("cache", lambda: RecordCache(self.key_field))
+        with self._lock:
+            return cache.lookup(key, self.get)
+
+    def cache_stats(self):
+        """
+        cache_stats: Returns the hit and miss statistics of the cache.
+        """
+        return self.get_index(
+            "cache", lambda: RecordCache(self.key_field)).stats()
+
+    def position(self, key):
+        """
+        position: Returns the row of the first record with the key, which
+        orders the records in file order, or None if there is none. It
+        does not refresh the repository, so indexes can call it from
+        `add` while a change is applied.
+        """
+        return self._first_row(key)
+
+    def contains(self, key):
+        """
+        contains: Returns whether a record with the key exists.
+        """
+        self.refresh()
+        return key in self._index
+
+    def insert(self, record):
+        """
+        insert: Appends a record to the collection and saves it.
+        """
+        self._submit(("create", record.get(self.key_field), dict(record)))
+
+    def insert_many(self, records):
+        """
+        insert_many: Appends several records to the collection and saves
+        them with a single write.
+        """
+        with self.batch():
+            for record in records:
+                self.insert(record)
+
+    def update(self, key, changes, op="update"):
+        """
+        update: Applies the changes to the first record with the key and
+        saves it. Returns whether the record was found.
+        """
+        return self._submit((op, key, dict(changes)))
+
+    def delete(self, key):
+        """
+        delete: Removes the first record with the key and saves the
+        collection. Returns whether the record was found.
+        """
+        return self._submit(("delete", key, None))
+
+
+class _PendingChange:
+    """
+    Class to hold a change waiting in the commit queue of a repository
+    and, once committed, its outcome.
+    """
+
+    def __init__(self, change):
+        """
+        __init__: Initializes a pending change.
+        """
+        self.change = change
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def finish(self, result=None, error=None):
+        """
+        finish: Records the outcome of the change.
+        """
+        self.result = result
+        self.error = error
+        self.done = True
+
+    def outcome(self):
+        """
+        outcome: Returns the result of the change, or raises its error.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+_repositories = {}
+_settings = {
+    "engine": os.environ.get("BOOKING_STORAGE", "json"),
+    "options": {}
+}
+
+
+def register_engine(name, factory):
+    """
+    register_engine: Makes a storage engine selectable by name. The
+    factory is called with the file path and key field of a collection
+    plus the options given to `configure`, and must return a
+    `StorageBackend`.
+    """
+    STORAGE_ENGINES[name] = factory
+
+
+def configure(engine="json", **options):
+    """
+    configure: Selects the storage engine ("json", "log", "sqlite",
+    "memory" or a registered one) and its options for the repositories
+    created from now on, and drops the existing ones. The default engine
+    can also be set with the BOOKING_STORAGE environment variable.
+    """
+    if engine not in STORAGE_ENGINES:
+        raise ValueError(f"Unknown storage engine: {engine}")
+    _settings["engine"] = engine
+    _settings["options"] = options
+    _repositories.clear()
+
+
+@contextlib.contextmanager
+def using(engine, **options):
+    """
+    using: Selects a storage engine for the block, like `configure`, and
+    restores the previous one at its end.
+    """
+    previous = dict(_settings)
+    configure(engine, **options)
+    try:
+        yield
+    finally:
+        configure(previous["engine"], **previous["options"])
+
+
+def get_repository(file_path, key_field):
+    """
+    get_repository: Returns the shared repository of a JSON file,
+    creating it on first use with the configured storage engine.
+    """
+    path = os.path.abspath(file_path)
+    repository = _repositories.get(path)
+    if repository is None:
+        engine = STORAGE_ENGINES[_settings["engine"]]
+        storage = engine(path, key_field, **_settings["options"])
+        repository = Repository(path, key_field, storage)
+        _repositories[path] = repository
+    return repository
+
+
+def _reset_after_fork():
+    """
+    _reset_after_fork: Drops the repositories inherited by a forked
+    child, whose locks may be held by threads of the parent.
+    """
+    _repositories.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,62 @@
+"""
+This script encodes and decodes the stored records as compact JSON,
+with the fastest encoder available.
+
+It utilizes the following modules:
+- `json` for encoding and decoding JSON data when no faster library is
+   installed.
+- `orjson` or `msgspec`, when installed, for faster encoding and
+   decoding.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def library():
+    """
+    library: Returns the name of the library used for compact JSON.
+    """
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def dumps(value, indent=None):
+    """
+    dumps: Encodes a value as UTF-8 JSON bytes, compact unless an indent
+    is given.
+    """
+    if indent is not None:
+        return json.dumps(value, indent=indent).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(value)
+    if msgspec is not None:
+        return msgspec.json.encode(value)
+    return json.dumps(value, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """
+    loads: Decodes JSON bytes or text. Raises a ValueError if the data is
+    not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
@@ -0,0 +1,352 @@
+"""
+This script defines the sharded layout of a collection: one shard per
+value of a field, each one a collection of its own, plus a manifest of
+the shards.
+
+Usage: python -m booking.storage.sharding FILE KEY_FIELD SHARD_FIELD
+
+It utilizes the following modules:
+- `argparse` for parsing the command line arguments.
+- `concurrent.futures` for processing the shards in parallel.
+- `contextlib` for the batch context manager.
+- `hashlib` for naming the shard files.
+- `os` for handling file paths.
+- `threading` for guarding the cached manifest.
+- `serialization` from `booking.storage` for encoding the shard values.
+- `JsonStorage` from `booking.storage.json_storage` for the manifest.
+- `get_repository` from `booking.storage.repository` for the shards.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import os
+import threading
+from booking.storage import serialization
+from booking.storage.json_storage import JsonStorage
+from booking.storage.repository import get_repository
+
+MANIFEST_NAME = "manifest.json"
+_MISSING = object()
+
+
+class ShardLocations:
+    """
+    Class to record, in a dict shared by the shards of a collection, the
+    value of the shard holding each key, so a record is found by key
+    without opening every shard. It is kept up to date as a secondary
+    index of each shard; entries left behind by a reload are checked on
+    lookup, so it does not need to forget them.
+
+    Attributes:
+        locations (dict): The value of the shard of each key, shared by
+        the shards.
+        key_field (str): The field holding the key of the records.
+        value: The value of the shard.
+    """
+
+    def __init__(self, locations, key_field, value):
+        """
+        __init__: Initializes the index of the keys of a shard.
+        """
+        self.locations = locations
+        self.key_field = key_field
+        self.value = value
+
+    def clear(self):
+        """
+        clear: Keeps the recorded keys, which are checked on lookup.
+        """
+
+    def add(self, record):
+        """
+        add: Records the shard of a record.
+        """
+        self.locations[record.get(self.key_field)] = self.value
+
+    def remove(self, record):
+        """
+        remove: Forgets the shard of a record if it is recorded here.
+        """
+        key = record.get(self.key_field)
+        if self.locations.get(key, _MISSING) == self.value:
+            del self.locations[key]
+
+
+class ShardedRepository:
+    """
+    Class to keep a collection split into one shard per value of a
+    field (e.g. one per hotel for the reservations), so writes for
+    different values touch different files and the records of one value
+    are read without loading the others.
+
+    The shards live in a folder named after the collection file (e.g.
+    `reservations/` for reservations.json). Each shard is an ordinary
+    repository with the configured storage engine, and the manifest
+    lists the value and file of every shard, in creation order. Shard
+    files are named after a hash of their value, so every process agrees
+    on them.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection.
+        key_field (str): The record field used as key.
+        shard_field (str): The record field the shards are split by.
+        folder (str): The folder of the shards and the manifest.
+        manifest (JsonStorage): The storage of the manifest.
+        max_workers (int): The threads used to process shards in
+        parallel, or None for the default.
+    """
+
+    def __init__(self, file_path, key_field, shard_field, max_workers=None):
+        """
+        __init__: Initializes the sharded layout of a collection.
+        """
+        self.file_path = os.path.abspath(file_path)
+        self.key_field = key_field
+        self.shard_field = shard_field
+        self.folder = os.path.splitext(self.file_path)[0]
+        self.manifest = JsonStorage(os.path.join(self.folder, MANIFEST_NAME))
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._values = []
+        self._known = set()
+        self._signature = None
+        self._locations = {}
+
+    def shard_path(self, value):
+        """
+        shard_path: Returns the file of the shard of a value.
+        """
+        digest = hashlib.sha1(serialization.dumps(value)).hexdigest()
+        return os.path.join(self.folder, f"shard_{digest[:16]}.json")
+
+    def _read_manifest(self):
+        """
+        _read_manifest: Reloads the manifest if it changed on disk.
+        """
+        signature = self.manifest.signature()
+        if signature != self._signature:
+            entries = self.manifest.read_snapshot()
+            self._values = [entry["value"] for entry in entries]
+            self._known = {serialization.dumps(value)
+                           for value in self._values}
+            self._signature = signature
+
+    def values(self):
+        """
+        values: Returns the values having a shard, in creation order.
+        """
+        with self._lock:
+            self._read_manifest()
+            return list(self._values)
+
+    def register(self, value):
+        """
+        register: Adds the shard of a value to the manifest if it is not
+        listed yet.
+        """
+        encoded = serialization.dumps(value)
+        with self._lock:
+            self._read_manifest()
+            if encoded in self._known:
+                return
+            with self.manifest.lock():
+                self._read_manifest()
+                if encoded in self._known:
+                    return
+                entries = [{"value": known,
+                            "file": os.path.basename(self.shard_path(known))}
+                           for known in self._values]
+                entries.append({"value": value, "file": os.path.basename(
+                    self.shard_path(value))})
+                self.manifest.write_snapshot(entries)
+                self._signature = None
+                self._read_manifest()
+
+    def shard(self, value):
+        """
+        shard: Returns the repository of the shard of a value.
+        """
+        return get_repository(self.shard_path(value), self.key_field)
+
+    def _located_shard(self, value):
+        """
+        _located_shard: Returns the repository of the shard of a value,
+        recording the shard of each of its keys.
+        """
+        shard = self.shard(value)
+        shard.get_index("locations", lambda: ShardLocations(
+            self._locations, self.key_field, value))
+        return shard
+
+    def shards(self):
+        """
+        shards: Returns the repositories of every shard, in creation
+        order.
+        """
+        return [self.shard(value) for value in self.values()]
+
+    def map_shards(self, function, values=None):
+        """
+        map_shards: Calls a function with the repository of each shard
+        (of every shard, or of the given values) in parallel threads and
+        returns the results in shard order. Inside a batch the shards are
+        processed by the calling thread, which holds them.
+        """
+        shards = (self.shards() if values is None
+                  else [self.shard(value) for value in values])
+        if len(shards) < 2 or any(shard.in_batch() for shard in shards):
+            return [function(shard) for shard in shards]
+        with concurrent.futures.ThreadPoolExecutor(
+                self.max_workers) as executor:
+            return list(executor.map(function, shards))
+
+    @contextlib.contextmanager
+    def batch(self, exclusive=False, values=None):
+        """
+        batch: Groups the mutations made by the calling thread inside the
+        block into a single write per shard, like `Repository.batch`, for
+        every shard or for the shards of the given values. Shards created
+        inside the block for other values are not part of it.
+        """
+        shards = {}
+        for shard in (self.shards() if values is None
+                      else [self.shard(value) for value in values]):
+            shards[shard.file_path] = shard
+        with contextlib.ExitStack() as stack:
+            # Sorted, so concurrent batches take the shard locks in the
+            # same order.
+            for path in sorted(shards):
+                stack.enter_context(shards[path].batch(exclusive))
+            yield self
+
+    def refresh(self):
+        """
+        refresh: Reloads the shards that changed on disk.
+        """
+        self.map_shards(lambda shard: shard.refresh())
+
+    def records(self):
+        """
+        records: Returns a copy of every record, shard after shard.
+        """
+        return [record for records in self.map_shards(
+            lambda shard: shard.records()) for record in records]
+
+    def find_shard(self, key):
+        """
+        find_shard: Returns the repository of the first shard holding a
+        record with the key, or None. The shard recorded for the key is
+        checked first; the shards are only searched in order if the key
+        is unknown or moved, e.g. after a write by another process.
+        """
+        value = self._locations.get(key, _MISSING)
+        if value is not _MISSING:
+            shard = self.shard(value)
+            if shard.contains(key):
+                return shard
+        for value in self.values():
+            shard = self._located_shard(value)
+            if shard.contains(key):
+                return shard
+        return None
+
+    def get(self, key):
+        """
+        get: Returns a copy of the first record with the key, or None.
+        """
+        shard = self.find_shard(key)
+        return None if shard is None else shard.get(key)
+
+    def contains(self, key):
+        """
+        contains: Returns whether a record with the key exists.
+        """
+        return self.find_shard(key) is not None
+
+    def insert(self, record):
+        """
+        insert: Appends a record to the shard of its value and saves it.
+        """
+        value = record.get(self.shard_field)
+        self.register(value)
+        self._located_shard(value).insert(record)
+
+    def insert_many(self, records):
+        """
+        insert_many: Appends several records, with a single write per
+        shard.
+        """
+        groups = {}
+        for record in records:
+            value = record.get(self.shard_field)
+            groups.setdefault(serialization.dumps(value),
+                              (value, []))[1].append(record)
+        for value, group in groups.values():
+            self.register(value)
+            self._located_shard(value).insert_many(group)
+
+    def update(self, key, changes, op="update"):
+        """
+        update: Applies the changes to the first record with the key and
+        saves its shard. Returns whether the record was found. Changes
+        to the shard field do not move the record to another shard.
+        """
+        shard = self.find_shard(key)
+        return shard is not None and shard.update(key, changes, op)
+
+    def delete(self, key):
+        """
+        delete: Removes the first record with the key and saves its
+        shard. Returns whether the record was found.
+        """
+        shard = self.find_shard(key)
+        return shard is not None and shard.delete(key)
+
+
+_sharded = {}
+_sharded_lock = threading.Lock()
+
+
+def get_sharded_repository(file_path, key_field, shard_field):
+    """
+    get_sharded_repository: Returns the shared sharded repository of a
+    collection file.
+    """
+    path = os.path.abspath(file_path)
+    with _sharded_lock:
+        repository = _sharded.get((path, shard_field))
+        if repository is None:
+            repository = ShardedRepository(path, key_field, shard_field)
+            _sharded[(path, shard_field)] = repository
+        return repository
+
+
+def shard_collection(file_path, key_field, shard_field):
+    """
+    shard_collection: Copies the records of a single-file collection to
+    its sharded layout and returns the number of records copied.
+    """
+    records = get_repository(file_path, key_field).records()
+    get_sharded_repository(file_path, key_field,
+                           shard_field).insert_many(records)
+    return len(records)
+
+
+def main(argv=None):
+    """
+    main: Splits a collection into shards from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Copy a booking collection to its sharded layout.")
+    parser.add_argument("file", help="the JSON file of the collection")
+    parser.add_argument("key_field")
+    parser.add_argument("shard_field")
+    arguments = parser.parse_args(argv)
+    count = shard_collection(arguments.file, arguments.key_field,
+                             arguments.shard_field)
+    print(f"Sharded {count} records by {arguments.shard_field}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+This script utilizes the following modules:
+- `os` for interacting with the operating system.
+- `sqlite3` for storing the collections in a SQLite database.
+- `threading` for serializing the use of the shared connections.
+- `serialization` from `booking.storage` for encoding and decoding the
+   stored records.
+- `StorageBackend` from `booking.storage.backend` for the backend
+   interface.
+"""
+import os
+import sqlite3
+import threading
+from booking.storage import serialization
+from booking.storage.backend import StorageBackend
+
+DATABASE_NAME = "booking.sqlite3"
+
+_connections = {}
+_connections_lock = threading.Lock()
+_commits = {}
+
+
+def database_path(file_path):
+    """
+    database_path: Returns the default database of a collection file,
+    next to it in the same data folder.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(file_path)),
+                        DATABASE_NAME)
+
+
+def table_name(file_path):
+    """
+    table_name: Returns the table of a collection file, named after it
+    (e.g. "customers" for customers.json).
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    if not name.isidentifier():
+        raise ValueError(f"Invalid collection name: {name}")
+    return name
+
+
+def encode(record):
+    """
+    encode: Returns a record as compact JSON text.
+    """
+    return serialization.dumps(record).decode("utf-8")
+
+
+def get_connection(database):
+    """
+    get_connection: Returns the connection to a database, shared by all
+    the collections stored in it, and the lock serializing its use. The
+    database is opened in WAL mode on first use.
+    """
+    database = os.path.abspath(database)
+    with _connections_lock:
+        shared = _connections.get(database)
+        if shared is None:
+            folder = os.path.dirname(database)
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+            connection = sqlite3.connect(database, check_same_thread=False,
+                                         isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS collection_versions ("
+                "name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+            shared = (connection, threading.RLock())
+            _connections[database] = shared
+        return shared
+
+
+def close_connections():
+    """
+    close_connections: Closes every shared database connection.
+    """
+    with _connections_lock:
+        for connection, _ in _connections.values():
+            connection.close()
+        _connections.clear()
+        _commits.clear()
+
+
+def _reset_after_fork():
+    """
+    _reset_after_fork: Drops the connections inherited by a forked child,
+    which must not be used from two processes.
+    """
+    global _connections_lock  # pylint: disable=global-statement
+    _connections_lock = threading.Lock()
+    _connections.clear()
+    _commits.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class SqliteStorage(StorageBackend):
+    """
+    Class to persist a collection as a table of a SQLite database.
+
+    Each record is stored as JSON next to its key, in an indexed column,
+    and in insertion order, so operations on a key act on its first row
+    like the JSON backends do. Every write also bumps the version of the
+    collection in `collection_versions`, which is how repositories in
+    other processes, and other storages of the same table sharing the
+    connection, notice the change.
+
+    Attributes:
+        file_path (str): The path of the JSON file of the collection,
+        which names the table.
+        key_field (str): The record field used as key.
+        database (str): The path of the SQLite database.
+        table (str): The table of the collection.
+    """
+
+    def __init__(self, file_path, key_field=None, database=None):
+        """
+        __init__: Initializes the storage of a collection table.
+        """
+        super().__init__(file_path, key_field)
+        self.database = database or database_path(file_path)
+        self.table = table_name(file_path)
+        self._ready = False
+        self._database_key = os.path.abspath(self.database)
+        self._stamp = None
+        self._version = None
+        table = self.table
+        self._select_sql = f"SELECT record FROM {table} ORDER BY row"
+        self._insert_sql = f"INSERT INTO {table} (key, record) VALUES (?, ?)"
+        first_row = (f"(SELECT row FROM {table} WHERE key = ? "
+                     "ORDER BY row LIMIT 1)")
+        self._update_sql = (f"UPDATE {table} SET key = ?, record = ? "
+                            f"WHERE row = {first_row}")
+        self._delete_sql = f"DELETE FROM {table} WHERE row = {first_row}"
+        self._version_sql = ("SELECT version FROM collection_versions "
+                             "WHERE name = ?")
+        self._bump_sql = ("INSERT INTO collection_versions (name, version) "
+                          "VALUES (?, 1) ON CONFLICT(name) "
+                          "DO UPDATE SET version = version + 1")
+
+    def _connect(self):
+        """
+        _connect: Returns the shared connection and its lock, creating
+        the table of the collection on first use.
+        """
+        connection, lock = get_connection(self.database)
+        if not self._ready:
+            with lock:
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                    "row INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    "key, record TEXT NOT NULL)")
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_key "
+                    f"ON {self.table} (key)")
+            self._ready = True
+        return connection, lock
+
+    def _current_stamp(self, connection):
+        """
+        _current_stamp: Returns the data version of the database, which
+        changes with the commits of other connections, together with the
+        number of commits made on the shared connection of this process,
+        which `PRAGMA data_version` does not count.
+        """
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, _commits.get(self._database_key, 0)
+
+    def signature(self):
+        """
+        signature: Returns the version of the collection. The version is
+        only queried when the database was written since the last check,
+        by another connection or by another storage of this process.
+        """
+        connection, lock = self._connect()
+        with lock:
+            stamp = self._current_stamp(connection)
+            if stamp != self._stamp:
+                row = connection.execute(self._version_sql,
+                                         (self.table,)).fetchone()
+                self._stamp = stamp
+                self._version = row[0] if row else 0
+            return self._version
+
+    def load(self):
+        """
+        load: Returns the records of the table, in insertion order.
+        """
+        connection, lock = self._connect()
+        with lock:
+            rows = connection.execute(self._select_sql).fetchall()
+        return [serialization.loads(record) for (record,) in rows], []
+
+    def _write(self, write):
+        """
+        _write: Runs a write function on the connection inside its own
+        transaction, bumping the version of the collection. Any error
+        rolls the transaction back, so the shared connection never keeps
+        the write lock of the database.
+        """
+        connection, lock = self._connect()
+        with lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                write(connection)
+                connection.execute(self._bump_sql, (self.table,))
+                version = connection.execute(
+                    self._version_sql, (self.table,)).fetchone()[0]
+                connection.execute("COMMIT")
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+            _commits[self._database_key] = (
+                _commits.get(self._database_key, 0) + 1)
+            self._version = version
+            self._stamp = self._current_stamp(connection)
+
+    def _execute(self, connection, operation):
+        """
+        _execute: Runs the statement of an operation.
+        """
+        key = operation["key"]
+        record = operation["record"]
+        if operation["op"] == "create":
+            connection.execute(self._insert_sql, (key, encode(record)))
+        elif operation["op"] == "delete":
+            connection.execute(self._delete_sql, (key,))
+        else:
+            connection.execute(self._update_sql,
+                               (record.get(self.key_field),
+                                encode(record), key))
+
+    def apply(self, operation, snapshot):  # pylint: disable=unused-argument
+        """
+        apply: Writes an operation to the table.
+        """
+        self._write(lambda connection: self._execute(connection, operation))
+
+    def apply_many(self, operations, snapshot):
+        """
+        apply_many: Writes several operations in a single transaction.
+        """
+        def write(connection):
+            for operation in operations:
+                self._execute(connection, operation)
+
+        if operations:
+            self._write(write)
+
+    def replace_all(self, records):
+        """
+        replace_all: Replaces the content of the table with the records.
+        """
+        def write(connection):
+            connection.execute(f"DELETE FROM {self.table}")
+            connection.executemany(
+                self._insert_sql,
+                ((record.get(self.key_field), encode(record))
+                 for record in records))
+
+        self._write(write)
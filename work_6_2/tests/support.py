@@ -0,0 +1,67 @@
+"""
+This script contains the helpers shared by the unit tests for setting
+up the booking collections.
+
+It utilizes the following modules:
+- `tempfile` for creating temporary data folders.
+- `Customer` from `booking.customers.customer` and `Hotel` from
+   `booking.hotels.hotel` for seeding the referenced collections.
+- `settings` and `repository` from `booking` for selecting the data
+   folder and the storage engine.
+- `clear_memory` from `booking.storage.memory_storage` for dropping the
+   in-memory collections.
+"""
+import tempfile
+from booking import settings
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.storage import repository
+from booking.storage.memory_storage import clear_memory
+
+
+def enter_context(test_case, context):
+    """
+    enter_context: Enters a context manager for the rest of a test and
+    returns its value, exiting it on cleanup like
+    `TestCase.enterContext`, which needs Python 3.11.
+    """
+    value = context.__enter__()
+    test_case.addCleanup(context.__exit__, None, None, None)
+    return value
+
+
+def use_memory(test_case):
+    """
+    use_memory: Keeps the collections of a test in memory.
+    """
+    enter_context(test_case, repository.using("memory"))
+    test_case.addCleanup(clear_memory)
+
+
+def use_data_folder(test_case):
+    """
+    use_data_folder: Points the collections of a test to an empty
+    temporary data folder and returns its path.
+    """
+    folder = enter_context(test_case, tempfile.TemporaryDirectory())
+    settings.set_data_folder(folder)
+    test_case.addCleanup(settings.set_data_folder, None)
+    return folder
+
+
+def add_customers(*customer_ids):
+    """
+    add_customers: Stores customers with the given ids.
+    """
+    Customer.repository().insert_many(
+        [{"customer_id": customer_id, "name": "Name", "phone_number": "555"}
+         for customer_id in customer_ids])
+
+
+def add_hotels(*names, num_rooms=10):
+    """
+    add_hotels: Stores hotels with the given names and number of rooms.
+    """
+    Hotel.repository().insert_many(
+        [{"name": name, "num_rooms": num_rooms, "ubication": "North"}
+         for name in names])
@@ -0,0 +1,101 @@
+"""
+This script contains the unit tests for the booking aggregates.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard output.
+- `io` for handling input/output operations.
+- `Customer`, `Hotel` and `Reservation` for the booking collections.
+- `analytics` from `booking.reservations` for testing the aggregates.
+- `support` from `tests` for keeping the collections in memory.
+"""
+import unittest
+import unittest.mock
+import io
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from booking.reservations import analytics
+from tests import support
+
+
+class TestAnalytics(unittest.TestCase):
+    """
+    Class to test the aggregates of the reservations.
+    """
+
+    def setUp(self):
+        """
+        setUp: Keeps the collections in memory and creates three
+        reservations of two customers in a hotel of four rooms.
+        """
+        support.use_memory(self)
+        Customer.create_customer("C1", "Name", "555")
+        Customer.create_customer("C2", "Name", "555")
+        Hotel.create_hotel("A", 4, "North")
+        Hotel.create_hotel("B", 2, "South")
+        self.first = Reservation.create_reservation(
+            "C1", "A", "1", "2024-05-01", "2024-05-03")
+        self.second = Reservation.create_reservation(
+            "C1", "A", "1", "2024-05-03", "2024-05-05")
+        self.third = Reservation.create_reservation("C2", "A", "2")
+
+    def test_hotel_occupancy(self):
+        """
+        test_hotel_occupancy: Tests the active reservations and occupancy
+        of each hotel.
+        """
+        self.assertEqual(analytics.hotel_occupancy(), {
+            "A": {"active": 3, "occupied_rooms": 2, "num_rooms": 4,
+                  "occupancy": 0.5},
+            "B": {"active": 0, "occupied_rooms": 0, "num_rooms": 2,
+                  "occupancy": 0.0}})
+        self.assertIsNone(
+            analytics.hotel_occupancy("Unknown")["Unknown"]["occupancy"])
+
+    def test_updated_incrementally(self):
+        """
+        test_updated_incrementally: Tests that cancellations and deletes
+        update the aggregates without rebuilding them.
+        """
+        stats = analytics.reservation_stats(Reservation.repository())
+        Reservation.cancel_reservation(self.first.reservation_code)
+        Reservation.delete_reservation(self.third.reservation_code)
+        self.assertIs(analytics.reservation_stats(Reservation.repository()),
+                      stats)
+        self.assertEqual(analytics.hotel_occupancy("A")["A"]["active"], 1)
+        self.assertEqual(analytics.hotel_occupancy("A")["A"]["occupancy"],
+                         0.25)
+        self.assertEqual(analytics.customer_reservations(), {
+            "C1": {"reservations": 2, "active": 1}})
+        self.assertEqual(analytics.customer_reservations("C2"), {
+            "C2": {"reservations": 0, "active": 0}})
+        self.assertEqual(analytics.verify_stats(), [])
+
+    def test_verify_detects_differences(self):
+        """
+        test_verify_detects_differences: Tests that the verification
+        reports aggregates that differ from a rebuild.
+        """
+        stats = analytics.reservation_stats(Reservation.repository())
+        stats.reservations["C2"] += 1
+        self.assertEqual(analytics.verify_stats(), [("customer", "C2")])
+
+    def test_command(self):
+        """
+        test_command: Tests that the command prints the aggregates and
+        verifies them.
+        """
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertEqual(analytics.main([]), 0)
+            self.assertEqual(analytics.main(["--verify"]), 0)
+        output = fake_stdout.getvalue()
+        self.assertIn("Hotel A: 3 active reservations, 2 rooms held, "
+                      "occupancy 50.0%", output)
+        self.assertIn("Customer C1: 2 reservations, 2 active", output)
+        self.assertIn("Found 0 differences", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
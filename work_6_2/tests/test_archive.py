@@ -0,0 +1,169 @@
+"""
+This script contains the unit tests for the archiving of cancelled
+reservations.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard output.
+- `datetime` for the days of the archive files.
+- `gzip` for reading compressed archive files.
+- `io` for handling input/output operations.
+- `os` for handling file paths.
+- `time` for waiting on the background archiving.
+- `Reservation` from `booking.reservations.reservation` for testing the
+   archiving.
+- `archiving` from `booking.reservations` for testing the command.
+- `support` from `tests` for the temporary data folder and the
+   seeded customers and hotels.
+"""
+import unittest
+import unittest.mock
+import datetime
+import gzip
+import io
+import os
+import time
+from booking.reservations.reservation import Reservation
+from booking.reservations import archiving
+from tests import support
+
+DAY = datetime.date(2024, 5, 1)
+
+
+class TestArchive(unittest.TestCase):
+    """
+    Class to test the archiving of cancelled reservations.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the collections to a temporary data folder and
+        cancels one of two reservations.
+        """
+        folder = support.use_data_folder(self)
+        support.add_customers("C1", "C2", "C3")
+        support.add_hotels("A")
+        self.kept = Reservation.create_reservation("C1", "A", "1")
+        self.cancelled = Reservation.create_reservation("C2", "A", "2")
+        Reservation.cancel_reservation(self.cancelled.reservation_code)
+        self.folder = os.path.join(folder, "reservations_archive")
+
+    def test_archive_cancelled(self):
+        """
+        test_archive_cancelled: Tests that cancelled reservations move to
+        the dated archive file and can still be found by code.
+        """
+        self.assertEqual(Reservation.archive_cancelled(day=DAY), 1)
+        self.assertEqual(Reservation.load_reservations(),
+                         [self.kept.to_dict()])
+        self.assertEqual(os.listdir(self.folder), ["2024-05-01.jsonl"])
+        code = self.cancelled.reservation_code
+        self.assertEqual(Reservation.find_reservation(code)["active"], False)
+        self.assertIsNone(Reservation.find_reservation(code,
+                                                       include_archive=False))
+        self.assertEqual(Reservation.archive_cancelled(day=DAY), 0)
+
+    def test_archive_gzip(self):
+        """
+        test_archive_gzip: Tests that compressed archive files can be
+        appended to and read back.
+        """
+        Reservation.archive_cancelled(compress=True, day=DAY)
+        again = Reservation.create_reservation("C3", "A", "3")
+        Reservation.cancel_reservation(again.reservation_code)
+        Reservation.archive_cancelled(compress=True, day=DAY)
+        path = os.path.join(self.folder, "2024-05-01.jsonl.gz")
+        with gzip.open(path, 'rb') as file:
+            self.assertEqual(len(file.read().splitlines()), 2)
+        self.assertEqual(len(Reservation.archive().records()), 2)
+        self.assertIsNotNone(
+            Reservation.find_reservation(again.reservation_code))
+
+    def test_lookups_reuse_the_archive(self):
+        """
+        test_lookups_reuse_the_archive: Tests that a second lookup of a
+        missing code does not read the archive files again, while a new
+        archiving is seen by the next lookup.
+        """
+        Reservation.archive_cancelled(day=DAY)
+        archive = Reservation.archive()
+        self.assertIs(Reservation.archive(), archive)
+        with unittest.mock.patch.object(
+                archive, "read_file", wraps=archive.read_file) as read_file:
+            self.assertIsNone(Reservation.find_reservation("missing"))
+            self.assertEqual(read_file.call_count, 1)
+            self.assertIsNone(Reservation.find_reservation("missing"))
+            self.assertEqual(read_file.call_count, 1)
+            again = Reservation.create_reservation("C3", "A", "3")
+            Reservation.cancel_reservation(again.reservation_code)
+            Reservation.archive_cancelled(day=DAY)
+            self.assertIsNotNone(
+                Reservation.find_reservation(again.reservation_code))
+            self.assertEqual(read_file.call_count, 2)
+
+    def test_command(self):
+        """
+        test_command: Tests archiving from the command line.
+        """
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as output:
+            archiving.main([])
+        self.assertIn("Archived 1 cancelled reservations", output.getvalue())
+
+    def test_background_archiving(self):
+        """
+        test_background_archiving: Tests that the background job archives
+        reservations cancelled after it started.
+        """
+        stop = archiving.start_archiving(0.01)
+        self.addCleanup(stop.set)
+        deadline = time.monotonic() + 5
+        while (Reservation.find_reservation(
+                self.cancelled.reservation_code, include_archive=False)
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+        stop.set()
+        self.assertEqual(len(Reservation.archive().records()), 1)
+
+    def test_background_archiving_survives_errors(self):
+        """
+        test_background_archiving_survives_errors: Tests that the first
+        run happens right away and that a failed run is logged without
+        stopping the later ones.
+        """
+        runs = []
+
+        def archive_cancelled(compress):
+            runs.append(compress)
+            if len(runs) == 1:
+                raise OSError("disk full")
+            return 0
+
+        with unittest.mock.patch.object(
+                Reservation, "archive_cancelled",
+                side_effect=archive_cancelled), \
+                self.assertLogs(archiving.logger) as logs:
+            stop = archiving.start_archiving(0.01)
+            self.addCleanup(stop.set)
+            deadline = time.monotonic() + 5
+            while len(runs) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            stop.set()
+        self.assertGreaterEqual(len(runs), 2)
+        self.assertIn("disk full", logs.output[0])
+
+    def test_first_run_is_immediate(self):
+        """
+        test_first_run_is_immediate: Tests that the background job does
+        not wait a whole interval before its first run.
+        """
+        stop = archiving.start_archiving(3600)
+        self.addCleanup(stop.set)
+        deadline = time.monotonic() + 5
+        while (not Reservation.archive().files()
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+        self.assertEqual(len(Reservation.archive().records()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
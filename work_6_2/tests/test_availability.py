@@ -0,0 +1,239 @@
+"""
+This script contains the unit tests for the room availability of the
+Reservation class.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard output.
+- `io` for handling input/output operations.
+- `json` for encoding and decoding JSON data.
+- `Hotel` from `booking.hotels.hotel` for creating the hotels.
+- `Reservation` from `booking.reservations.reservation` for testing the
+   availability checks.
+- `support` from `tests` for the temporary data folder and the
+   seeded customers and hotels.
+"""
+import unittest
+import unittest.mock
+import io
+import json
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from tests import support
+
+
+class TestAvailability(unittest.TestCase):
+    """
+    Class to test the room availability of the reservations.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the collections to a temporary data folder with
+        two customers and a hotel of two rooms.
+        """
+        support.use_data_folder(self)
+        self.reservations_file = Reservation.reservations_file
+        support.add_customers("C1", "C2")
+        Hotel.create_hotel("Small", 2, "North")
+
+    def create(self, room, hotel_name="Small", check_in=None,
+               check_out=None):
+        """
+        create: Creates a reservation, hiding its error message.
+        """
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as output:
+            reservation = Reservation.create_reservation(
+                "C1", hotel_name, room, check_in, check_out)
+        return reservation, output.getvalue()
+
+    def test_double_booking(self):
+        """
+        test_double_booking: Tests that an actively reserved room cannot
+        be reserved again.
+        """
+        first, _ = self.create("1A")
+        second, output = self.create("1A")
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertIn("room 1A of Small is already reserved", output)
+        self.assertEqual(Reservation.overlapping_reservations("Small", "1A"),
+                         [first.reservation_code])
+
+    def test_room_freed(self):
+        """
+        test_room_freed: Tests that cancelling or deleting a reservation
+        frees its room.
+        """
+        first, _ = self.create("1A")
+        second, _ = self.create("1B")
+        self.assertFalse(Reservation.is_room_available("Small", "1A"))
+        Reservation.cancel_reservation(first.reservation_code)
+        Reservation.delete_reservation(second.reservation_code)
+        self.assertTrue(Reservation.is_room_available("Small", "1A"))
+        self.assertTrue(Reservation.is_room_available("Small", "1B"))
+        self.assertIsNotNone(self.create("1A")[0])
+
+    def test_free_rooms(self):
+        """
+        test_free_rooms: Tests the count of free rooms and that a full
+        hotel rejects new reservations.
+        """
+        self.assertEqual(Reservation.free_rooms("Small"), 2)
+        self.assertIsNone(Reservation.free_rooms("Unknown"))
+        self.create("1A")
+        self.create("1B")
+        self.assertEqual(Reservation.free_rooms("Small"), 0)
+        reservation, output = self.create("1C")
+        self.assertIsNone(reservation)
+        self.assertIn("Small has no free rooms", output)
+        reservation, output = self.create("1A", "Unknown")
+        self.assertIsNone(reservation)
+        self.assertIn("hotel Unknown does not exist", output)
+
+    def test_create_many_conflicts(self):
+        """
+        test_create_many_conflicts: Tests that a bulk creation asking
+        twice for the same room saves nothing.
+        """
+        rows = [{"customer_id": "C1", "hotel_name": "Small", "room": "1A"},
+                {"customer_id": "C2", "hotel_name": "Small", "room": "1A"}]
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as output:
+            self.assertIsNone(Reservation.create_many(rows))
+        self.assertIn("row 2: room 1A of Small is already reserved",
+                      output.getvalue())
+        self.assertEqual(Reservation.free_rooms("Small"), 2)
+
+    def test_date_ranges(self):
+        """
+        test_date_ranges: Tests that stays of a room may follow each
+        other but not overlap.
+        """
+        first, _ = self.create("1A", check_in="2024-05-01",
+                               check_out="2024-05-05")
+        second, _ = self.create("1A", check_in="2024-05-05",
+                                check_out="2024-05-08")
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertEqual(first.to_dict()["check_out"], "2024-05-05")
+        reservation, output = self.create("1A", check_in="2024-04-28",
+                                          check_out="2024-05-02")
+        self.assertIsNone(reservation)
+        self.assertIn("already reserved", output)
+        self.assertIsNone(self.create("1A")[0])
+        self.assertEqual(Reservation.overlapping_reservations(
+            "Small", "1A", "2024-05-04", "2024-05-06"),
+            [first.reservation_code, second.reservation_code])
+        self.assertEqual(Reservation.overlapping_reservations(
+            "Small", "1A", "2024-05-08", "2024-05-09"), [])
+
+    def test_free_rooms_between(self):
+        """
+        test_free_rooms_between: Tests the booked and free rooms of a
+        hotel for date ranges.
+        """
+        self.create("1A", check_in="2024-05-01", check_out="2024-05-05")
+        self.create("1B")
+        self.assertEqual(Reservation.booked_rooms(
+            "Small", "2024-05-02", "2024-05-03"), ["1A", "1B"])
+        self.assertEqual(Reservation.booked_rooms(
+            "Small", "2024-06-01", "2024-06-03"), ["1B"])
+        self.assertEqual(Reservation.free_rooms(
+            "Small", "2024-06-01", "2024-06-03"), 1)
+        self.assertIsNone(self.create("1C", check_in="2024-05-03",
+                                      check_out="2024-05-04")[0])
+        self.assertIsNotNone(self.create("1C", check_in="2024-05-05",
+                                         check_out="2024-05-06")[0])
+
+    def test_undated_check_counts_held_rooms(self):
+        """
+        test_undated_check_counts_held_rooms: Tests that a check without
+        dates counts the rooms held at any date without building their
+        set, and follows cancellations.
+        """
+        stay, _ = self.create("1A", check_in="2024-05-01",
+                              check_out="2024-05-05")
+        self.create("1A", check_in="2024-05-05", check_out="2024-05-08")
+        index = Reservation.availability("Small")
+        with unittest.mock.patch.object(
+                index, "booked_rooms",
+                side_effect=AssertionError("rooms walked")):
+            self.assertEqual(Reservation.free_rooms("Small"), 1)
+            self.assertIsNotNone(self.create("1B")[0])
+            reservation, output = self.create("1C")
+        self.assertIsNone(reservation)
+        self.assertIn("Small has no free rooms", output)
+        Reservation.cancel_reservation(stay.reservation_code)
+        self.assertEqual(Reservation.free_rooms("Small"), 0)
+
+    def test_invalid_dates(self):
+        """
+        test_invalid_dates: Tests that reservations with invalid or
+        reversed dates are rejected.
+        """
+        for check_in, check_out, message in (
+                ("2024-05-01", None, "check_out must be a date"),
+                ("01/05/2024", "2024-05-03", "check_in must be a date"),
+                ("2024-05-03", "2024-05-01", "must be after check_in")):
+            reservation, output = self.create("1A", check_in=check_in,
+                                              check_out=check_out)
+            self.assertIsNone(reservation)
+            self.assertIn(message, output)
+
+    def test_create_many_dated(self):
+        """
+        test_create_many_dated: Tests a bulk creation of stays of one
+        room, rejecting the rows that overlap.
+        """
+        rows = [{"customer_id": "C1", "hotel_name": "Small", "room": "1A",
+                 "check_in": "2024-05-01", "check_out": "2024-05-03"},
+                {"customer_id": "C2", "hotel_name": "Small", "room": "1A",
+                 "check_in": "2024-05-03", "check_out": "2024-05-04"}]
+        self.assertEqual(len(Reservation.create_many(rows)), 2)
+        rows[1]["check_in"] = "2024-05-02"
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()):
+            self.assertIsNone(Reservation.create_many(rows))
+
+    def test_external_changes(self):
+        """
+        test_external_changes: Tests that the index follows reservations
+        written to the file by another worker.
+        """
+        self.create("1A")
+        self.assertEqual(Reservation.free_rooms("Small"), 1)
+        record = {"reservation_code": "X", "customer_id": "C2",
+                  "hotel_name": "Small", "room": "2A", "active": True}
+        with open(self.reservations_file, 'w', encoding='utf-8') as file:
+            json.dump([record], file)
+        self.assertTrue(Reservation.is_room_available("Small", "1A"))
+        self.assertEqual(Reservation.overlapping_reservations("Small", "2A"),
+                         ["X"])
+
+    def test_overlapping_stored_stays(self):
+        """
+        test_overlapping_stored_stays: Tests that stays overlapping each
+        other in the file, which creation would reject, are all found,
+        and that the room is searched quickly again once they are gone.
+        """
+        records = [{"reservation_code": code, "customer_id": "C1",
+                    "hotel_name": "Small", "room": "1A", "active": True,
+                    "check_in": check_in, "check_out": check_out}
+                   for code, check_in, check_out in (
+                       ("L", "2024-05-01", "2024-05-10"),
+                       ("S", "2024-05-02", "2024-05-03"))]
+        with open(self.reservations_file, 'w', encoding='utf-8') as file:
+            json.dump(records, file)
+        self.assertEqual(Reservation.overlapping_reservations(
+            "Small", "1A", "2024-05-05", "2024-05-06"), ["L"])
+        self.assertEqual(Reservation.booked_rooms(
+            "Small", "2024-05-05", "2024-05-06"), ["1A"])
+        self.assertIsNone(self.create("1A", check_in="2024-05-05",
+                                      check_out="2024-05-06")[0])
+        Reservation.cancel_reservation("L")
+        self.assertEqual(Reservation.availability("Small").overlapped, set())
+        self.assertEqual(Reservation.overlapping_reservations(
+            "Small", "1A", "2024-05-01", "2024-05-06"), ["S"])
+
+
+if __name__ == '__main__':
+    unittest.main()
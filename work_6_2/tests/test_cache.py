@@ -0,0 +1,127 @@
+"""
+This script contains the unit tests for the cached lookups of records.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard output.
+- `io` for handling input/output operations.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `Customer` from `booking.customers.customer` for the cached display.
+- `RecordCache` from `booking.storage.cache` for testing the eviction.
+- `Repository` from `booking.storage.repository` for testing the
+   invalidation.
+"""
+import unittest
+import unittest.mock
+import io
+import json
+import os
+import tempfile
+from booking.customers.customer import Customer
+from booking.storage.cache import RecordCache
+from booking.storage.repository import Repository
+
+
+class TestRecordCache(unittest.TestCase):
+    """
+    Class to test the RecordCache class and the cached lookups of the
+    repositories.
+    """
+
+    def setUp(self):
+        """
+        setUp: Creates a repository over a temporary JSON file with one
+        record.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "customers.json")
+        self.repository = Repository(self.file_path, "customer_id")
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+
+    def tearDown(self):
+        """
+        tearDown: Removes the temporary data folder.
+        """
+        self.temp_dir.cleanup()
+
+    def test_hits_and_misses(self):
+        """
+        test_hits_and_misses: Tests that repeated lookups are served from
+        the cache, including those of missing keys.
+        """
+        for _ in range(3):
+            self.assertEqual(self.repository.cached_get("1")["name"], "Ana")
+            self.assertIsNone(self.repository.cached_get("2"))
+        stats = self.repository.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (4, 2))
+        self.assertEqual(stats["size"], 2)
+
+    def test_returns_copies(self):
+        """
+        test_returns_copies: Tests that changing a returned record does
+        not change the cached one.
+        """
+        self.repository.cached_get("1")["name"] = "Changed"
+        self.assertEqual(self.repository.cached_get("1")["name"], "Ana")
+
+    def test_invalidated_by_mutations(self):
+        """
+        test_invalidated_by_mutations: Tests that creations, updates and
+        deletes are seen by the next lookup.
+        """
+        self.assertIsNone(self.repository.cached_get("2"))
+        self.repository.insert({"customer_id": "2", "name": "Bea"})
+        self.assertEqual(self.repository.cached_get("2")["name"], "Bea")
+        self.repository.update("2", {"name": "Eva"})
+        self.assertEqual(self.repository.cached_get("2")["name"], "Eva")
+        self.repository.delete("2")
+        self.assertIsNone(self.repository.cached_get("2"))
+
+    def test_invalidated_by_other_processes(self):
+        """
+        test_invalidated_by_other_processes: Tests that a change of the
+        file made by another process is seen by the next lookup.
+        """
+        self.repository.cached_get("1")
+        with open(self.file_path, 'w', encoding='utf-8') as file:
+            json.dump([{"customer_id": "1", "name": "Changed on disk"}],
+                      file)
+        self.assertEqual(self.repository.cached_get("1")["name"],
+                         "Changed on disk")
+
+    def test_least_recently_used_eviction(self):
+        """
+        test_least_recently_used_eviction: Tests that the least recently
+        used key is evicted when the cache is full.
+        """
+        cache = RecordCache("customer_id", maxsize=2)
+        records = {key: {"customer_id": key} for key in "abc"}
+        for key in "aba":
+            cache.lookup(key, records.get)
+        cache.lookup("c", records.get)
+        cache.lookup("a", records.get)
+        cache.lookup("b", records.get)
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 4,
+                                         "evictions": 2, "size": 2,
+                                         "maxsize": 2})
+
+    def test_display_customer_is_cached(self):
+        """
+        test_display_customer_is_cached: Tests that display_customer uses
+        the cache and shows the updated customer.
+        """
+        with unittest.mock.patch.object(Customer, "customers_file",
+                                        self.file_path), \
+                unittest.mock.patch('sys.stdout', new=io.StringIO()) as out:
+            Customer.display_customer("1")
+            Customer.update_customer("1", new_name="Eva")
+            Customer.display_customer("1")
+            stats = Customer.repository().cache_stats()
+        self.assertIn("Eva", out.getvalue().splitlines()[-1])
+        self.assertEqual(stats["misses"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
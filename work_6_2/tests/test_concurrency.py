@@ -0,0 +1,180 @@
+"""
+This script contains the unit tests for the concurrency safety of the
+Repository class.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for counting and failing storage writes.
+- `json` for encoding and decoding JSON data.
+- `multiprocessing` for running writers in parallel processes.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `threading` for running writers in parallel threads.
+- `time` for waiting on the commit queue.
+- `Repository` from `booking.storage.repository` for testing the
+   repository layer.
+"""
+import unittest
+import unittest.mock
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from booking.storage.repository import Repository
+
+
+def insert_customers(file_path, prefix, count):
+    """
+    insert_customers: Inserts customers one by one through a new
+    repository, as a separate booking worker would.
+    """
+    repository = Repository(file_path, "customer_id")
+    for number in range(count):
+        repository.insert({"customer_id": f"{prefix}-{number}"})
+
+
+class TestConcurrency(unittest.TestCase):
+    """
+    Class to test concurrent mutations of a repository.
+    """
+
+    def setUp(self):
+        """
+        setUp: Creates a repository over a temporary JSON file.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "customers.json")
+        self.repository = Repository(self.file_path, "customer_id")
+
+    def tearDown(self):
+        """
+        tearDown: Removes the temporary data folder.
+        """
+        self.temp_dir.cleanup()
+
+    def read_ids(self):
+        """
+        read_ids: Returns the customer ids stored in the JSON file.
+        """
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            return sorted(record["customer_id"] for record in json.load(file))
+
+    def test_threads_do_not_lose_updates(self):
+        """
+        test_threads_do_not_lose_updates: Tests that inserts from many
+        threads all reach the file.
+        """
+        threads = [threading.Thread(target=insert_customers,
+                                    args=(self.file_path, f"t{n}", 20))
+                   for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.read_ids()), 120)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_processes_do_not_lose_updates(self):
+        """
+        test_processes_do_not_lose_updates: Tests that inserts from many
+        processes all reach the file.
+        """
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=insert_customers,
+                                     args=(self.file_path, f"p{n}", 20))
+                     for n in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(len(self.read_ids()), 80)
+
+    def test_queued_writers_share_a_write(self):
+        """
+        test_queued_writers_share_a_write: Tests that changes queued while
+        a write is running are committed together.
+        """
+        self.repository.insert({"customer_id": "0"})
+        storage = self.repository.storage
+        with unittest.mock.patch.object(
+                storage, "apply_many", wraps=storage.apply_many) as writes:
+            with self.repository._commit_lock:  # pylint: disable=W0212
+                threads = [threading.Thread(target=self.repository.insert,
+                                            args=({"customer_id": str(n)},))
+                           for n in range(1, 6)]
+                for thread in threads:
+                    thread.start()
+                while len(self.repository._queue) < 5:  # pylint: disable=W0212
+                    time.sleep(0.001)
+            for thread in threads:
+                thread.join()
+        self.assertEqual(writes.call_count, 1)
+        self.assertEqual(self.read_ids(), ["0", "1", "2", "3", "4", "5"])
+
+    def test_batch_is_a_single_write(self):
+        """
+        test_batch_is_a_single_write: Tests that the mutations of a batch
+        are saved with one write.
+        """
+        storage = self.repository.storage
+        with unittest.mock.patch.object(
+                storage, "apply_many", wraps=storage.apply_many) as writes:
+            with self.repository.batch():
+                self.repository.insert({"customer_id": "1"})
+                self.repository.insert({"customer_id": "2"})
+                self.assertTrue(self.repository.update("1", {"name": "Ana"}))
+                self.assertTrue(self.repository.delete("2"))
+                self.assertFalse(self.repository.delete("3"))
+                self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(writes.call_count, 1)
+        self.assertEqual(self.read_ids(), ["1"])
+
+    def test_batch_is_replayed_after_a_conflict(self):
+        """
+        test_batch_is_replayed_after_a_conflict: Tests that a batch keeps
+        the changes written by another worker during the block.
+        """
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+        with self.repository.batch():
+            self.repository.update("1", {"phone_number": "555"})
+            insert_customers(self.file_path, "other", 2)
+            self.repository.insert({"customer_id": "2"})
+        self.assertEqual(self.read_ids(), ["1", "2", "other-0", "other-1"])
+        self.assertEqual(self.repository.get("1"),
+                         {"customer_id": "1", "name": "Ana",
+                          "phone_number": "555"})
+
+    def test_batch_is_discarded_on_error(self):
+        """
+        test_batch_is_discarded_on_error: Tests that a failing batch saves
+        nothing and leaves no change in memory.
+        """
+        self.repository.insert({"customer_id": "1"})
+        with self.assertRaises(RuntimeError):
+            with self.repository.batch():
+                self.repository.insert({"customer_id": "2"})
+                raise RuntimeError("failed")
+        self.assertFalse(self.repository.contains("2"))
+        self.assertEqual(self.read_ids(), ["1"])
+
+    def test_failed_write_keeps_previous_file(self):
+        """
+        test_failed_write_keeps_previous_file: Tests that a crash while
+        writing leaves the previous file intact.
+        """
+        self.repository.insert({"customer_id": "1"})
+        with unittest.mock.patch("booking.storage.serialization.dumps",
+                                 side_effect=OSError("full")):
+            with self.assertRaises(OSError):
+                self.repository.insert({"customer_id": "2"})
+        self.assertEqual(self.read_ids(), ["1"])
+        self.assertEqual(os.listdir(self.temp_dir.name).count(
+            "customers.json"), 1)
+        self.assertFalse(self.repository.contains("2"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,15 +4,15 @@ This script contains the unit tests for the Customer class.
 It utilizes the following modules:
 - `unittest` for running the tests.
 - `unittest.mock` for mocking standard output.
-- `json` for encoding and decoding JSON data.
 - `io` for handling input/output operations.
+- `support` from `tests` for keeping the collections in memory.
 - `Customer` from `booking.customers.customer` for testing the Customer class.
 """
 import unittest
 import unittest.mock
-import json
 import io
 from booking.customers.customer import Customer
+from tests import support
 
 class TestCustomer(unittest.TestCase):
     """
@@ -21,8 +21,10 @@ class TestCustomer(unittest.TestCase):
 
     def setUp(self):
         """
-        setUp: Initializes a new Customer object for each test.
+        setUp: Initializes a new Customer object for each test,
+        with the collections kept in memory.
         """
+        support.use_memory(self)
         self.customer = Customer("123", "Test Jorge", "57-987-4321")
 
     def test_customer_initialization(self):
@@ -44,6 +46,15 @@ class TestCustomer(unittest.TestCase):
         }
         self.assertEqual(self.customer.to_dict(), expected_dict)
 
+    def test_from_dict(self):
+        """
+        test_from_dict: Tests that a Customer object is rebuilt from its
+        dictionary and has no per-instance dictionary.
+        """
+        customer = Customer.from_dict(self.customer.to_dict())
+        self.assertEqual(customer.to_dict(), self.customer.to_dict())
+        self.assertFalse(hasattr(customer, "__dict__"))
+
     def test_load_customers(self):
         """
         test_load_customers: Tests the load_customers method of the Customer class.
@@ -56,8 +67,7 @@ class TestCustomer(unittest.TestCase):
         test_save_to_json: Tests the save_to_json method of a Customer object.
         """
         self.customer.save_to_json()
-        with open(Customer.customers_file, 'r', encoding='utf-8') as file:
-            customers = json.load(file)
+        customers, _ = Customer.repository().storage.load()
         self.assertIn(self.customer.to_dict(), customers)
         Customer.delete_customer(self.customer.customer_id)
 
@@ -118,6 +128,37 @@ class TestCustomer(unittest.TestCase):
         )
         self.assertIsNone(invalid_customer)
 
+    def test_create_many_affirmative(self):
+        """
+        test_create_many_affirmative: Tests the create_many method of the
+        Customer class.
+        """
+        rows = [{"customer_id": "bulk-1", "name": "Ana",
+                 "phone_number": "555-0001"},
+                {"customer_id": "bulk-2", "name": "Luis",
+                 "phone_number": "555-0002"}]
+        created = Customer.create_many(rows)
+        customers = Customer.load_customers()
+        self.assertEqual(len(created), 2)
+        for row in rows:
+            self.assertIn(row, customers)
+            Customer.delete_customer(row["customer_id"])
+
+    def test_create_many_invalid_row(self):
+        """
+        test_create_many_invalid_row: Tests that create_many saves nothing
+        when a row is invalid.
+        """
+        rows = [{"customer_id": "bulk-1", "name": "Ana",
+                 "phone_number": "555-0001"},
+                {"customer_id": 2, "name": "Luis",
+                 "phone_number": "555-0002"}]
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertIsNone(Customer.create_many(rows))
+            self.assertIn("row 2", fake_stdout.getvalue())
+        self.assertFalse(Customer.delete_customer("bulk-1"))
+
     def test_delete_customer_affirmative(self):
         """
         test_delete_customer_affirmative: Tests the delete_customer method of the Customer class.
@@ -4,15 +4,15 @@ This script contains the unit tests for the Hotel class.
 It utilizes the following modules:
 - `unittest` for running the tests.
 - `unittest.mock` for mocking standard output.
-- `json` for encoding and decoding JSON data.
 - `io` for handling input/output operations.
+- `support` from `tests` for keeping the collections in memory.
 - `Hotel` from `booking.hotels.hotel` for testing the Hotel class.
 """
 import unittest
 import unittest.mock
-import json
 import io
 from booking.hotels.hotel import Hotel
+from tests import support
 
 
 class TestHotel(unittest.TestCase):
@@ -22,8 +22,10 @@ class TestHotel(unittest.TestCase):
 
     def setUp(self):
         """
-        setUp: Initializes a new Hotel object for each test.
+        setUp: Initializes a new Hotel object for each test,
+        with the collections kept in memory.
         """
+        support.use_memory(self)
         self.hotel = Hotel("Test Hotel", 100, "Test Location")
 
     def test_hotel_initialization(self):
@@ -45,6 +47,15 @@ class TestHotel(unittest.TestCase):
         }
         self.assertEqual(self.hotel.to_dict(), expected_dict)
 
+    def test_from_dict(self):
+        """
+        test_from_dict: Tests that a Hotel object is rebuilt from its
+        dictionary and has no per-instance dictionary.
+        """
+        hotel = Hotel.from_dict(self.hotel.to_dict())
+        self.assertEqual(hotel.to_dict(), self.hotel.to_dict())
+        self.assertFalse(hasattr(hotel, "__dict__"))
+
     def test_load_hotels(self):
         """
         test_load_hotels: Tests the load_hotels method of the Hotel class.
@@ -57,8 +68,7 @@ class TestHotel(unittest.TestCase):
         test_save_to_json: Tests the save_to_json method of a Hotel object.
         """
         self.hotel.save_to_json()
-        with open(Hotel.hotels_file, 'r', encoding='utf-8') as file:
-            hotels = json.load(file)
+        hotels, _ = Hotel.repository().storage.load()
         self.assertIn(self.hotel.to_dict(), hotels)
         Hotel.delete_hotel(self.hotel.name)
 
@@ -120,6 +130,37 @@ class TestHotel(unittest.TestCase):
                                            )
         self.assertIsNone(invalid_hotel)
 
+    def test_create_many_affirmative(self):
+        """
+        test_create_many_affirmative: Tests the create_many method of the
+        Hotel class.
+        """
+        rows = [{"name": "Bulk Hotel 1", "num_rooms": 10,
+                 "ubication": "North"},
+                {"name": "Bulk Hotel 2", "num_rooms": 20,
+                 "ubication": "South"}]
+        created = Hotel.create_many(rows)
+        hotels = Hotel.load_hotels()
+        self.assertEqual(len(created), 2)
+        for row in rows:
+            self.assertIn(row, hotels)
+            Hotel.delete_hotel(row["name"])
+
+    def test_create_many_invalid_row(self):
+        """
+        test_create_many_invalid_row: Tests that create_many saves nothing
+        when a row is invalid.
+        """
+        rows = [{"name": "Bulk Hotel 1", "num_rooms": 10,
+                 "ubication": "North"},
+                {"name": "Bulk Hotel 2", "num_rooms": "20",
+                 "ubication": "South"}]
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertIsNone(Hotel.create_many(rows))
+            self.assertIn("row 2", fake_stdout.getvalue())
+        self.assertFalse(Hotel.delete_hotel("Bulk Hotel 1"))
+
     def test_delete_hotel_affirmative(self):
         """
         test_delete_hotel_affirmative: Tests the delete_hotel method of
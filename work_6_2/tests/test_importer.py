@@ -0,0 +1,104 @@
+"""
+This script contains the unit tests for the bulk importer.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for pointing the Hotel class to a temporary file and
+   mocking standard output.
+- `io` for handling input/output operations.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `Hotel` from `booking.hotels.hotel` for checking the imported hotels.
+- `importer` from `booking` for testing the importer.
+"""
+import unittest
+import unittest.mock
+import io
+import json
+import os
+import tempfile
+from booking.hotels.hotel import Hotel
+from booking import importer
+
+
+class TestImporter(unittest.TestCase):
+    """
+    Class to test the bulk importer.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the hotels to a temporary data folder.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.hotels_file = os.path.join(self.temp_dir.name, "hotels.json")
+        patcher = unittest.mock.patch.object(Hotel, "hotels_file",
+                                             self.hotels_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        tearDown: Removes the temporary data folder.
+        """
+        self.temp_dir.cleanup()
+
+    def write(self, file_name, text):
+        """
+        write: Writes an input file and returns its path.
+        """
+        file_path = os.path.join(self.temp_dir.name, file_name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return file_path
+
+    def read_hotels(self):
+        """
+        read_hotels: Returns the hotels stored in the JSON file.
+        """
+        with open(self.hotels_file, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def test_import_csv(self):
+        """
+        test_import_csv: Tests importing hotels from a CSV file, with the
+        number of rooms converted to an integer.
+        """
+        file_path = self.write("hotels.csv",
+                               "name,num_rooms,ubication\n"
+                               "A,10,North\nB,20,South\n")
+        created = importer.import_file("hotels", file_path)
+        self.assertEqual(len(created), 2)
+        self.assertEqual(self.read_hotels(),
+                         [{"name": "A", "num_rooms": 10, "ubication": "North"},
+                          {"name": "B", "num_rooms": 20,
+                           "ubication": "South"}])
+
+    def test_import_jsonl(self):
+        """
+        test_import_jsonl: Tests importing hotels from a JSON Lines file.
+        """
+        file_path = self.write(
+            "hotels.jsonl",
+            '{"name": "A", "num_rooms": 10, "ubication": "North"}\n\n'
+            '{"name": "B", "num_rooms": 20, "ubication": "South"}\n')
+        self.assertEqual(len(importer.import_file("hotels", file_path)), 2)
+        self.assertEqual(len(self.read_hotels()), 2)
+
+    def test_import_invalid_rows(self):
+        """
+        test_import_invalid_rows: Tests that nothing is imported when a
+        row is invalid, and that the command exits with an error.
+        """
+        file_path = self.write("hotels.csv",
+                               "name,num_rooms,ubication\n"
+                               "A,10,North\nB,many,South\n")
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()):
+            with self.assertRaises(SystemExit):
+                importer.main(["hotels", file_path])
+        self.assertFalse(os.path.exists(self.hotels_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
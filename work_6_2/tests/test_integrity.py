@@ -0,0 +1,74 @@
+"""
+This script contains the unit tests for the referential-integrity audit
+of the reservations.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for mocking standard output.
+- `io` for handling input/output operations.
+- `Customer`, `Hotel` and `Reservation` for the booking collections.
+- `integrity` from `booking.reservations` for testing the audit.
+- `support` from `tests` for keeping the collections in memory.
+"""
+import unittest
+import unittest.mock
+import io
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from booking.reservations import integrity
+from tests import support
+
+
+class TestIntegrity(unittest.TestCase):
+    """
+    Class to test the audit of the reservation references.
+    """
+
+    def setUp(self):
+        """
+        setUp: Keeps the collections in memory and creates a reservation
+        of an existing customer and hotel.
+        """
+        support.use_memory(self)
+        Customer.create_customer("C1", "Name", "555")
+        Hotel.create_hotel("A", 5, "North")
+        self.reservation = Reservation.create_reservation("C1", "A", "1")
+
+    def test_no_problems(self):
+        """
+        test_no_problems: Tests that valid references are not reported.
+        """
+        self.assertEqual(integrity.audit_reservations(), [])
+
+    def test_broken_references(self):
+        """
+        test_broken_references: Tests that reservations of deleted or
+        unknown customers and hotels are reported.
+        """
+        Reservation.repository().insert(
+            {"reservation_code": "X", "customer_id": "C9",
+             "hotel_name": "Z", "room": "1", "active": True})
+        Customer.delete_customer("C1")
+        self.assertEqual(integrity.audit_reservations(), [
+            (self.reservation.reservation_code, "customer_id", "C1"),
+            ("X", "customer_id", "C9"),
+            ("X", "hotel_name", "Z")])
+
+    def test_command(self):
+        """
+        test_command: Tests that the command prints the problems and
+        returns how many it found.
+        """
+        Hotel.delete_hotel("A")
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertEqual(integrity.main([]), 1)
+        output = fake_stdout.getvalue()
+        self.assertIn(f"Reservation {self.reservation.reservation_code}: "
+                      "hotel_name A does not exist", output)
+        self.assertIn("Found 1 broken references", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+This script contains the unit tests for the LogStorage class.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `LogStorage` from `booking.storage.log_storage` for testing the
+   append-only storage engine.
+- `Repository` from `booking.storage.repository` for running
+   mutations against the storage.
+"""
+import unittest
+import json
+import os
+import tempfile
+from booking.storage.log_storage import LogStorage
+from booking.storage.repository import Repository
+
+
+class TestLogStorage(unittest.TestCase):
+    """
+    Class to test the LogStorage class.
+    """
+
+    def setUp(self):
+        """
+        setUp: Creates a repository over a log storage in a temporary
+        data folder.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "hotels.json")
+        self.repository = self.open_repository()
+
+    def tearDown(self):
+        """
+        tearDown: Removes the temporary data folder.
+        """
+        self.temp_dir.cleanup()
+
+    def open_repository(self, compact_every=100):
+        """
+        open_repository: Returns a new repository over the same files,
+        as another process would open them.
+        """
+        storage = LogStorage(self.file_path, compact_every=compact_every)
+        return Repository(self.file_path, "name", storage)
+
+    def read_log(self):
+        """
+        read_log: Returns the operations written to the log file.
+        """
+        with open(self.file_path + ".log", 'r', encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def test_mutations_are_appended(self):
+        """
+        test_mutations_are_appended: Tests that mutations are logged
+        without writing the snapshot.
+        """
+        self.repository.insert({"name": "A", "num_rooms": 10})
+        self.repository.update("A", {"num_rooms": 20})
+        self.repository.update("A", {"active": False}, op="cancel")
+        self.repository.delete("A")
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual([entry["op"] for entry in self.read_log()],
+                         ["create", "update", "cancel", "delete"])
+
+    def test_log_is_replayed_on_load(self):
+        """
+        test_log_is_replayed_on_load: Tests that a new repository sees
+        the snapshot plus the logged operations.
+        """
+        self.repository.insert({"name": "A", "num_rooms": 10})
+        self.repository.insert({"name": "B", "num_rooms": 5})
+        self.repository.update("A", {"num_rooms": 20})
+        self.repository.delete("B")
+        other = self.open_repository()
+        self.assertEqual(other.records(), [{"name": "A", "num_rooms": 20}])
+
+    def test_appends_from_others_are_read_incrementally(self):
+        """
+        test_appends_from_others_are_read_incrementally: Tests that
+        operations logged by another repository are picked up.
+        """
+        self.repository.insert({"name": "A", "num_rooms": 10})
+        other = self.open_repository()
+        self.assertTrue(other.contains("A"))
+        self.repository.insert({"name": "B", "num_rooms": 5})
+        self.assertTrue(other.contains("B"))
+        other.update("A", {"num_rooms": 30})
+        self.assertEqual(self.repository.get("A")["num_rooms"], 30)
+
+    def test_compaction(self):
+        """
+        test_compaction: Tests that the log is folded into the snapshot
+        after `compact_every` operations.
+        """
+        repository = self.open_repository(compact_every=3)
+        for name in ("A", "B", "C"):
+            repository.insert({"name": name, "num_rooms": 1})
+        self.assertFalse(os.path.exists(self.file_path + ".log"))
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            self.assertEqual(len(json.load(file)), 3)
+        repository.delete("A")
+        self.assertEqual(len(self.read_log()), 1)
+        self.assertEqual([r["name"] for r in
+                          self.open_repository().records()], ["B", "C"])
+
+    def test_torn_last_line_is_dropped(self):
+        """
+        test_torn_last_line_is_dropped: Tests that a partially written
+        operation is ignored and truncated.
+        """
+        self.repository.insert({"name": "A", "num_rooms": 10})
+        with open(self.file_path + ".log", 'a', encoding='utf-8') as file:
+            file.write('{"op": "create", "key": "B"')
+        other = self.open_repository()
+        self.assertEqual([r["name"] for r in other.records()], ["A"])
+        other.insert({"name": "C", "num_rooms": 1})
+        self.assertEqual([r["name"] for r in
+                          self.open_repository().records()], ["A", "C"])
+
+    def test_recover_interrupted_compaction(self):
+        """
+        test_recover_interrupted_compaction: Tests that a compaction that
+        crashed before replacing the snapshot keeps the logged operations.
+        """
+        self.repository.insert({"name": "A", "num_rooms": 10})
+        with open(self.file_path + ".compact", 'w', encoding='utf-8') as file:
+            json.dump([{"name": "A", "num_rooms": 10}], file)
+        os.replace(self.file_path + ".log", self.file_path + ".log.old")
+        other = self.open_repository()
+        self.assertEqual(other.records(), [{"name": "A", "num_rooms": 10}])
+        self.assertFalse(os.path.exists(self.file_path + ".compact"))
+        self.assertFalse(os.path.exists(self.file_path + ".log.old"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+This script contains the unit tests for the in-memory storage backend
+and the configurable data folder.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for setting environment variables.
+- `os` for handling file paths.
+- `Customer` from `booking.customers.customer` for running the
+   classmethods in memory.
+- `settings` from `booking` for testing the data folder.
+- `repository` and `memory_storage` from `booking.storage` for testing
+   the backend.
+- `support` from `tests` for the in-memory engine and the temporary
+   data folder.
+"""
+import unittest
+import unittest.mock
+import os
+from booking.customers.customer import Customer
+from booking import settings
+from booking.storage import repository
+from booking.storage.memory_storage import MemoryStorage, clear_memory
+from tests import support
+
+
+class TestMemoryStorage(unittest.TestCase):
+    """
+    Class to test the MemoryStorage class and the data folder settings.
+    """
+
+    def setUp(self):
+        """
+        setUp: Selects the in-memory engine and an empty data folder.
+        """
+        support.use_memory(self)
+        self.temp_dir = support.use_data_folder(self)
+
+    def test_data_folder(self):
+        """
+        test_data_folder: Tests that the collection files follow the
+        configured data folder.
+        """
+        self.assertEqual(Customer.customers_file,
+                         os.path.join(self.temp_dir, "customers.json"))
+        settings.set_data_folder(None)
+        with unittest.mock.patch.dict(os.environ,
+                                      {"BOOKING_DATA_DIR": self.temp_dir}):
+            self.assertEqual(Customer.data_folder, self.temp_dir)
+        self.assertEqual(Customer.data_folder, settings.DEFAULT_DATA_FOLDER)
+
+    def test_installed_data_folder(self):
+        """
+        test_installed_data_folder: Tests that the default data folder is
+        the one of the package in a checkout, and the user data folder
+        when the package has none, as once installed.
+        """
+        self.assertEqual(settings.DEFAULT_DATA_FOLDER,
+                         settings.PACKAGE_DATA_FOLDER)
+        missing = os.path.join(self.temp_dir, "site-packages", "data")
+        with unittest.mock.patch.dict(os.environ,
+                                      {"XDG_DATA_HOME": self.temp_dir}):
+            self.assertEqual(settings.default_data_folder(missing),
+                             os.path.join(self.temp_dir, "booking"))
+
+    def test_no_file_io(self):
+        """
+        test_no_file_io: Tests that the classmethods work without writing
+        to the data folder.
+        """
+        Customer.create_customer("1", "Ana", "555")
+        self.assertTrue(Customer.update_customer("1", "Eva"))
+        self.assertEqual(Customer.load_customers(),
+                         [{"customer_id": "1", "name": "Eva",
+                           "phone_number": "555"}])
+        self.assertIsInstance(Customer.repository().storage, MemoryStorage)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_shared_in_process(self):
+        """
+        test_shared_in_process: Tests that repositories of the same file
+        see each other's writes, and that clearing drops them.
+        """
+        file_path = os.path.join(self.temp_dir, "customers.json")
+        first = repository.Repository(
+            file_path, "customer_id", MemoryStorage(file_path, "customer_id"))
+        second = repository.Repository(
+            file_path, "customer_id", MemoryStorage(file_path, "customer_id"))
+        first.insert({"customer_id": "1"})
+        self.assertTrue(second.contains("1"))
+        clear_memory()
+        self.assertFalse(second.contains("1"))
+
+    def test_writes_apply_operations(self):
+        """
+        test_writes_apply_operations: Tests that writes apply their
+        operations to the stored records, acting on the first record of
+        a key, without taking a snapshot of the collection.
+        """
+        file_path = os.path.join(self.temp_dir, "customers.json")
+        storage = MemoryStorage(file_path, "customer_id")
+
+        def snapshot():
+            raise AssertionError("snapshot taken")
+
+        storage.apply_many([
+            {"op": "create", "key": "1", "record": {"customer_id": "1"}},
+            {"op": "create", "key": "2", "record": {"customer_id": "2"}},
+            {"op": "create", "key": "1",
+             "record": {"customer_id": "1", "name": "Dup"}}], snapshot)
+        version = storage.signature()
+        storage.apply_many([
+            {"op": "update", "key": "1",
+             "record": {"customer_id": "3", "name": "Moved"}},
+            {"op": "delete", "key": "1", "record": None},
+            {"op": "cancel", "key": "3",
+             "record": {"customer_id": "3", "name": "Kept"}}], snapshot)
+        self.assertNotEqual(storage.signature(), version)
+        self.assertEqual(storage.load(), (
+            [{"customer_id": "3", "name": "Kept"}, {"customer_id": "2"}],
+            []))
+
+    def test_using_restores_engine(self):
+        """
+        test_using_restores_engine: Tests that the previous engine is
+        selected again after a block.
+        """
+        with repository.using("json"):
+            self.assertNotIsInstance(Customer.repository().storage,
+                                     MemoryStorage)
+        self.assertIsInstance(Customer.repository().storage, MemoryStorage)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+This script contains the unit tests for the Repository class.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `Repository` and `get_repository` from `booking.storage.repository`
+   for testing the repository layer.
+"""
+import unittest
+import json
+import os
+import tempfile
+from booking.storage.repository import Repository, get_repository
+
+
+class TestRepository(unittest.TestCase):
+    """
+    Class to test the Repository class.
+    """
+
+    def setUp(self):
+        """
+        setUp: Creates a repository over a temporary JSON file.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "customers.json")
+        self.repository = Repository(self.file_path, "customer_id")
+
+    def tearDown(self):
+        """
+        tearDown: Removes the temporary data folder.
+        """
+        self.temp_dir.cleanup()
+
+    def write_file(self, records):
+        """
+        write_file: Writes records to the JSON file, as another process
+        would.
+        """
+        with open(self.file_path, 'w', encoding='utf-8') as file:
+            json.dump(records, file)
+
+    def test_missing_file_is_empty(self):
+        """
+        test_missing_file_is_empty: Tests that a missing file loads as an
+        empty collection.
+        """
+        self.assertEqual(self.repository.records(), [])
+        self.assertIsNone(self.repository.get("1"))
+
+    def test_insert_and_get(self):
+        """
+        test_insert_and_get: Tests that inserted records are saved and
+        served by key.
+        """
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+        self.assertEqual(self.repository.get("1")["name"], "Ana")
+        self.assertTrue(self.repository.contains("1"))
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file),
+                             [{"customer_id": "1", "name": "Ana"}])
+
+    def test_duplicate_keys_act_on_first_record(self):
+        """
+        test_duplicate_keys_act_on_first_record: Tests that records
+        sharing a key are kept in order and the first one is used.
+        """
+        self.repository.insert({"customer_id": "1", "name": "First"})
+        self.repository.insert({"customer_id": "2", "name": "Other"})
+        self.repository.insert({"customer_id": "1", "name": "Second"})
+        self.assertEqual(self.repository.get("1")["name"], "First")
+        self.assertTrue(self.repository.delete("1"))
+        self.assertEqual(self.repository.get("1")["name"], "Second")
+        self.assertEqual([r["name"] for r in self.repository.records()],
+                         ["Other", "Second"])
+
+    def test_update_and_delete_missing_key(self):
+        """
+        test_update_and_delete_missing_key: Tests that mutations of a
+        missing key report False.
+        """
+        self.assertFalse(self.repository.update("1", {"name": "Ana"}))
+        self.assertFalse(self.repository.delete("1"))
+
+    def test_update_key_field(self):
+        """
+        test_update_key_field: Tests that changing the key field moves
+        the record to the new key.
+        """
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+        self.assertTrue(self.repository.update("1", {"customer_id": "9"}))
+        self.assertIsNone(self.repository.get("1"))
+        self.assertEqual(self.repository.get("9")["name"], "Ana")
+
+    def test_returned_records_are_copies(self):
+        """
+        test_returned_records_are_copies: Tests that callers cannot
+        change the indexed records by mutating returned ones.
+        """
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+        self.repository.get("1")["name"] = "Changed"
+        self.repository.records()[0]["name"] = "Changed"
+        self.assertEqual(self.repository.get("1")["name"], "Ana")
+
+    def test_reloads_when_file_changes(self):
+        """
+        test_reloads_when_file_changes: Tests that the repository is
+        invalidated when the file is rewritten by someone else.
+        """
+        self.repository.insert({"customer_id": "1", "name": "Ana"})
+        self.write_file([{"customer_id": "2", "name": "Luis"},
+                         {"customer_id": "3", "name": "Eva"}])
+        self.assertIsNone(self.repository.get("1"))
+        self.assertEqual(self.repository.get("3")["name"], "Eva")
+
+    def test_get_repository_is_shared(self):
+        """
+        test_get_repository_is_shared: Tests that the same file is served
+        by a single repository.
+        """
+        first = get_repository(self.file_path, "customer_id")
+        second = get_repository(
+            os.path.join(self.temp_dir.name, ".", "customers.json"),
+            "customer_id")
+        self.assertIs(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,14 +4,20 @@ This script contains the unit tests for the Reservation class.
 It utilizes the following modules:
 - `unittest` for running the tests.
 - `unittest.mock` for mocking standard output.
-- `json` for encoding and decoding JSON data.
+- `io` for handling input/output operations.
+- `Customer` and `Hotel` for the customers and hotels of the
+   reservations.
+- `support` from `tests` for keeping the collections in memory.
 - `Reservation` from `booking.reservations.reservation` for
    testing the Reservation class.
 """
 import unittest
 import unittest.mock
-import json
+import io
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
 from booking.reservations.reservation import Reservation
+from tests import support
 
 
 class TestReservation(unittest.TestCase):
@@ -21,8 +27,13 @@ class TestReservation(unittest.TestCase):
 
     def setUp(self):
         """
-        setUp: Initializes a new Reservation object for each test.
+        setUp: Initializes a new Reservation object for each test,
+        with the collections kept in memory.
         """
+        support.use_memory(self)
+        Customer.create_customer("123", "Name", "555")
+        Customer.create_customer("456", "Name", "555")
+        Hotel.create_hotel("Test Hotel", 10, "North")
         self.reservation = Reservation("123", "Test Hotel", "Test Room")
 
     def test_reservation_initialization(self):
@@ -49,6 +60,17 @@ class TestReservation(unittest.TestCase):
         }
         self.assertEqual(self.reservation.to_dict(), expected_dict)
 
+    def test_from_dict(self):
+        """
+        test_from_dict: Tests that a Reservation object is rebuilt from
+        its dictionary with the same code, status and dates.
+        """
+        record = dict(self.reservation.to_dict(), active=False,
+                      check_in="2024-05-01", check_out="2024-05-03")
+        reservation = Reservation.from_dict(record)
+        self.assertEqual(reservation.to_dict(), record)
+        self.assertFalse(hasattr(reservation, "__dict__"))
+
     def test_load_reservations(self):
         """
         test_load_reservations: Tests the load_reservations method of
@@ -63,10 +85,7 @@ class TestReservation(unittest.TestCase):
         object.
         """
         self.reservation.save_to_json()
-        with open(Reservation.reservations_file,
-                  'r',
-                  encoding='utf-8') as file:
-            reservations = json.load(file)
+        reservations, _ = Reservation.repository().storage.load()
         self.assertIn(self.reservation.to_dict(), reservations)
         Reservation.delete_reservation(self.reservation.reservation_code)
 
@@ -127,6 +146,69 @@ class TestReservation(unittest.TestCase):
             invalid_room)
         self.assertIsNone(invalid_reservation)
 
+    def test_create_reservation_unknown_references(self):
+        """
+        test_create_reservation_unknown_references: Tests that
+        create_reservation rejects a customer or a hotel that does not
+        exist, and that a deleted customer is no longer accepted.
+        """
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertIsNone(Reservation.create_reservation(
+                "999", "Test Hotel", "2B"))
+            self.assertIsNone(Reservation.create_reservation(
+                "123", "Unknown Hotel", "2B"))
+            Customer.delete_customer("456")
+            self.assertIsNone(Reservation.create_reservation(
+                "456", "Test Hotel", "2B"))
+        output = fake_stdout.getvalue()
+        self.assertIn("customer 999 does not exist", output)
+        self.assertIn("hotel Unknown Hotel does not exist", output)
+        self.assertIn("customer 456 does not exist", output)
+        self.assertEqual(Reservation.load_reservations(), [])
+
+    def test_create_reservation_unchecked_references(self):
+        """
+        test_create_reservation_unchecked_references: Tests that the
+        references are not checked when check_references is off.
+        """
+        with unittest.mock.patch.object(Reservation, "check_references",
+                                        False):
+            reservation = Reservation.create_reservation(
+                "999", "Unknown Hotel", "2B")
+        self.assertIsNotNone(reservation)
+
+    def test_create_many_affirmative(self):
+        """
+        test_create_many_affirmative: Tests the create_many method of the
+        Reservation class.
+        """
+        rows = [{"customer_id": "123", "hotel_name": "Test Hotel",
+                 "room": "Bulk 1"},
+                {"customer_id": "456", "hotel_name": "Test Hotel",
+                 "room": "Bulk 2"}]
+        created = Reservation.create_many(rows)
+        reservations = Reservation.load_reservations()
+        self.assertEqual(len(created), 2)
+        for reservation in created:
+            self.assertIn(reservation.to_dict(), reservations)
+            Reservation.delete_reservation(reservation.reservation_code)
+
+    def test_create_many_invalid_row(self):
+        """
+        test_create_many_invalid_row: Tests that create_many saves nothing
+        when a row is invalid.
+        """
+        count = len(Reservation.load_reservations())
+        rows = [{"customer_id": "123", "hotel_name": "Test Hotel",
+                 "room": "Bulk 1"},
+                {"customer_id": "456", "hotel_name": "Test Hotel"}]
+        with unittest.mock.patch('sys.stdout',
+                                 new=io.StringIO()) as fake_stdout:
+            self.assertIsNone(Reservation.create_many(rows))
+            self.assertIn("row 2", fake_stdout.getvalue())
+        self.assertEqual(len(Reservation.load_reservations()), count)
+
     def test_cancel_reservation_affirmative(self):
         """
         test_cancel_reservation_affirmative: Tests the cancel_reservation
@@ -0,0 +1,98 @@
+"""
+This script contains the unit tests for the time-ordered reservation
+codes and the queries by creation time.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for fixing the current time.
+- `datetime` for the creation times.
+- `uuid` for the random codes of older reservations.
+- `Customer`, `Hotel` and `Reservation` for the booking collections.
+- `codes` from `booking.reservations` for testing the codes.
+- `support` from `tests` for keeping the collections in memory.
+"""
+import unittest
+import unittest.mock
+import datetime
+import uuid
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from booking.reservations import codes
+from tests import support
+
+UTC = datetime.timezone.utc
+
+
+class TestReservationCodes(unittest.TestCase):
+    """
+    Class to test the time-ordered reservation codes.
+    """
+
+    def setUp(self):
+        """
+        setUp: Keeps the collections in memory with a customer and a
+        hotel, and lets the codes start again from any time.
+        """
+        support.use_memory(self)
+        support.enter_context(self, unittest.mock.patch.object(
+            codes, "_clock", {"millisecond": 0, "counter": 0}))
+        Customer.create_customer("C1", "Name", "555")
+        Hotel.create_hotel("A", 10, "North")
+
+    def create_at(self, moment, room):
+        """
+        create_at: Creates a reservation as if it were a given datetime.
+        """
+        nanoseconds = int(moment.timestamp()) * 1_000_000_000
+        with unittest.mock.patch.object(codes.time, "time_ns",
+                                        return_value=nanoseconds):
+            return Reservation.create_reservation("C1", "A", room)
+
+    def test_codes_are_ordered_and_unique(self):
+        """
+        test_codes_are_ordered_and_unique: Tests that codes created in
+        the same millisecond still sort in creation order.
+        """
+        with unittest.mock.patch.object(codes.time, "time_ns",
+                                        return_value=10 ** 18):
+            created = [codes.new_code() for _ in range(5000)]
+        self.assertEqual(created, sorted(created))
+        self.assertEqual(len(set(created)), len(created))
+        self.assertTrue(all(uuid.UUID(code).version == 7
+                            for code in created))
+
+    def test_code_time(self):
+        """
+        test_code_time: Tests reading the creation time of a code.
+        """
+        moment = datetime.datetime(2030, 1, 2, 3, 4, 5, tzinfo=UTC)
+        reservation = self.create_at(moment, "1")
+        self.assertEqual(codes.code_time(reservation.reservation_code),
+                         moment)
+        self.assertIsNone(codes.code_time(str(uuid.uuid4())))
+        self.assertIsNone(codes.code_time(None))
+
+    def test_created_between(self):
+        """
+        test_created_between: Tests the reservations created in a time
+        range, ignoring those with random codes.
+        """
+        days = [datetime.datetime(2030, 1, day, tzinfo=UTC)
+                for day in range(1, 5)]
+        created = [self.create_at(day, str(number))
+                   for number, day in enumerate(days)]
+        Reservation.repository().insert(
+            {"reservation_code": str(uuid.uuid4()), "customer_id": "C1",
+             "hotel_name": "A", "room": "9", "active": True})
+        found = Reservation.created_between(days[1], days[3])
+        self.assertEqual([record["reservation_code"] for record in found],
+                         [created[1].reservation_code,
+                          created[2].reservation_code])
+        self.assertEqual(len(Reservation.created_between()), 4)
+        Reservation.delete_reservation(created[2].reservation_code)
+        self.assertEqual(len(Reservation.created_between(days[1])), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
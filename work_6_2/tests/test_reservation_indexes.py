@@ -0,0 +1,143 @@
+"""
+This script contains the unit tests for the secondary indexes of the
+reservations.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `json` for encoding and decoding JSON data.
+- `Reservation` from `booking.reservations.reservation` for testing the
+   queries.
+- `FieldIndex` from `booking.storage.field_index` for building an index
+   after the changes and testing it on its own.
+- `support` from `tests` for the temporary data folder and the
+   seeded customers and hotels.
+"""
+import unittest
+import json
+from booking.reservations.reservation import Reservation
+from booking.storage.field_index import FieldIndex
+from tests import support
+
+
+class TestReservationIndexes(unittest.TestCase):
+    """
+    Class to test the queries of reservations by customer and hotel.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the collections to a temporary data folder and
+        creates three reservations.
+        """
+        support.use_data_folder(self)
+        self.reservations_file = Reservation.reservations_file
+        support.add_customers("C1", "C2")
+        support.add_hotels("A", "B")
+        self.first = Reservation.create_reservation("C1", "A", "1")
+        self.second = Reservation.create_reservation("C1", "B", "1")
+        self.third = Reservation.create_reservation("C2", "A", "2")
+
+    def test_reservations_by_customer(self):
+        """
+        test_reservations_by_customer: Tests finding the reservations of a
+        customer.
+        """
+        self.assertEqual(Reservation.reservation_codes_by_customer("C1"),
+                         [self.first.reservation_code,
+                          self.second.reservation_code])
+        self.assertEqual(Reservation.reservations_by_customer("C2"),
+                         [self.third.to_dict()])
+        self.assertEqual(Reservation.reservations_by_customer("C3"), [])
+
+    def test_reservations_by_hotel(self):
+        """
+        test_reservations_by_hotel: Tests finding the reservations of a
+        hotel.
+        """
+        self.assertEqual(Reservation.reservation_codes_by_hotel("A"),
+                         [self.first.reservation_code,
+                          self.third.reservation_code])
+
+    def test_active_only(self):
+        """
+        test_active_only: Tests that cancelled and deleted reservations
+        leave the active views.
+        """
+        Reservation.cancel_reservation(self.first.reservation_code)
+        Reservation.delete_reservation(self.third.reservation_code)
+        self.assertEqual(Reservation.reservation_codes_by_hotel("A"),
+                         [self.first.reservation_code])
+        self.assertEqual(
+            Reservation.reservation_codes_by_hotel("A", active_only=True), [])
+        self.assertEqual(Reservation.reservation_codes_by_customer(
+            "C1", active_only=True), [self.second.reservation_code])
+        fourth = Reservation.create_reservation("C1", "A", "1")
+        self.assertEqual(Reservation.reservation_codes_by_customer(
+            "C1", active_only=True),
+            [self.second.reservation_code, fourth.reservation_code])
+
+    def test_updates_keep_file_order(self):
+        """
+        test_updates_keep_file_order: Tests that an update does not move
+        a reservation to the end of the results, whether the index was
+        built before or after it.
+        """
+        Reservation.reservation_codes_by_hotel("A")
+        Reservation.cancel_reservation(self.first.reservation_code)
+        expected = [self.first.reservation_code, self.third.reservation_code]
+        self.assertEqual(Reservation.reservation_codes_by_hotel("A"),
+                         expected)
+        self.assertEqual(
+            [reservation["room"]
+             for reservation in Reservation.reservations_by_hotel("A")],
+            [reservation["room"]
+             for reservation in Reservation.load_reservations()
+             if reservation["hotel_name"] == "A"])
+        repository = Reservation.repository()
+        rebuilt = repository.get_index(
+            "rebuilt", lambda: FieldIndex("hotel_name", "reservation_code",
+                                          repository.position))
+        self.assertEqual(rebuilt.lookup("A"), expected)
+
+    def test_external_changes(self):
+        """
+        test_external_changes: Tests that the indexes follow reservations
+        written to the file by another worker.
+        """
+        Reservation.reservation_codes_by_customer("C1")
+        record = {"reservation_code": "X", "customer_id": "C1",
+                  "hotel_name": "A", "room": "9", "active": True}
+        with open(self.reservations_file, 'w', encoding='utf-8') as file:
+            json.dump([record], file)
+        self.assertEqual(Reservation.reservations_by_customer("C1"),
+                         [record])
+
+
+
+class TestFieldIndex(unittest.TestCase):
+    """
+    Class to test the FieldIndex class on its own.
+    """
+
+    def test_remove_from_a_large_value(self):
+        """
+        test_remove_from_a_large_value: Tests that records are removed by
+        position from a value holding many records, keeping the others in
+        file order.
+        """
+        positions = {f"R{number}": number for number in range(1000)}
+        index = FieldIndex("hotel_name", "reservation_code", positions.get)
+        for code in positions:
+            index.add({"reservation_code": code, "hotel_name": "A"})
+        for number in range(0, 1000, 2):
+            index.remove({"reservation_code": f"R{number}",
+                          "hotel_name": "A"})
+        self.assertEqual(index.lookup("A"),
+                         [f"R{number}" for number in range(1, 1000, 2)])
+        for number in range(1, 1000, 2):
+            index.remove({"reservation_code": f"R{number}",
+                          "hotel_name": "A"})
+        self.assertEqual(index.counts(), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+This script contains the unit tests for the compact JSON serialization
+of the stored records.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for hiding the optional JSON libraries.
+- `os` for handling file paths.
+- `tempfile` for creating temporary data folders.
+- `serialization` from `booking.storage` for testing the encoding.
+- `JsonStorage` from `booking.storage.json_storage` for testing the
+   written files.
+"""
+import unittest
+import unittest.mock
+import os
+import tempfile
+from booking.storage import serialization
+from booking.storage.json_storage import JsonStorage
+
+RECORDS = [{"name": "Hôtel A", "num_rooms": 10, "active": True,
+            "check_in": None}]
+
+
+class TestSerialization(unittest.TestCase):
+    """
+    Class to test the compact JSON serialization.
+    """
+
+    def test_round_trip(self):
+        """
+        test_round_trip: Tests that records are encoded compactly and
+        decoded back, with and without the optional libraries.
+        """
+        for hidden in (False, True):
+            modules = {"orjson": None, "msgspec": None} if hidden else {
+                "orjson": serialization.orjson,
+                "msgspec": serialization.msgspec}
+            with unittest.mock.patch.multiple(serialization, **modules):
+                data = serialization.dumps(RECORDS)
+                self.assertIsInstance(data, bytes)
+                self.assertNotIn(b"\n", data)
+                self.assertNotIn(b", ", data)
+                self.assertEqual(serialization.loads(data), RECORDS)
+                self.assertEqual(serialization.loads(data.decode("utf-8")),
+                                 RECORDS)
+
+    def test_library_fallback(self):
+        """
+        test_library_fallback: Tests that the standard library is used
+        when no faster library is installed.
+        """
+        with unittest.mock.patch.multiple(serialization, orjson=None,
+                                          msgspec=None):
+            self.assertEqual(serialization.library(), "json")
+
+    def test_invalid_data(self):
+        """
+        test_invalid_data: Tests that invalid JSON raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            serialization.loads(b"[{")
+
+    def test_indented_file(self):
+        """
+        test_indented_file: Tests that the JSON storage writes compact
+        files unless an indent is configured.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "hotels.json")
+            JsonStorage(file_path, "name").write_snapshot(RECORDS)
+            with open(file_path, 'rb') as file:
+                self.assertEqual(file.read(), serialization.dumps(RECORDS))
+            storage = JsonStorage(file_path, "name", indent=4)
+            storage.write_snapshot(RECORDS)
+            with open(file_path, 'rb') as file:
+                self.assertIn(b'\n    {\n        "name"', file.read())
+            self.assertEqual(storage.read_snapshot(), RECORDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
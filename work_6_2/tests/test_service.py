@@ -0,0 +1,132 @@
+"""
+This script contains the unit tests for the BookingService class.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for counting storage writes and mocking failures.
+- `asyncio` for running the coroutines.
+- `io` for handling input/output operations.
+- `Customer`, `Hotel` and `Reservation` for the booking collections.
+- `BookingService` from `booking.service` for testing the service.
+- `run_load` from `booking.service_load` for running the load generator.
+- `support` from `tests` for the temporary data folder.
+"""
+import unittest
+import unittest.mock
+import asyncio
+import io
+from booking.customers.customer import Customer
+from booking.hotels.hotel import Hotel
+from booking.reservations.reservation import Reservation
+from booking.service import BookingService
+from booking.service_load import run_load
+from tests import support
+
+
+class TestBookingService(unittest.TestCase):
+    """
+    Class to test the asyncio booking service.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the collections to a temporary data folder.
+        """
+        support.use_data_folder(self)
+
+    def test_concurrent_mutations_share_a_write(self):
+        """
+        test_concurrent_mutations_share_a_write: Tests that mutations
+        requested in the same tick are saved with one write.
+        """
+        async def create_customers():
+            async with BookingService() as service:
+                customers = await asyncio.gather(*(
+                    service.create_customer(str(number), "Name", "555")
+                    for number in range(20)))
+                return customers, service.batches
+
+        storage = Customer.repository().storage
+        with unittest.mock.patch.object(
+                storage, "apply_many", wraps=storage.apply_many) as writes:
+            customers, batches = asyncio.run(create_customers())
+        self.assertEqual(len(customers), 20)
+        self.assertEqual(batches, 1)
+        self.assertEqual(writes.call_count, 1)
+        self.assertEqual(len(Customer.load_customers()), 20)
+
+    def test_batched_reservations_are_checked(self):
+        """
+        test_batched_reservations_are_checked: Tests that reservations of
+        one batch see each other when checking availability.
+        """
+        async def reserve():
+            async with BookingService() as service:
+                await service.create_hotel("A", 5, "North")
+                await asyncio.gather(
+                    service.create_customer("C1", "Name", "555"),
+                    service.create_customer("C2", "Name", "555"))
+                first, second = await asyncio.gather(
+                    service.create_reservation("C1", "A", "1"),
+                    service.create_reservation("C2", "A", "1"))
+                free = await service.free_rooms("A")
+                return first, second, free
+
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as output:
+            first, second, free = asyncio.run(reserve())
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertIn("already reserved", output.getvalue())
+        self.assertEqual(free, 4)
+
+    def test_failing_call_keeps_the_others(self):
+        """
+        test_failing_call_keeps_the_others: Tests that an exception of a
+        call reaches its caller only.
+        """
+        async def mutate():
+            async with BookingService() as service:
+                return await asyncio.gather(
+                    service.create_hotel("A", 5, "North"),
+                    service.update_hotel("A", new_num_rooms={}),
+                    service.create_hotel("B", 5, "South"),
+                    return_exceptions=True)
+
+        with unittest.mock.patch.object(
+                Hotel, "update_hotel", side_effect=RuntimeError("failed")):
+            results = asyncio.run(mutate())
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual([hotel["name"] for hotel in Hotel.load_hotels()],
+                         ["A", "B"])
+
+    def test_exit_waits_for_queued_batches(self):
+        """
+        test_exit_waits_for_queued_batches: Tests that leaving the service
+        saves a batch whose caller stopped waiting for it.
+        """
+        async def abandon():
+            async with BookingService() as service:
+                task = asyncio.create_task(
+                    service.create_customer("C1", "Name", "555"))
+                await asyncio.sleep(0)
+                task.cancel()
+            return service
+
+        service = asyncio.run(abandon())
+        self.assertEqual(service.batches, 1)
+        self.assertIsNotNone(Customer.repository().get("C1"))
+
+    def test_load_generator(self):
+        """
+        test_load_generator: Tests that the load generator runs every
+        operation of its clients.
+        """
+        operations, elapsed, batches = asyncio.run(run_load(10, 3))
+        self.assertEqual(operations, 70)
+        self.assertGreater(elapsed, 0)
+        self.assertLess(batches, 10 + 10 * 3)
+        self.assertEqual(len(Reservation.load_reservations()), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+This script contains the unit tests for the sharded storage of the
+reservations.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for storing the reservations in shards and counting
+   storage writes and lookups.
+- `io` for handling input/output operations.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `Reservation` from `booking.reservations.reservation` for storing
+   reservations in shards.
+- `get_repository` from `booking.storage.repository` for the single-file
+   collection.
+- `sharding` from `booking.storage` for testing the sharded layout.
+- `support` from `tests` for the temporary data folder and the
+   seeded customers and hotels.
+"""
+import unittest
+import unittest.mock
+import io
+import json
+import os
+from booking.reservations.reservation import Reservation
+from booking.storage.repository import get_repository
+from booking.storage import sharding
+from tests import support
+
+
+class TestSharding(unittest.TestCase):
+    """
+    Class to test the reservations stored in one shard per hotel.
+    """
+
+    def setUp(self):
+        """
+        setUp: Points the collections to a temporary data folder and
+        stores the reservations in shards.
+        """
+        self.folder = support.use_data_folder(self)
+        self.reservations_file = Reservation.reservations_file
+        support.enter_context(
+            self, unittest.mock.patch.object(Reservation, "sharded", True))
+        support.add_customers("C1", "C2", "C3")
+        support.add_hotels("A", "B")
+        self.repository = Reservation.repository()
+
+    def read_manifest(self):
+        """
+        read_manifest: Returns the entries of the manifest.
+        """
+        path = os.path.join(self.folder, "reservations", "manifest.json")
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def test_one_shard_per_hotel(self):
+        """
+        test_one_shard_per_hotel: Tests that the reservations of each
+        hotel are written to their own shard, listed in the manifest.
+        """
+        first = Reservation.create_reservation("C1", "A", "1")
+        second = Reservation.create_reservation("C1", "B", "1")
+        self.assertFalse(os.path.exists(self.reservations_file))
+        self.assertEqual([entry["value"] for entry in self.read_manifest()],
+                         ["A", "B"])
+        self.assertEqual(self.repository.shard("A").records(),
+                         [first.to_dict()])
+        self.assertEqual(Reservation.load_reservations(),
+                         [first.to_dict(), second.to_dict()])
+        self.assertEqual(Reservation.reservation_codes_by_customer("C1"),
+                         [first.reservation_code, second.reservation_code])
+        self.assertFalse(Reservation.is_room_available("B", "1"))
+
+    def test_writes_touch_one_shard(self):
+        """
+        test_writes_touch_one_shard: Tests that a write for one hotel does
+        not rewrite the shard of another.
+        """
+        Reservation.create_reservation("C1", "A", "1")
+        reservation = Reservation.create_reservation("C1", "B", "1")
+        storage = self.repository.shard("A").storage
+        with unittest.mock.patch.object(
+                storage, "apply_many", wraps=storage.apply_many) as writes:
+            Reservation.create_reservation("C2", "B", "2")
+            Reservation.cancel_reservation(reservation.reservation_code)
+        self.assertEqual(writes.call_count, 0)
+        self.assertFalse(self.repository.shard("B").get(
+            reservation.reservation_code)["active"])
+
+    def test_lookups_by_code_open_one_shard(self):
+        """
+        test_lookups_by_code_open_one_shard: Tests that once a code is
+        located, its mutations do not search the other shards, and that
+        unknown codes are still found by searching them.
+        """
+        Reservation.create_reservation("C1", "A", "1")
+        reservation = Reservation.create_reservation("C1", "B", "1")
+        shard = self.repository.shard("A")
+        with unittest.mock.patch.object(
+                shard, "contains", wraps=shard.contains) as lookups:
+            self.assertTrue(Reservation.cancel_reservation(
+                reservation.reservation_code))
+            self.assertTrue(Reservation.delete_reservation(
+                reservation.reservation_code))
+        self.assertEqual(lookups.call_count, 0)
+        first = Reservation.create_reservation("C2", "A", "2")
+        fresh = sharding.ShardedRepository(self.reservations_file,
+                                           "reservation_code", "hotel_name")
+        self.assertEqual(fresh.get(first.reservation_code)["room"], "2")
+        self.assertIsNone(fresh.get("unknown"))
+
+    def test_create_many(self):
+        """
+        test_create_many: Tests that a bulk creation writes each shard
+        once and is checked against every shard.
+        """
+        rows = [{"customer_id": "C1", "hotel_name": "A", "room": "1"},
+                {"customer_id": "C2", "hotel_name": "B", "room": "1"},
+                {"customer_id": "C3", "hotel_name": "A", "room": "2"}]
+        self.assertEqual(len(Reservation.create_many(rows)), 3)
+        self.assertEqual(len(self.repository.shard("A").records()), 2)
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()):
+            self.assertIsNone(Reservation.create_many(rows[1:2]))
+        self.assertEqual(len(Reservation.load_reservations()), 3)
+
+    def test_shard_collection(self):
+        """
+        test_shard_collection: Tests copying a single-file collection to
+        its shards.
+        """
+        records = [{"reservation_code": str(number), "customer_id": "C1",
+                    "hotel_name": "A" if number % 2 else "B",
+                    "room": str(number), "active": True}
+                   for number in range(4)]
+        get_repository(self.reservations_file,
+                       "reservation_code").insert_many(records)
+        with unittest.mock.patch('sys.stdout', new=io.StringIO()) as output:
+            sharding.main([self.reservations_file, "reservation_code",
+                           "hotel_name"])
+        self.assertIn("Sharded 4 records", output.getvalue())
+        self.assertEqual(self.repository.values(), ["B", "A"])
+        self.assertEqual(sorted(Reservation.reservation_codes_by_hotel("A")),
+                         ["1", "3"])
+        self.assertEqual(self.repository.get("2")["hotel_name"], "B")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+This script contains the unit tests for the SqliteStorage class and the
+JSON to SQLite migration.
+
+It utilizes the following modules:
+- `unittest` for running the tests.
+- `unittest.mock` for pointing the Customer class to a temporary file.
+- `json` for encoding and decoding JSON data.
+- `os` for handling file paths.
+- `sqlite3` for inspecting the database.
+- `tempfile` for creating temporary data folders.
+- `Customer` from `booking.customers.customer` for running the
+   classmethods against the SQLite backend.
+- `repository`, `sqlite_storage` and `migrate` from `booking.storage`
+   for testing the backend.
+"""
+import unittest
+import unittest.mock
+import json
+import os
+import sqlite3
+import tempfile
+from booking.customers.customer import Customer
+from booking.storage import repository
+from booking.storage.migrate import migrate
+from booking.storage.sqlite_storage import SqliteStorage, close_connections
+
+
+class TestSqliteStorage(unittest.TestCase):
+    """
+    Class to test the SqliteStorage class.
+    """
+
+    def setUp(self):
+        """
+        setUp: Selects the SQLite engine and points the customers to a
+        temporary data folder.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.customers_file = os.path.join(self.temp_dir.name,
+                                           "customers.json")
+        self.database = os.path.join(self.temp_dir.name, "booking.sqlite3")
+        repository.configure("sqlite")
+        patcher = unittest.mock.patch.object(Customer, "customers_file",
+                                             self.customers_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        tearDown: Restores the JSON engine and removes the data folder.
+        """
+        repository.configure()
+        close_connections()
+        self.temp_dir.cleanup()
+
+    def query(self, sql, parameters=()):
+        """
+        query: Runs a query on a separate connection to the database.
+        """
+        connection = sqlite3.connect(self.database)
+        try:
+            with connection:
+                return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def test_classmethods_run_against_sqlite(self):
+        """
+        test_classmethods_run_against_sqlite: Tests that the Customer
+        classmethods work unchanged on the SQLite backend.
+        """
+        Customer.create_customer("1", "Ana", "555-0001")
+        Customer.create_customer("2", "Luis", "555-0002")
+        self.assertTrue(Customer.update_customer("1", new_name="Ana Maria"))
+        self.assertTrue(Customer.delete_customer("2"))
+        self.assertFalse(os.path.exists(self.customers_file))
+        rows = self.query("SELECT key, record FROM customers ORDER BY row")
+        self.assertEqual([(key, json.loads(record)) for key, record in rows],
+                         [("1", {"customer_id": "1", "name": "Ana Maria",
+                                 "phone_number": "555-0001"})])
+        self.assertEqual(Customer.load_customers(),
+                         [{"customer_id": "1", "name": "Ana Maria",
+                           "phone_number": "555-0001"}])
+
+    def test_wal_mode(self):
+        """
+        test_wal_mode: Tests that the database uses write-ahead logging.
+        """
+        Customer.create_customer("1", "Ana", "555-0001")
+        self.assertEqual(self.query("PRAGMA journal_mode"), [("wal",)])
+
+    def test_changes_from_other_connections_are_seen(self):
+        """
+        test_changes_from_other_connections_are_seen: Tests that a
+        repository reloads after another process writes the table.
+        """
+        Customer.create_customer("1", "Ana", "555-0001")
+        self.assertFalse(Customer.repository().contains("2"))
+        self.query("INSERT INTO customers (key, record) VALUES (?, ?)",
+                   ("2", json.dumps({"customer_id": "2", "name": "Luis",
+                                     "phone_number": "555-0002"})))
+        self.query("UPDATE collection_versions SET version = version + 1 "
+                   "WHERE name = 'customers'")
+        self.assertTrue(Customer.repository().contains("2"))
+
+    def test_failed_write_releases_the_database(self):
+        """
+        test_failed_write_releases_the_database: Tests that a write failing
+        with a non-SQLite error is rolled back, so later writes to any
+        collection of the database still work.
+        """
+        Customer.create_customer("1", "Ana", "555-0001")
+        with self.assertRaises(TypeError):
+            Customer.update_customer("1", new_phone_number={5})
+        Customer.create_customer("2", "Luis", "555-0002")
+        self.assertEqual(self.query("SELECT key FROM customers ORDER BY row"),
+                         [("1",), ("2",)])
+
+    def test_storages_sharing_the_connection_see_each_other(self):
+        """
+        test_storages_sharing_the_connection_see_each_other: Tests that two
+        repositories of the same table in one process see each other's
+        writes, although they share the database connection.
+        """
+        first = repository.Repository(
+            self.customers_file, "customer_id",
+            SqliteStorage(self.customers_file, "customer_id"))
+        second = repository.Repository(
+            self.customers_file, "customer_id",
+            SqliteStorage(self.customers_file, "customer_id"))
+        self.assertEqual(first.records(), [])
+        second.insert({"customer_id": "1", "name": "Ana",
+                       "phone_number": "555-0001"})
+        self.assertTrue(first.contains("1"))
+        first.delete("1")
+        self.assertFalse(second.contains("1"))
+
+    def test_migrate_json_files(self):
+        """
+        test_migrate_json_files: Tests that the migration copies every
+        JSON collection of a data folder and can be run again.
+        """
+        hotels = [{"name": "A", "num_rooms": 10, "ubication": "X"},
+                  {"name": "B", "num_rooms": 5, "ubication": "Y"}]
+        with open(os.path.join(self.temp_dir.name, "hotels.json"), 'w',
+                  encoding='utf-8') as file:
+            json.dump(hotels, file)
+        self.assertEqual(migrate(self.temp_dir.name), {"hotels.json": 2})
+        self.assertEqual(migrate(self.temp_dir.name), {"hotels.json": 2})
+        storage = SqliteStorage(os.path.join(self.temp_dir.name,
+                                             "hotels.json"), "name")
+        self.assertEqual(storage.load(), (hotels, []))
+
+
+if __name__ == '__main__':
+    unittest.main()